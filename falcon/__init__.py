@@ -30,10 +30,13 @@ DEFAULT_MEDIA_TYPE = 'application/json; charset=utf-8'
 # Hoist classes and functions into the falcon namespace
 from falcon.version import __version__  # NOQA
 from falcon.api import API, DEFAULT_MEDIA_TYPE  # NOQA
+from falcon.api_helpers import CachingErrorSerializer  # NOQA
 from falcon.status_codes import *  # NOQA
 from falcon.errors import *  # NOQA
 from falcon.http_error import HTTPError  # NOQA
 from falcon.util import *  # NOQA
 from falcon.hooks import before, after  # NOQA
 from falcon.request import Request, RequestOptions  # NOQA
-from falcon.response import Response  # NOQA
+from falcon.response import Response, ResponseOptions  # NOQA
+from falcon.response_helpers import HeaderSet, coalesce_stream  # NOQA
+from falcon.static import StaticResource  # NOQA
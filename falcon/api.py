@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
 
+import six
+
 from falcon import api_helpers as helpers
 from falcon import DEFAULT_MEDIA_TYPE
+from falcon import hooks
 from falcon.http_error import HTTPError
 from falcon.request import Request, RequestOptions
-from falcon.response import Response
+from falcon.response import Response, ResponseOptions
+from falcon import response_helpers
 import falcon.responders
 from falcon import routing
+from falcon import util
+from falcon.static import StaticResource
 import falcon.status_codes as status
 
 
@@ -106,12 +113,23 @@ class API(object):
                     mob2.process_response
                 mob3.process_response
 
+            A *process_request* method may also short-circuit the stack by
+            setting ``resp.complete`` to ``True``, after filling in the
+            response itself. In that case, the remaining *process_request*
+            methods and the responder are skipped, and the framework begins
+            unwinding the stack, starting with the component that completed
+            the response.
+
             Finally, if one of the *process_response* methods raises an error,
             or the routed on_* responder method itself raises an error, the
             exception will be handled in a similar manner as above. Then,
             the framework will execute any remaining middleware on the
             stack.
 
+            Components that only apply to some routes may be passed to
+            ``add_route`` instead, so that requests for other routes
+            do not incur their overhead.
+
         request_type (Request, optional): Request-alike class to use instead
             of Falcon's default class. Useful if you wish to extend
             ``falcon.request.Request`` with a custom ``context_type``.
@@ -123,6 +141,8 @@ class API(object):
     Attributes:
         req_options (RequestOptions): A set of behavioral options related to
             incoming requests.
+        resp_options (ResponseOptions): A set of behavioral options related
+            to outgoing responses.
     """
 
     # PERF(kgriffs): Reference via self since that is faster than
@@ -134,11 +154,11 @@ class API(object):
         status.HTTP_304
     ])
 
-    _STREAM_BLOCK_SIZE = 8 * 1024  # 8 KiB
-
     __slots__ = ('_after', '_before', '_request_type', '_response_type',
-                 '_error_handlers', '_media_type', '_routes', '_sinks',
-                 '_serialize_error', 'req_options', '_middleware')
+                 '_error_handlers', '_error_handler_cache', '_media_type',
+                 '_routes', '_sinks',
+                 '_serialize_error', 'req_options', 'resp_options',
+                 '_middleware', '_middleware_phases', '_not_found')
 
     def __init__(self, media_type=DEFAULT_MEDIA_TYPE, before=None, after=None,
                  request_type=Request, response_type=Response,
@@ -147,18 +167,26 @@ class API(object):
         self._sinks = []
         self._media_type = media_type
 
-        self._before = helpers.prepare_global_hooks(before)
-        self._after = helpers.prepare_global_hooks(after)
+        self._before = helpers.prepare_global_hooks(before,
+                                                    hooks._adapt_before)
+        self._after = helpers.prepare_global_hooks(after, hooks._adapt_after)
 
         # set middleware
         self._middleware = helpers.prepare_middleware(middleware)
+        self._middleware_phases = helpers.prepare_middleware_phases(
+            self._middleware)
 
         self._request_type = request_type
         self._response_type = response_type
 
-        self._error_handlers = []
+        self._error_handlers = {}
+        self._error_handler_cache = {}
         self._serialize_error = helpers.default_serialize_error
         self.req_options = RequestOptions()
+        self.resp_options = ResponseOptions()
+
+        self._not_found = self._compile_pipeline(
+            falcon.responders.path_not_found)
 
     def __call__(self, env, start_response):
         """WSGI `app` method.
@@ -178,8 +206,6 @@ class API(object):
 
         req = self._request_type(env, options=self.req_options)
         resp = self._response_type()
-        resource = None
-        middleware_stack = []  # Keep track of executed components
 
         try:
             # NOTE(warsaw): Moved this to inside the try except because it's
@@ -188,52 +214,14 @@ class API(object):
             # requested next-hop child resource.  In that case, the object
             # being asked to dispatch to its child will raise an HTTP
             # exception signalling the problem, e.g. a 404.
-            responder, params, resource = self._get_responder(req)
-
-            # NOTE(kgriffs): Using an inner try..except in order to
-            # address the case when err_handler raises HTTPError.
-
-            # NOTE(kgriffs): Coverage is giving false negatives,
-            # so disabled on relevant lines. All paths are tested
-            # afaict.
-            try:
-                self._call_req_mw(middleware_stack, req, resp, params)
-                responder(req, resp, **params)
-                self._call_resp_mw(middleware_stack, req, resp)
-
-            except Exception as ex:
-                for err_type, err_handler in self._error_handlers:
-                    if isinstance(ex, err_type):
-                        err_handler(ex, req, resp, params)
-                        self._call_after_hooks(req, resp, resource)
-                        self._call_resp_mw(middleware_stack, req, resp)
-
-                        # NOTE(kgriffs): The following line is not
-                        # reported to be covered under Python 3.4 for
-                        # some reason, although coverage was manually
-                        # verified using PDB.
-                        break  # pragma nocover
-
-                else:
-                    # PERF(kgriffs): This will propagate HTTPError to
-                    # the handler below. It makes handling HTTPError
-                    # less efficient, but that is OK since error cases
-                    # don't need to be as fast as the happy path, and
-                    # indeed, should perhaps be slower to create
-                    # backpressure on clients that are issuing bad
-                    # requests.
-
-                    # NOTE(ealogar): This will executed remaining
-                    # process_response when no error_handler is given
-                    # and for whatever exception. If an HTTPError is raised
-                    # remaining process_response will be executed later.
-                    self._call_resp_mw(middleware_stack, req, resp)
-                    raise
+            pipeline, params = self._get_responder(req)
 
         except HTTPError as ex:
             self._compose_error_response(req, resp, ex)
-            self._call_after_hooks(req, resp, resource)
-            self._call_resp_mw(middleware_stack, req, resp)
+            self._call_after_hooks(req, resp, None)
+
+        else:
+            pipeline(req, resp, params)
 
         #
         # Set status and headers
@@ -254,13 +242,17 @@ class API(object):
         else:
             media_type = None
 
+        if (self.resp_options.add_date_header and
+                resp.get_header('Date') is None):
+            resp.set_header('Date', util.http_now())
+
         headers = resp._wsgi_headers(media_type)
 
         # Return the response per the WSGI spec
         start_response(resp.status, headers)
         return body
 
-    def add_route(self, uri_template, resource):
+    def add_route(self, uri_template, resource, middleware=None):
         """Associates a URI path with a resource.
 
         A resource is an instance of a class that defines various on_*
@@ -300,15 +292,56 @@ class API(object):
                 corresponding request handlers, and Falcon will do the right
                 thing.
 
+        Keyword Args:
+            middleware (object or list): One or more middleware components
+                that apply only to this route (default ``None``). They
+                are added to the stack after (i.e., inside) the global
+                middleware that was passed to ``API``, along with any
+                components listed in the resource's own `middleware`
+                attribute, if it has one. For example::
+
+                    class ThingsResource(object):
+                        middleware = [AuditComponent()]
+
+                        def on_get(self, req, resp):
+                            pass
+
+                    api.add_route('/things', ThingsResource(),
+                                  middleware=[AuthComponent()])
+
+                Here, AuditComponent and AuthComponent, in that order,
+                are executed only for requests to "/things", as if
+                they had been appended to the list of global
+                middleware.
+
         """
 
         uri_fields, path_template = routing.compile_uri_template(uri_template)
         method_map = routing.create_http_method_map(
             resource, uri_fields, self._before, self._after)
 
+        # PERF(kgriffs): Route-specific middleware is merged into the
+        # route's own pipelines, so that other routes don't pay for it.
+        resource_middleware = getattr(resource, 'middleware', None)
+        route_middleware = (helpers.prepare_middleware(resource_middleware) +
+                            helpers.prepare_middleware(middleware))
+
+        if route_middleware:
+            phases = helpers.prepare_middleware_phases(
+                self._middleware + route_middleware)
+        else:
+            phases = self._middleware_phases
+
+        for method, responder in method_map.items():
+            method_map[method] = self._compile_pipeline(responder, resource,
+                                                        phases)
+
+        bad_request = self._compile_pipeline(falcon.responders.bad_request,
+                                             resource, phases)
+
         # Insert at the head of the list in case we get duplicate
         # adds (will cause the last one to win).
-        self._routes.insert(0, (path_template, method_map, resource))
+        self._routes.insert(0, (path_template, method_map, bad_request))
 
     def add_sink(self, sink, prefix=r'/'):
         """Adds a "sink" responder to the API.
@@ -340,18 +373,57 @@ class API(object):
             # Assume it is a string
             prefix = re.compile(prefix)
 
+        pipeline = self._compile_pipeline(sink)
+
         # NOTE(kgriffs): Insert at the head of the list such that
         # in the case of a duplicate prefix, the last one added
         # is preferred.
-        self._sinks.insert(0, (prefix, sink))
+        self._sinks.insert(0, (prefix, pipeline))
+
+    def add_static_route(self, prefix, directory, cache_control=None):
+        """Adds a route that serves files from a directory.
+
+        Requests whose path starts with the given prefix are mapped to
+        files under `directory`, which are served by an instance of
+        :py:class:`~.StaticResource`. For example, given a prefix of
+        '/static', a request for '/static/css/site.css' would be
+        answered with the contents of 'css/site.css' in `directory`.
+
+        The resource is added as a sink (see also ``add_sink``), so
+        routes added with ``add_route`` take precedence over it. In
+        order to tune the resource's metadata cache, instantiate
+        :py:class:`~.StaticResource` directly and pass it to
+        ``add_sink`` instead.
+
+        Args:
+            prefix (str): Path prefix under which to serve files, e.g.,
+                '/static'.
+            directory (str): Directory containing the files to serve.
+            cache_control (list, optional): Cache directives to use as
+                the value of the Cache-Control header, such as
+                ``['max-age=3600']`` (default ``None``).
+
+        """
+
+        prefix = prefix.rstrip('/')
+        resource = StaticResource(prefix, directory,
+                                  cache_control=cache_control)
+
+        self.add_sink(resource, re.escape(prefix) + '/')
 
     def add_error_handler(self, exception, handler=None):
         """Adds a handler for a given exception type.
 
+        If more than one registered handler matches a given error (i.e.,
+        handlers were added for both the error's class and one of its
+        base classes), the one that was added most recently is used.
+
         Args:
             exception (type): Whenever an error occurs when handling a request
                 that is an instance of this exception class, the given
-                handler callable will be used to handle the exception.
+                handler callable will be used to handle the exception. A
+                tuple of exception classes may also be given, in which
+                case `handler` is registered for each of them.
             handler (callable): A callable taking the form
                 ``func(ex, req, resp, params)``, called
                 when there is a matching exception raised when handling a
@@ -380,9 +452,24 @@ class API(object):
                                      'method named "handle" that is a '
                                      'member of the given exception class.')
 
-        # Insert at the head of the list in case we get duplicate
-        # adds (will cause the most recently added one to win).
-        self._error_handlers.insert(0, (exception, handler))
+        # NOTE(kgriffs): Rank each handler by the order in which it was
+        # added, so that when more than one handler matches a given
+        # error, the most recently added one wins.
+        rank = max([r for r, _ in self._error_handlers.values()] or [0]) + 1
+
+        # NOTE(kgriffs): As with isinstance(), a tuple of types may be
+        # given in order to register the same handler for each of them.
+        if isinstance(exception, tuple):
+            exceptions = exception
+        else:
+            exceptions = (exception,)
+
+        for err_type in exceptions:
+            self._error_handlers[err_type] = (rank, handler)
+
+        # NOTE(kgriffs): Invalidate handlers resolved previously, since
+        # the new one may supersede them.
+        self._error_handler_cache = {}
 
     def set_error_serializer(self, serializer):
         """Override the default serializer for instances of HTTPError.
@@ -424,50 +511,258 @@ class API(object):
             req: The request object.
 
         Returns:
-            A 3-member tuple consisting of a responder callable,
-            a dict containing parsed path fields (if any were specified in
-            the matching route's URI template), and a reference to the
-            responder's resource instance.
+            A 2-member tuple consisting of the compiled pipeline for the
+            matching responder (see also ``_compile_pipeline``), and a
+            dict containing parsed path fields (if any were specified in
+            the matching route's URI template).
 
         Note:
             If a responder was matched to the given URI, but the HTTP
             method was not found in the method_map for the responder,
-            the responder callable element of the returned tuple will be
+            the pipeline element of the returned tuple will wrap
             `falcon.responder.bad_request`.
 
             Likewise, if no responder was matched for the given URI, then
-            the responder callable element of the returned tuple will be
+            the pipeline element of the returned tuple will wrap
             `falcon.responder.path_not_found`
         """
 
         path = req.path
         method = req.method
-        for path_template, method_map, resource in self._routes:
+        for path_template, method_map, bad_request in self._routes:
             m = path_template.match(path)
             if m:
                 params = m.groupdict()
 
                 try:
-                    responder = method_map[method]
+                    pipeline = method_map[method]
                 except KeyError:
-                    responder = falcon.responders.bad_request
+                    pipeline = bad_request
 
                 break
         else:
             params = {}
-            resource = None
 
             for pattern, sink in self._sinks:
                 m = pattern.match(path)
                 if m:
                     params = m.groupdict()
-                    responder = sink
+                    pipeline = sink
 
                     break
             else:
-                responder = falcon.responders.path_not_found
+                pipeline = self._not_found
+
+        return (pipeline, params)
+
+    def _compile_pipeline(self, responder, resource=None, phases=None):
+        """Flattens middleware and a responder into a single callable.
+
+        Rather than dispatching to the middleware stack via separate
+        method calls on every request, each route and method is compiled
+        once, at registration time, into a single function that makes
+        all of these calls in sequence. Errors raised along the way are
+        handled, and the middleware stack unwound, as documented on the
+        ``API`` class.
+
+        Args:
+            responder: The responder to call, taking the form
+                ``func(req, resp, **params)``. Any global hooks must
+                already have been applied to it (see also
+                ``hooks._wrap_with_hooks``).
+            resource: The resource instance providing the responder, if
+                any, to pass to the global "after" hooks when an error
+                is handled (default None).
+            phases: The middleware to run for the responder, as returned
+                by ``api_helpers.prepare_middleware_phases()`` (default
+                None, i.e., use the global middleware).
+
+        Returns:
+            callable: A function of the form ``func(req, resp, params)``.
+
+        """
+
+        # NOTE(kgriffs): The coroutine returned by the responder would
+        # never be awaited.
+        if hooks._is_async(responder):
+            raise TypeError('Coroutine functions may only be used as '
+                            'responders with falcon.asgi.API')
+
+        # NOTE(kgriffs): The default responders, e.g., for 404 and 405,
+        # never touch the body, so don't let an oversized one preempt
+        # their response.
+        prepare_body = not _is_default_responder(responder)
+
+        # PERF(kgriffs): Bind everything that the pipeline needs to
+        # local names, so that no attribute lookups are done per request.
+        if phases is None:
+            phases = self._middleware_phases
+
+        request_mw, response_mw = phases
+        handle_exception = self._handle_exception
+        handle_set_error = self._handle_set_error
+
+        if not (request_mw or response_mw[-1]):
+            return _compile_plain_pipeline(responder, resource,
+                                           prepare_body, handle_exception,
+                                           handle_set_error)
+
+        return _compile_layered_pipeline(responder, resource, phases,
+                                         prepare_body, handle_exception,
+                                         handle_set_error)
+
+    def _handle_exception(self, ex, req, resp, params, resource, remaining):
+        """Handles an error raised while processing a request.
+
+        If an error handler was registered for the type of `ex`, it is
+        called, followed by the global "after" hooks and any remaining
+        *process_response* methods on the middleware stack. Otherwise,
+        if `ex` is an instance of HTTPError, it is converted to a
+        response, and the stack is unwound. The same goes for an
+        HTTPError raised by the error handler or by a *process_response*
+        method.
+
+        Any other error is left for the caller to re-raise, once the
+        stack has been unwound with the response status set to
+        "500 Internal Server Error", since that is what the client
+        will get.
+
+        Args:
+            ex: The error that was raised.
+            req: The request object.
+            resp: The response object.
+            params: The responder's kwargs.
+            resource: The resource instance, if any.
+            remaining: An iterator over the *process_response* methods
+                that remain to be called in order to unwind the
+                middleware stack.
+
+        Returns:
+            bool: ``True`` if the error was handled, or ``False`` if the
+            caller should re-raise it.
+
+        """
+
+        # NOTE(kgriffs): Coverage is giving false negatives,
+        # so disabled on relevant lines. All paths are tested
+        # afaict.
+        try:
+            err_handler = self._get_error_handler(type(ex))
+            if err_handler is not None:
+                err_handler(ex, req, resp, params)
+                _release_frozen(ex)
+
+                self._call_after_hooks(req, resp, resource)
+                self._call_resp_mw(remaining, req, resp)
+
+                return True
+
+            # NOTE(kgriffs): Compose the error response before unwinding
+            # the stack, so that process_response methods see the
+            # response that will actually be sent, rather than, e.g.,
+            # mistaking whatever the responder left behind for a
+            # successful (and cacheable) response.
+            if isinstance(ex, HTTPError):
+                self._compose_error_response(req, resp, ex)
+            else:
+                resp.status = status.HTTP_500
+
+            # NOTE(ealogar): This will executed remaining
+            # process_response when no error_handler is given
+            # and for whatever exception.
+            self._call_resp_mw(remaining, req, resp)
+
+        except HTTPError as error:
+            # NOTE(kgriffs): The error handler, or a process_response
+            # method, raised an HTTPError, which supersedes the original.
+            if err_handler is None and isinstance(ex, HTTPError):
+                # NOTE(kgriffs): Don't let the representation of the
+                # superseded error stand in for that of the new one.
+                resp.body = None
+                resp.data = None
+
+            _release_frozen(ex)
+            ex = error
+
+            self._compose_error_response(req, resp, ex)
 
-        return (responder, params, resource)
+        if not isinstance(ex, HTTPError):
+            return False
+
+        self._call_after_hooks(req, resp, resource)
+        self._call_resp_mw(remaining, req, resp)
+
+        return True
+
+    def _handle_set_error(self, req, resp, params, resource, remaining):
+        """Handles an error that was set via ``Response.set_error()``.
+
+        The error is handled exactly as if it had been raised, but
+        without the overhead of raising and catching it.
+
+        Args:
+            req: The request object.
+            resp: The response object.
+            params: The responder's kwargs.
+            resource: The resource instance, if any.
+            remaining: An iterator over the *process_response* methods
+                that remain to be called in order to unwind the
+                middleware stack.
+
+        """
+
+        error = resp._error
+        resp._error = None
+
+        # NOTE(kgriffs): Response.set_error() also marked the response as
+        # complete; undo that so that the rest of the stack sees the same
+        # state it would have had the error been raised.
+        resp.complete = False
+
+        # NOTE(kgriffs): As when raised, an error that is neither an
+        # HTTPError nor handled by a registered error handler propagates.
+        if not self._handle_exception(error, req, resp, params, resource,
+                                      remaining):
+            raise error
+
+    def _get_error_handler(self, err_type):
+        """Looks up the error handler, if any, for a given exception type.
+
+        Rather than checking the error against each registered type in
+        turn, the type's MRO is walked against the handler registry, and
+        the result is memoized per type until another error handler is
+        added.
+
+        Args:
+            err_type: The type of the error that was raised.
+
+        Returns:
+            callable: The most recently added handler that was registered
+            for `err_type` or for one of its base classes, or ``None`` if
+            there is no such handler.
+
+        """
+
+        # PERF(kgriffs): Errors of the same few types tend to be raised
+        # over and over again, so in the common case this is just a
+        # single dict lookup.
+        try:
+            return self._error_handler_cache[err_type]
+        except KeyError:
+            pass
+
+        handlers = self._error_handlers
+        best = None
+
+        for klass in err_type.__mro__:
+            entry = handlers.get(klass)
+            if entry is not None and (best is None or entry[0] > best[0]):
+                best = entry
+
+        err_handler = None if best is None else best[1]
+        self._error_handler_cache[err_type] = err_handler
+
+        return err_handler
 
     def _compose_error_response(self, req, resp, error):
         """Composes a response for the given HTTPError instance."""
@@ -488,38 +783,21 @@ class API(object):
                 # it was mistakenly set by the app.
                 resp.content_type = media_type
 
-    def _call_req_mw(self, stack, req, resp, params):
-        """Run process_request middleware methods."""
-
-        for component in self._middleware:
-            process_request, _ = component
-            if process_request is not None:
-                process_request(req, resp, params)
-
-            # Put executed component on the stack
-            stack.append(component)  # keep track from outside
+        _release_frozen(error)
 
-    def _call_resp_mw(self, stack, req, resp):
-        """Run process_response middleware."""
+    def _call_resp_mw(self, remaining, req, resp):
+        """Run the remaining process_response middleware methods."""
 
-        while stack:
-            _, process_response = stack.pop()
-            if process_response is not None:
-                process_response(req, resp)
+        for process_response in remaining:
+            process_response(req, resp)
 
     def _call_after_hooks(self, req, resp, resource):
         """Executes each of the global "after" hooks, in turn."""
 
-        if not self._after:
-            return
-
+        # NOTE(kgriffs): Hooks that do not accept the "resource" param
+        # were already adapted by prepare_global_hooks().
         for hook in self._after:
-            try:
-                hook(req, resp, resource)
-            except TypeError:
-                # NOTE(kgriffs): Catching the TypeError is a heuristic to
-                # detect old hooks that do not accept the "resource" param
-                hook(req, resp)
+            hook(req, resp, resource)
 
     # PERF(kgriffs): Moved from api_helpers since it is slightly faster
     # to call using self, and this function is called for most
@@ -546,7 +824,13 @@ class API(object):
             # functions.
             content_length = len(resp.body_encoded)
         elif resp.data is not None:
-            content_length = len(resp.data)
+            data = resp.data
+
+            # PERF(kgriffs): Byte strings are by far the most common case.
+            if isinstance(data, six.binary_type):
+                content_length = len(data)
+            else:
+                content_length = response_helpers.data_length(data)
         elif resp.stream is not None:
             if resp.stream_len is not None:
                 # Total stream length is known in advance
@@ -575,7 +859,8 @@ class API(object):
             * If resp.body is not *None*, returns [resp.body], encoded
               as UTF-8 if it is a Unicode string. Bytestrings are returned
               as-is.
-            * If resp.data is not *None*, returns [resp.data]
+            * If resp.data is not *None*, returns [resp.data], or
+              resp.data itself if it is a list or tuple of buffers.
             * If resp.stream is not *None*, returns resp.stream
               iterable using wsgi.file_wrapper, if possible.
             * Otherwise, returns []
@@ -588,7 +873,14 @@ class API(object):
             return [body]
 
         elif resp.data is not None:
-            return [resp.data]
+            data = resp.data
+
+            # PERF(kgriffs): A sequence of buffers is already a valid WSGI
+            # iterable, so hand it over without concatenating it.
+            if isinstance(data, (list, tuple)):
+                return data
+
+            return [data]
 
         elif resp.stream is not None:
             stream = resp.stream
@@ -597,17 +889,154 @@ class API(object):
             # stream is file-like. Not perfect, but should be
             # good enough until proven otherwise.
             if hasattr(stream, 'read'):
+                block_size = resp.stream_block_size
+                if block_size is None:
+                    block_size = self.resp_options.stream_block_size
+
+                # PERF(kgriffs): Don't ask the stream to allocate a
+                # buffer that is larger than the content itself.
+                stream_len = resp.stream_len
+                if stream_len and stream_len < block_size:
+                    block_size = stream_len
+
                 if wsgi_file_wrapper is not None:
-                    # TODO(kgriffs): Make block size configurable at the
-                    # global level, pending experimentation to see how
-                    # useful that would be.
-                    #
-                    # See also the discussion on the PR: http://goo.gl/XGrtDz
-                    return wsgi_file_wrapper(stream, self._STREAM_BLOCK_SIZE)
+                    return wsgi_file_wrapper(stream, block_size)
                 else:
-                    return iter(lambda: stream.read(self._STREAM_BLOCK_SIZE),
+                    # PERF(kgriffs): Calling a partial avoids executing
+                    # an additional Python frame per block, as would
+                    # be the case with a lambda.
+                    #
+                    # NOTE(kgriffs): Reading into a single, reused buffer
+                    # via readinto() would save an allocation per block,
+                    # but PEP 3333 requires yielding bytestrings, and the
+                    # server is free to hold on to each block until it is
+                    # written out; mutating it in place would corrupt the
+                    # response, and copying it would negate the savings.
+                    return iter(functools.partial(stream.read, block_size),
                                 b'')
 
             return resp.stream
 
         return []
+
+
+def _compile_plain_pipeline(responder, resource, prepare_body,
+                            handle_exception, handle_set_error):
+    """Compile a pipeline for an API that has no middleware.
+
+    See also: ``API._compile_pipeline``.
+
+    """
+
+    def pipeline(req, resp, params):
+        try:
+            if prepare_body and req._body_pending:
+                req._prepare_body()
+
+            responder(req, resp, **params)
+
+        except Exception as ex:
+            if not handle_exception(ex, req, resp, params, resource,
+                                    iter(())):
+                raise
+
+        else:
+            if resp._error is not None:
+                handle_set_error(req, resp, params, resource, iter(()))
+
+    return pipeline
+
+
+def _compile_layered_pipeline(responder, resource, phases, prepare_body,
+                              handle_exception, handle_set_error):
+    """Compile a pipeline for an API that has one or more middleware.
+
+    See also: ``API._compile_pipeline``.
+
+    """
+
+    request_mw, response_mw = phases
+
+    # NOTE(kgriffs): The number of components entered when none of
+    # them completes the response.
+    num_components = len(response_mw) - 1
+
+    def pipeline(req, resp, params):
+        # NOTE(kgriffs): Rather than pushing each component onto a
+        # stack, keep track of how many were entered, and then look
+        # up the precomputed list of process_response methods to
+        # unwind for that depth.
+        depth = 0
+        remaining = None
+
+        try:
+            for depth, process_request in request_mw:
+                process_request(req, resp, params)
+
+                if resp.complete:
+                    # NOTE(kgriffs): As when raising an error, a
+                    # component that sets one is not unwound.
+                    depth = depth if resp._error else depth + 1
+                    break
+            else:
+                # NOTE(kgriffs): The responder is only called if none of
+                # the components already produced the response (e.g.,
+                # from a cache).
+                depth = num_components
+
+                # NOTE(kgriffs): Only now, after routing and request
+                # middleware, may the request body be checked and
+                # read.
+                if prepare_body and req._body_pending:
+                    req._prepare_body()
+
+                responder(req, resp, **params)
+
+            # NOTE(kgriffs): If one of these raises an error, the
+            # iterator picks up where it left off when unwinding the
+            # rest of the stack.
+            remaining = iter(response_mw[depth])
+            if resp._error is None:
+                for process_response in remaining:
+                    process_response(req, resp)
+
+                    if resp._error is not None:
+                        break
+
+        except Exception as ex:
+            # NOTE(kgriffs): Unless the error was raised while unwinding,
+            # start with the components that were entered so far.
+            remaining = remaining or iter(response_mw[depth])
+
+            if not handle_exception(ex, req, resp, params, resource,
+                                    remaining):
+                raise
+
+        else:
+            if resp._error is not None:
+                handle_set_error(req, resp, params, resource, remaining)
+
+    return pipeline
+
+
+def _is_default_responder(responder):
+    """Checks whether a responder is one of those in falcon.responders."""
+
+    # NOTE(kgriffs): Hook wrappers copy the module of the responder.
+    return getattr(responder, '__module__', None) == 'falcon.responders'
+
+
+def _release_frozen(error):
+    """Drops the traceback, context and cause of a frozen error, if any.
+
+    Frozen errors are raised over and over again, and each time, the
+    interpreter extends the traceback that the error carries, so left
+    alone, it would hold on to the frames (and therefore the req and
+    resp objects) of every request that ever raised it.
+
+    """
+
+    if six.PY3 and getattr(error, 'frozen', False):
+        error.__traceback__ = None
+        error.__context__ = None
+        error.__cause__ = None
@@ -12,26 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import six
+
 from falcon import util
 
 
-def prepare_global_hooks(hooks):
-    if hooks is not None:
-        if not isinstance(hooks, list):
-            hooks = [hooks]
+_MISSING = object()
+
+# NOTE(kgriffs): The number of distinct Accept headers sent by clients
+# is typically small, but the cache must be bounded regardless, since
+# the header is controlled by the client.
+_error_media_types = util.LRUCache(256)
+
+
+def prepare_global_hooks(hooks, adapt):
+    """Check global hooks and adapt them to a common signature.
+
+    Args:
+        hooks: A hook, a list of hooks, or None.
+        adapt: A function that takes a hook, and returns a callable
+            that accepts the `resource` argument, whether or not the
+            hook itself does (see also ``hooks._adapt_before``).
+
+    Returns:
+        tuple: The adapted hooks, in the order given.
+
+    """
+
+    if hooks is None:
+        return ()
+
+    if not isinstance(hooks, list):
+        hooks = [hooks]
 
-        for action in hooks:
-            if not callable(action):
-                raise TypeError('One or more hooks are not callable')
+    for action in hooks:
+        if not callable(action):
+            raise TypeError('One or more hooks are not callable')
 
-    return hooks
+    # PERF(kgriffs): Inspect each hook's signature once, here, rather
+    # than each time it is called.
+    return tuple(adapt(action) for action in hooks)
 
 
 def prepare_middleware(middleware=None):
     """Check middleware interface and prepare it to iterate.
 
     Args:
-        middleware:  list (or object) of input middleware
+        middleware:  list or tuple (or object) of input middleware
 
     Returns:
         A middleware list
@@ -44,7 +71,7 @@ def prepare_middleware(middleware=None):
     if middleware is None:
         middleware = []
     else:
-        if not isinstance(middleware, list):
+        if not isinstance(middleware, (list, tuple)):
             middleware = [middleware]
 
     for component in middleware:
@@ -62,6 +89,47 @@ def prepare_middleware(middleware=None):
     return prepared_middleware
 
 
+def prepare_middleware_phases(middleware):
+    """Split prepared middleware into request and response phases.
+
+    Components that do not implement one of the two methods are left
+    out of the corresponding phase, so that nothing needs to be checked
+    for them on each request.
+
+    Args:
+        middleware: A list of ``(process_request, process_response)``
+            tuples, as returned by ``prepare_middleware()``.
+
+    Returns:
+        tuple: A 2-member tuple. The first member is a tuple of
+        ``(index, process_request)`` pairs, in natural order, where
+        `index` is the position of the component in `middleware`. The
+        second member is indexed by the number of components that were
+        entered while processing a request, and contains, for each such
+        number, a tuple of the *process_response* methods to call in
+        order to unwind the stack.
+
+    """
+
+    request_mw = tuple(
+        (index, process_request)
+        for index, (process_request, _) in enumerate(middleware)
+        if process_request is not None
+    )
+
+    response_mw = []
+    unwind = ()
+    for process_request, process_response in middleware:
+        response_mw.append(unwind)
+
+        if process_response is not None:
+            unwind = (process_response,) + unwind
+
+    response_mw.append(unwind)
+
+    return request_mw, tuple(response_mw)
+
+
 def default_serialize_error(req, exception):
     """Serialize the given instance of HTTPError.
 
@@ -92,7 +160,42 @@ def default_serialize_error(req, exception):
         available media types.
 
     """
-    representation = None
+
+    preferred = negotiate_error_media_type(req)
+
+    if preferred is None:
+        return (None, None)
+
+    if preferred == 'application/json':
+        representation = exception.to_json()
+    else:
+        representation = exception.to_xml()
+
+    return (preferred, representation)
+
+
+def negotiate_error_media_type(req):
+    """Choose the media type to use when serializing an error.
+
+    The result depends only on the value of the request's Accept
+    header, so it is cached for each distinct value, sparing the cost
+    of parsing the header whenever a client that keeps sending the same
+    one triggers an error.
+
+    Args:
+        req: Instance of falcon.Request
+
+    Returns:
+        str: Either 'application/json', 'application/xml' or 'text/xml',
+        or ``None`` if the client does not accept any of them.
+
+    """
+
+    key = accept = req.accept
+
+    preferred = _error_media_types.get(key, _MISSING)
+    if preferred is not _MISSING:
+        return preferred
 
     preferred = req.client_prefers(('application/xml',
                                     'text/xml',
@@ -104,7 +207,7 @@ def default_serialize_error(req, exception):
         # is probably better than nothing, but if that is not
         # desired, this behavior can be customized by adding a
         # custom HTTPError serializer for the custom type.
-        accept = req.accept.lower()
+        accept = accept.lower()
 
         # NOTE(kgriffs): Simple heuristic, but it's fast, and
         # should be sufficiently accurate for our purposes. Does
@@ -117,10 +220,66 @@ def default_serialize_error(req, exception):
         elif '+xml' in accept:
             preferred = 'application/xml'
 
-    if preferred is not None:
-        if preferred == 'application/json':
-            representation = exception.to_json()
-        else:
-            representation = exception.to_xml()
+    _error_media_types.set(key, preferred)
+    return preferred
 
-    return (preferred, representation)
+
+class CachingErrorSerializer(object):
+    """Serializes instances of HTTPError, caching the results.
+
+    Like the default error serializer, this serializer supports JSON
+    and XML. However, encoded representations are cached, keyed by the
+    error's type, status, title, description, code and link, along with
+    the negotiated media type, so that errors that are raised over and
+    over again (e.g., authentication failures) are only serialized
+    once. For example::
+
+        api = falcon.API()
+        api.set_error_serializer(falcon.CachingErrorSerializer())
+
+    Note:
+        The cache assumes that an error's representation is fully
+        determined by the attributes listed above. Custom error classes
+        that override ``to_dict()``, ``to_json()`` or ``to_xml()`` in
+        order to include other data should not be used with this
+        serializer.
+
+    Keyword Args:
+        compact (bool): Whether to serialize JSON without indentation
+            or whitespace between tokens (default ``True``).
+        capacity (int): Maximum number of representations to cache
+            (default 1024).
+
+    """
+
+    __slots__ = ('_cache', '_compact')
+
+    def __init__(self, compact=True, capacity=1024):
+        self._compact = compact
+        self._cache = util.LRUCache(capacity)
+
+    def __call__(self, req, exception):
+        media_type = negotiate_error_media_type(req)
+        if media_type is None:
+            return (None, None)
+
+        link = exception.link
+        if link is not None:
+            link = tuple(link.items())
+
+        key = (type(exception), exception.status, exception.title,
+               exception.description, exception.code, link, media_type)
+
+        body = self._cache.get(key)
+        if body is None:
+            if media_type == 'application/json':
+                body = exception.to_json(compact=self._compact)
+            else:
+                body = exception.to_xml()
+
+            if isinstance(body, six.text_type):
+                body = body.encode('utf-8')
+
+            self._cache.set(key, body)
+
+        return (media_type, body)
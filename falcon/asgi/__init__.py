@@ -0,0 +1,27 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ASGI support for serving Falcon apps with asyncio (Python 3.5+).
+
+This package is not imported by ``falcon`` itself, so that the
+framework can still be used under earlier versions of Python.
+
+"""
+
+# Hoist classes into the falcon.asgi namespace
+from falcon.asgi.app import API  # NOQA
+from falcon.asgi.pool import ThreadPool  # NOQA
+from falcon.asgi.request import Request  # NOQA
+from falcon.asgi.response import Response  # NOQA
+from falcon.asgi.stream import BoundedStream  # NOQA
@@ -0,0 +1,591 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from inspect import isawaitable
+import io
+import tempfile
+
+from falcon import api
+from falcon import DEFAULT_MEDIA_TYPE
+from falcon import hooks
+from falcon.asgi import hooks as async_hooks
+from falcon.asgi.request import Request
+from falcon.asgi.response import Response
+from falcon.http_error import HTTPError
+import falcon.status_codes as status
+from falcon import util
+
+
+# NOTE(kgriffs): Streams that never block, and so are simply read, or
+# iterated over, on the event loop.
+_IN_MEMORY_STREAMS = (io.BytesIO, list, tuple)
+
+# NOTE(kgriffs): Returned by next() once a stream is exhausted.
+_DONE = object()
+
+# NOTE(kgriffs): Request bodies buffered for regular responders are
+# spooled to disk past this size, in bytes.
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class API(api.API):
+    """An ASGI application, for serving Falcon apps with asyncio.
+
+    Routes, sinks, error handlers, hooks and middleware are added, and
+    work, just as they do with :py:class:`falcon.API`, but the app is
+    served via the ASGI protocol by a server such as Uvicorn or
+    Hypercorn, e.g.::
+
+        import falcon.asgi
+
+        class ThingsResource(object):
+            async def on_get(self, req, resp):
+                resp.body = await fetch_things()
+
+        app = falcon.asgi.API()
+        app.add_route('/things', ThingsResource())
+
+    Responders, hooks, sinks, error handlers, and middleware methods
+    may all be coroutine functions (i.e., defined with ``async def``).
+    Regular functions may also be used, and are called directly on
+    the event loop, so they should not block, unless a `thread_pool`
+    is given. In that case, regular responders, sinks and hooks are
+    run on the pool, while coroutine functions still run on the loop.
+    The same goes for a response `stream` that is a regular file-like
+    object or iterable; each block is read from it on the pool.
+
+    Note:
+        The framework awaits whatever a responder, hook, or middleware
+        method returns, if it is awaitable. Any other return value is
+        ignored, as it is by :py:class:`falcon.API`.
+
+    Requests are represented by :py:class:`falcon.asgi.Request`, and
+    responses by :py:class:`falcon.asgi.Response`, which also accepts
+    an asynchronous iterable for its `stream`. The request body is not
+    received until the app reads it from ``req.stream``, which must be
+    awaited (see also :py:class:`falcon.asgi.BoundedStream`). So that
+    they may be ported from WSGI as-is, regular responders are instead
+    given a ``req.stream`` that is read synchronously, for which the
+    body is received in full before the responder is called (and
+    spooled to a temporary file if it is larger than 1 MiB). Set
+    ``req_options.max_content_length`` to limit the size of such
+    bodies.
+
+    In addition to "http" connections, the "lifespan" protocol is
+    supported, so that the app can be run by servers that require it.
+
+    Requires Python 3.5 or later. For a description of the other
+    arguments, see :py:class:`falcon.API`. Note that a custom
+    `request_type` must inherit from :py:class:`falcon.asgi.Request`.
+
+    Keyword Args:
+        thread_pool (ThreadPool): Pool on which to run regular (i.e.,
+            blocking) responders, sinks and hooks (default ``None``,
+            i.e., run them on the event loop). See also
+            :py:class:`falcon.asgi.ThreadPool`.
+
+    """
+
+    __slots__ = ('_thread_pool',)
+
+    def __init__(self, media_type=DEFAULT_MEDIA_TYPE, before=None, after=None,
+                 request_type=Request, response_type=Response,
+                 middleware=None, thread_pool=None):
+
+        # NOTE(kgriffs): Must be set before any pipelines are compiled.
+        self._thread_pool = thread_pool
+
+        super(API, self).__init__(media_type=media_type, before=before,
+                                  after=after, request_type=request_type,
+                                  response_type=response_type,
+                                  middleware=middleware)
+
+    async def __call__(self, scope, receive, send):
+        """ASGI `app` method.
+
+        Args:
+            scope (dict): The ASGI connection scope.
+            receive: Coroutine function that returns the next event
+                from the client.
+            send: Coroutine function that sends an event to the client.
+
+        """
+
+        scope_type = scope['type']
+        if scope_type != 'http':
+            if scope_type == 'lifespan':
+                await _handle_lifespan(receive, send)
+                return
+
+            raise ValueError('Unsupported ASGI scope type: ' + scope_type)
+
+        req = self._request_type(scope, receive, options=self.req_options)
+        resp = self._response_type()
+
+        try:
+            pipeline, params = self._get_responder(req)
+
+        except HTTPError as ex:
+            self._compose_error_response(req, resp, ex)
+            await self._call_after_hooks(req, resp, None)
+
+        else:
+            await pipeline(req, resp, params)
+
+        #
+        # Set status and headers
+        #
+        if req.method == 'HEAD' or resp.status in self._BODILESS_STATUS_CODES:
+            has_body = False
+        else:
+            self._set_content_length(resp)
+            has_body = (resp.body_encoded is not None or
+                        resp.data is not None or
+                        resp.stream is not None)
+
+        # Set content type if needed
+        use_content_type = (has_body or
+                            req.method == 'HEAD' or
+                            resp.status == status.HTTP_416)
+
+        if use_content_type:
+            media_type = self._media_type
+        else:
+            media_type = None
+
+        if (self.resp_options.add_date_header and
+                resp.get_header('Date') is None):
+            resp.set_header('Date', util.http_now())
+
+        # NOTE(kgriffs): Header names were already lowercased by the
+        # response, as the ASGI spec requires.
+        headers = [
+            (name.encode('ascii'), value.encode('latin-1'))
+            for name, value in resp._wsgi_headers(media_type)
+        ]
+
+        await send({
+            'type': 'http.response.start',
+            'status': int(resp.status[:3]),
+            'headers': headers,
+        })
+
+        if has_body:
+            await self._send_body(resp, send)
+        else:
+            await send({'type': 'http.response.body'})
+
+    # ------------------------------------------------------------------------
+    # Helpers that require self
+    # ------------------------------------------------------------------------
+
+    def _compile_pipeline(self, responder, resource=None, phases=None):
+        """Flattens middleware and a responder into a single coroutine.
+
+        See also: ``falcon.API._compile_pipeline``.
+
+        """
+
+        prepare_body = not api._is_default_responder(responder)
+        buffer_body = async_hooks._must_offload(_unwrap_responder(responder))
+
+        if self._thread_pool is not None:
+            responder = async_hooks._offload(self._thread_pool.run, responder)
+
+        if buffer_body:
+            responder = _buffer_body(responder)
+
+        if phases is None:
+            phases = self._middleware_phases
+
+        request_mw, response_mw = phases
+        handle_exception = self._handle_exception
+        handle_set_error = self._handle_set_error
+
+        if not (request_mw or response_mw[-1]):
+            return _compile_plain_pipeline(responder, resource,
+                                           prepare_body, handle_exception,
+                                           handle_set_error)
+
+        return _compile_layered_pipeline(responder, resource, phases,
+                                         prepare_body, handle_exception,
+                                         handle_set_error)
+
+    async def _handle_exception(self, ex, req, resp, params, resource,
+                                remaining):
+        """Handles an error raised while processing a request.
+
+        See also: ``falcon.API._handle_exception``.
+
+        """
+
+        try:
+            err_handler = self._get_error_handler(type(ex))
+            if err_handler is not None:
+                result = err_handler(ex, req, resp, params)
+                if isawaitable(result):
+                    await result
+
+                api._release_frozen(ex)
+
+                await self._call_after_hooks(req, resp, resource)
+                await self._call_resp_mw(remaining, req, resp)
+
+                return True
+
+            if isinstance(ex, HTTPError):
+                self._compose_error_response(req, resp, ex)
+            else:
+                resp.status = status.HTTP_500
+
+            await self._call_resp_mw(remaining, req, resp)
+
+        except HTTPError as error:
+            if err_handler is None and isinstance(ex, HTTPError):
+                # NOTE(kgriffs): Don't let the representation of the
+                # superseded error stand in for that of the new one.
+                resp.body = None
+                resp.data = None
+
+            api._release_frozen(ex)
+            ex = error
+
+            self._compose_error_response(req, resp, ex)
+
+        if not isinstance(ex, HTTPError):
+            return False
+
+        await self._call_after_hooks(req, resp, resource)
+        await self._call_resp_mw(remaining, req, resp)
+
+        return True
+
+    async def _handle_set_error(self, req, resp, params, resource, remaining):
+        """Handles an error that was set via ``Response.set_error()``.
+
+        See also: ``falcon.API._handle_set_error``.
+
+        """
+
+        error = resp._error
+        resp._error = None
+        resp.complete = False
+
+        if not await self._handle_exception(error, req, resp, params,
+                                            resource, remaining):
+            raise error
+
+    async def _call_resp_mw(self, remaining, req, resp):
+        """Run the remaining process_response middleware methods."""
+
+        for process_response in remaining:
+            result = process_response(req, resp)
+            if isawaitable(result):
+                await result
+
+    async def _call_after_hooks(self, req, resp, resource):
+        """Executes each of the global "after" hooks, in turn."""
+
+        pool = self._thread_pool
+
+        for hook in self._after:
+            if pool is not None and async_hooks._must_offload(hook):
+                await pool.run(hook, req, resp, resource)
+                continue
+
+            result = hook(req, resp, resource)
+            if isawaitable(result):
+                await result
+
+    async def _send_body(self, resp, send):
+        """Sends the response body to the client.
+
+        The body, or data, is sent in a single event, while a stream
+        is sent one block at a time, as each becomes available.
+
+        """
+
+        body = resp.body_encoded
+        if body is None:
+            body = resp.data
+
+            if body is not None:
+                # PERF(kgriffs): Send a sequence of buffers as a single
+                # event, rather than incurring the overhead of one event
+                # per buffer.
+                if isinstance(body, (list, tuple)):
+                    body = b''.join(body)
+                elif not isinstance(body, bytes):
+                    # NOTE(kgriffs): ASGI requires bytes, rather than
+                    # any buffer object.
+                    body = bytes(body)
+
+        if body is not None:
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        stream = resp.stream
+
+        try:
+            if hasattr(stream, '__aiter__'):
+                async for block in stream:
+                    await _send_block(send, block)
+
+            elif hasattr(stream, 'read'):
+                await self._send_file(resp, stream, send)
+
+            elif (self._thread_pool is None or
+                    isinstance(stream, _IN_MEMORY_STREAMS)):
+                for block in stream:
+                    await _send_block(send, block)
+
+            else:
+                await self._send_offloaded(stream, send)
+
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                result = close()
+                if isawaitable(result):
+                    await result
+
+        await send({'type': 'http.response.body'})
+
+    async def _send_file(self, resp, stream, send):
+        """Sends the blocks read from a file-like stream to the client."""
+
+        block_size = resp.stream_block_size
+        if block_size is None:
+            block_size = self.resp_options.stream_block_size
+
+        stream_len = resp.stream_len
+        if stream_len and stream_len < block_size:
+            block_size = stream_len
+
+        read = stream.read
+        read_is_async = hooks._is_async(read)
+
+        # NOTE(kgriffs): Reading from a file, e.g., may block.
+        pool = self._thread_pool
+        if read_is_async or isinstance(stream, _IN_MEMORY_STREAMS):
+            pool = None
+
+        while True:
+            if pool is not None:
+                block = await pool._run(read, (block_size,), {}, False)
+            else:
+                block = read(block_size)
+                if read_is_async:
+                    block = await block
+
+            if not block:
+                break
+
+            await _send_block(send, block)
+
+    async def _send_offloaded(self, stream, send):
+        """Sends the blocks yielded by an iterable, via the thread pool.
+
+        Each block is produced on the pool, since a generator, for
+        example, may well block while waiting for the next one.
+
+        """
+
+        pool = self._thread_pool
+        iterator = iter(stream)
+
+        while True:
+            block = await pool._run(next, (iterator, _DONE), {}, False)
+            if block is _DONE:
+                break
+
+            await _send_block(send, block)
+
+
+async def _send_block(send, block):
+    """Sends one block of a streamed response body."""
+
+    await send({
+        'type': 'http.response.body',
+        'body': block,
+        'more_body': True,
+    })
+
+
+async def _handle_lifespan(receive, send):
+    """Acknowledges the server's lifespan events."""
+
+    while True:
+        event = await receive()
+        event_type = event['type']
+
+        if event_type == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+
+        elif event_type == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def _process_response(remaining, req, resp):
+    """Unwinds the middleware stack, stopping short if an error is set."""
+
+    for process_response in remaining:
+        result = process_response(req, resp)
+        if isawaitable(result):
+            await result
+
+        if resp._error is not None:
+            break
+
+
+def _unwrap_responder(responder):
+    """Gets the responder that is wrapped with hooks, if any."""
+
+    func = getattr(responder, '__func__', responder)
+    marker = getattr(func, '_falcon_hooks', None)
+
+    if marker is None or marker[0] is not func:
+        return responder
+
+    return marker[1]
+
+
+def _buffer_body(responder):
+    """Receives the body before calling a regular responder.
+
+    Regular responders can't await ``req.stream.read()``, so the body
+    is received in full, and they are given a stream that may be read
+    synchronously, as under WSGI. Bodies larger than
+    ``_SPOOL_MAX_SIZE`` are spooled to a temporary file, rather than
+    held in memory.
+
+    """
+
+    async def buffered(req, resp, **kwargs):
+        # NOTE(kgriffs): The file is not closed here, since the
+        # responder may well pass it along, e.g., as resp.stream. It is
+        # removed once it is garbage-collected.
+        body = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+
+        # NOTE(kgriffs): The body may also have been read already, e.g.,
+        # to parse a form, in which case the stream is simply left at
+        # EOF.
+        if _has_body(req):
+            async for block in req.stream:
+                body.write(block)
+
+            body.seek(0)
+
+        req.stream = body
+
+        result = responder(req, resp, **kwargs)
+        if isawaitable(result):
+            await result
+
+    return buffered
+
+
+def _has_body(req):
+    """Checks whether there may be any more of the body to receive."""
+
+    if req.stream.eof:
+        return False
+
+    # NOTE(kgriffs): Without a Content-Length header, assume that GET
+    # and HEAD requests have no body, as is all but universally the
+    # case, rather than waiting on the client to say so.
+    return 'CONTENT_LENGTH' in req.env or req.method not in ('GET', 'HEAD')
+
+
+def _compile_plain_pipeline(responder, resource, prepare_body,
+                            handle_exception, handle_set_error):
+    """Compile a pipeline for an API that has no middleware.
+
+    See also: ``falcon.api._compile_plain_pipeline``.
+
+    """
+
+    async def pipeline(req, resp, params):
+        try:
+            if prepare_body and req._body_pending:
+                await req._prepare_body()
+
+            result = responder(req, resp, **params)
+            if isawaitable(result):
+                await result
+
+        except Exception as ex:
+            if not await handle_exception(ex, req, resp, params, resource,
+                                          iter(())):
+                raise
+
+        else:
+            if resp._error is not None:
+                await handle_set_error(req, resp, params, resource, iter(()))
+
+    return pipeline
+
+
+def _compile_layered_pipeline(responder, resource, phases, prepare_body,
+                              handle_exception, handle_set_error):
+    """Compile a pipeline for an API that has one or more middleware.
+
+    See also: ``falcon.api._compile_layered_pipeline``.
+
+    """
+
+    request_mw, response_mw = phases
+    num_components = len(response_mw) - 1
+
+    async def pipeline(req, resp, params):
+        depth = 0
+        remaining = None
+
+        try:
+            for depth, process_request in request_mw:
+                result = process_request(req, resp, params)
+                if isawaitable(result):
+                    await result
+
+                if resp.complete:
+                    depth = depth if resp._error else depth + 1
+                    break
+            else:
+                depth = num_components
+
+                if prepare_body and req._body_pending:
+                    await req._prepare_body()
+
+                result = responder(req, resp, **params)
+                if isawaitable(result):
+                    await result
+
+            remaining = iter(response_mw[depth])
+            if resp._error is None:
+                await _process_response(remaining, req, resp)
+
+        except Exception as ex:
+            remaining = remaining or iter(response_mw[depth])
+
+            if not await handle_exception(ex, req, resp, params, resource,
+                                          remaining):
+                raise
+
+        else:
+            if resp._error is not None:
+                await handle_set_error(req, resp, params, resource,
+                                       remaining)
+
+    return pipeline
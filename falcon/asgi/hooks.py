@@ -0,0 +1,169 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coroutine counterparts of the hook wrappers in ``falcon.hooks``.
+
+These are used in place of the regular wrappers whenever the responder,
+or any of its hooks, is a coroutine function. Every hook, along with
+the responder, is called in turn, and its result is awaited if it is
+awaitable, so that regular functions may be mixed in freely.
+
+"""
+
+from functools import partial, wraps
+from inspect import isawaitable
+
+from falcon import hooks
+
+
+def _compile_hooks(before, after, responder, resource):
+    """Create a coroutine that runs hooks around a bound responder."""
+
+    @wraps(responder)
+    async def do_hooks(req, resp, **kwargs):
+        for action in before:
+            result = action(req, resp, resource, kwargs)
+            if isawaitable(result):
+                await result
+
+            if resp._error is not None:
+                return
+
+        result = responder(req, resp, **kwargs)
+        if isawaitable(result):
+            await result
+
+        for action in after:
+            if resp._error is not None:
+                return
+
+            result = action(req, resp, resource)
+            if isawaitable(result):
+                await result
+
+    return do_hooks
+
+
+def _compile_method_hooks(before, after, responder):
+    """Like ``_compile_hooks()``, but wraps an unbound method."""
+
+    @wraps(responder)
+    async def do_hooks(self, req, resp, **kwargs):
+        for action in before:
+            result = action(req, resp, self, kwargs)
+            if isawaitable(result):
+                await result
+
+            if resp._error is not None:
+                return
+
+        result = responder(self, req, resp, **kwargs)
+        if isawaitable(result):
+            await result
+
+        for action in after:
+            if resp._error is not None:
+                return
+
+            result = action(req, resp, self)
+            if isawaitable(result):
+                await result
+
+    return do_hooks
+
+
+def _offload(run, responder):
+    """Arrange for a responder's blocking parts to run via another callable.
+
+    Regular (i.e., non-coroutine) functions are wrapped in coroutine
+    functions that pass them to `run`, which is expected to call them
+    on another thread (see also ``ThreadPool.run``). When neither the
+    responder nor any of its hooks is a coroutine function, the
+    responder is offloaded as a whole, so that the hooks and the
+    responder all run in a single trip to the other thread. Otherwise,
+    the wrapper is recompiled with each of its blocking parts
+    offloaded in turn.
+
+    Falcon's own default responders are never offloaded, since they do
+    not block.
+
+    Args:
+        run: A coroutine function of the form ``run(func)``, that
+            calls `func` without arguments.
+        responder: A responder, possibly wrapped with hooks (see also
+            ``falcon.hooks._wrap_with_hooks``).
+
+    Returns:
+        callable: A responder that does not block the event loop.
+
+    """
+
+    func = getattr(responder, '__func__', responder)
+    marker = getattr(func, '_falcon_hooks', None)
+
+    if marker is None or marker[0] is not func:
+        if _must_offload(responder):
+            return _offloaded(run, responder)
+
+        return responder
+
+    __, inner, resource, before, after, is_method = marker
+
+    if is_method:
+        # NOTE(kgriffs): The hooks receive "self" as the resource.
+        resource = getattr(responder, '__self__', None)
+        if resource is None:
+            return responder
+
+        inner = inner.__get__(resource, type(resource))
+
+    parts = (inner,) + before + after
+    if not any(hooks._is_async(part) for part in parts):
+        if _must_offload(inner):
+            return _offloaded(run, responder)
+
+    if not any(_must_offload(part) for part in parts):
+        return responder
+
+    before = tuple(_offloaded(run, action) if _must_offload(action) else action
+                   for action in before)
+    after = tuple(_offloaded(run, action) if _must_offload(action) else action
+                  for action in after)
+
+    if _must_offload(inner):
+        inner = _offloaded(run, inner)
+
+    return _compile_hooks(before, after, inner, resource)
+
+
+def _must_offload(func):
+    """Checks whether a responder or hook may block the event loop."""
+
+    if hooks._is_async(func):
+        return False
+
+    # NOTE(kgriffs): Default responders, e.g., for 404 and 405.
+    return getattr(func, '__module__', None) != 'falcon.responders'
+
+
+def _offloaded(run, func):
+    """Wraps a regular function in a coroutine function that offloads it."""
+
+    @wraps(func)
+    async def offloaded(*args, **kwargs):
+        # NOTE(kgriffs): Bind the args up front, since a URI template
+        # field may well be named "func".
+        return await run(partial(func, *args, **kwargs))
+
+    return offloaded
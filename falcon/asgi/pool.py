@@ -0,0 +1,227 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from falcon.errors import HTTPServiceUnavailable
+
+
+class ThreadPool(object):
+    """Runs blocking responders and hooks on a bounded pool of threads.
+
+    Pass an instance to :py:class:`falcon.asgi.API` in order to keep
+    regular (i.e., non-coroutine) responders and hooks from blocking
+    the event loop, e.g., while migrating a WSGI app::
+
+        pool = falcon.asgi.ThreadPool(max_workers=16, max_queue=64)
+        app = falcon.asgi.API(thread_pool=pool)
+
+    Calls that can not be started right away wait for a free worker.
+    Once `max_queue` calls are waiting, further ones are rejected with
+    "503 Service Unavailable", rather than letting the backlog (and
+    the latency of every queued request along with it) grow without
+    bound.
+
+    The pool may be shared by more than one app, and is not shut down
+    by them; call ``shutdown()`` once it is no longer needed.
+
+    Keyword Args:
+        max_workers (int): Maximum number of worker threads (default
+            ``None``, i.e., the default of
+            ``concurrent.futures.ThreadPoolExecutor``).
+        max_queue (int): Maximum number of calls that may be waiting
+            for a worker at any one time (default ``None``, i.e., no
+            limit). Requires `max_workers` to be given.
+        retry_after (int): Number of seconds for the Retry-After header
+            of rejected requests (default 1).
+
+    Attributes:
+        max_workers (int): Maximum number of worker threads.
+        max_queue (int): Maximum number of waiting calls, or ``None``.
+
+    """
+
+    __slots__ = (
+        '_active',
+        '_executor',
+        '_lock',
+        '_max_queue_depth',
+        '_queue_depth',
+        '_rejected',
+        '_rejection',
+        '_submitted',
+        '_wait_time',
+        '_wait_time_max',
+        'max_queue',
+        'max_workers',
+    )
+
+    def __init__(self, max_workers=None, max_queue=None, retry_after=1):
+        if max_queue is not None and max_workers is None:
+            raise ValueError('max_workers must be given along with max_queue')
+
+        self._executor = ThreadPoolExecutor(max_workers)
+
+        # NOTE(kgriffs): ThreadPoolExecutor works out the default for us.
+        self.max_workers = self._executor._max_workers
+        self.max_queue = max_queue
+
+        # PERF(kgriffs): Rejections happen when the app is already
+        # overloaded, so don't spend any time creating the error.
+        self._rejection = HTTPServiceUnavailable(
+            'Temporarily Unavailable',
+            'The server is too busy to handle the request. Please try '
+            'again later.',
+            retry_after).freeze()
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._wait_time = 0.0
+        self._wait_time_max = 0.0
+
+    @property
+    def queue_depth(self):
+        """Number of calls currently waiting for a free worker."""
+        return self._queue_depth
+
+    def stats(self):
+        """Returns a snapshot of the pool's metrics.
+
+        Returns:
+            dict: A dict with the following items:
+
+            * ``'active'``: Number of calls currently running.
+            * ``'queue_depth'``: Number of calls currently waiting
+              for a worker.
+            * ``'max_queue_depth'``: The largest `queue_depth` seen.
+            * ``'submitted'``: Total number of calls accepted.
+            * ``'rejected'``: Total number of calls rejected because
+              the queue was full.
+            * ``'wait_time'``: Total time, in seconds, that calls
+              spent waiting for a worker.
+            * ``'wait_time_max'``: Longest time, in seconds, that any
+              one call spent waiting for a worker.
+            * ``'wait_time_avg'``: Average time, in seconds, that
+              calls spent waiting for a worker.
+
+        """
+
+        with self._lock:
+            started = self._submitted - self._queue_depth
+
+            return {
+                'active': self._active,
+                'queue_depth': self._queue_depth,
+                'max_queue_depth': self._max_queue_depth,
+                'submitted': self._submitted,
+                'rejected': self._rejected,
+                'wait_time': self._wait_time,
+                'wait_time_max': self._wait_time_max,
+                'wait_time_avg': (self._wait_time / started
+                                  if started else 0.0),
+            }
+
+    async def run(self, func, *args, **kwargs):
+        """Calls a function on one of the pool's threads.
+
+        Args:
+            func: The function to call.
+            args: Positional arguments to pass to `func`.
+            kwargs: Keyword arguments to pass to `func`.
+
+        Returns:
+            The value returned by `func`.
+
+        Raises:
+            HTTPServiceUnavailable: Too many calls are already waiting
+                for a worker.
+
+        """
+
+        return await self._run(func, args, kwargs)
+
+    async def _run(self, func, args, kwargs, may_reject=True):
+        """Like ``run()``, but the call may be exempted from the queue limit.
+
+        Calls made once the response has been started, e.g., to read
+        the next block of a streamed body, must not be rejected, since
+        it is too late to respond with a 503 by then.
+
+        """
+
+        with self._lock:
+            if may_reject and self.max_queue is not None:
+                outstanding = self._active + self._queue_depth
+                if outstanding >= self.max_workers + self.max_queue:
+                    self._rejected += 1
+                    raise self._rejection
+
+            self._submitted += 1
+            self._queue_depth += 1
+
+            if self._queue_depth > self._max_queue_depth:
+                self._max_queue_depth = self._queue_depth
+
+        future = self._executor.submit(self._call, time.monotonic(), func,
+                                       args, kwargs)
+
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+            # NOTE(kgriffs): If the call never got as far as a worker,
+            # it has to be taken off the books here.
+            if future.cancel():
+                with self._lock:
+                    self._submitted -= 1
+                    self._queue_depth -= 1
+
+            raise
+
+    def shutdown(self, wait=True):
+        """Shuts down the pool's threads.
+
+        Keyword Args:
+            wait (bool): Whether to wait for pending calls to complete
+                (default ``True``).
+
+        """
+
+        self._executor.shutdown(wait)
+
+    def _call(self, queued_at, func, args, kwargs):
+        """Runs on a worker thread, keeping track of the metrics."""
+
+        wait_time = time.monotonic() - queued_at
+
+        with self._lock:
+            self._queue_depth -= 1
+            self._active += 1
+
+            self._wait_time += wait_time
+            if wait_time > self._wait_time_max:
+                self._wait_time_max = wait_time
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
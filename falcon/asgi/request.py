@@ -0,0 +1,174 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from falcon.asgi.stream import BoundedStream
+from falcon import request
+
+# NOTE(kgriffs): Maps lowercased ASGI header names to their WSGI environ
+# keys. Entries are added as new names are seen, up to a limit, so that
+# clients can't grow the map without bound by sending made-up headers.
+_ENV_KEYS = {
+    'content-type': 'CONTENT_TYPE',
+    'content-length': 'CONTENT_LENGTH',
+}
+_MAX_ENV_KEYS = 256
+
+
+class Request(request.Request):
+    """Represents a client's HTTP request, as received via ASGI.
+
+    The ASGI connection scope is translated into a WSGI-style environ
+    dict up front, so that all of the properties and methods of
+    :py:class:`falcon.Request` work the same way, regardless of the
+    protocol the app is served with.
+
+    The body is not received until it is read from `stream`, which is
+    an instance of :py:class:`~.BoundedStream`, and so must be awaited,
+    as in ``await req.stream.read()``. URL-encoded forms are the
+    exception; they are read and parsed by the framework after the
+    request has been routed, and has passed through the
+    *process_request* middleware methods.
+
+    Args:
+        scope (dict): The ASGI connection scope for the request.
+        receive: The ASGI receive coroutine function, from which the
+            body is received.
+
+    Keyword Args:
+        options (RequestOptions): Set of global options passed from the
+            API handler. ``RequestOptions.max_content_length`` is
+            enforced while the body is read, even when the client did
+            not declare its length up front.
+
+    Attributes:
+        scope (dict): The ASGI connection scope, as passed to the app.
+        env (dict): WSGI-style environ dict that was derived from
+            `scope`. The original scope is also available under the
+            ``'asgi.scope'`` key.
+        stream (BoundedStream): Asynchronous reader for the body.
+
+    """
+
+    __slots__ = ('scope',)
+
+    def __init__(self, scope, receive, options=None):
+        self.scope = scope
+
+        if options is None:
+            options = request.RequestOptions()
+
+        env = _scope_to_environ(scope)
+        env['wsgi.input'] = BoundedStream(
+            receive, content_length=_content_length(env),
+            max_size=options.max_content_length)
+
+        super(Request, self).__init__(env, options)
+
+    async def _prepare_body(self):
+        """Check the body size and parse form params, if needed.
+
+        See also: ``falcon.Request._prepare_body``.
+
+        """
+
+        self._body_pending = False
+        self._check_content_length()
+
+        if self._has_form_body():
+            self._parse_form_body(await self.stream.read())
+
+    def _parse_form_urlencoded(self):
+        # NOTE(kgriffs): The body can't be read from here, without
+        # blocking the event loop. Defer it to _prepare_body(), which
+        # the framework awaits once the request has been routed.
+        self._body_pending = True
+
+
+def _content_length(env):
+    """Get the declared length of the body, or None if not valid."""
+
+    # NOTE(kgriffs): An invalid header is reported to the client by
+    # Request.content_length, if and when the app checks it.
+    try:
+        length = int(env['CONTENT_LENGTH'])
+    except (KeyError, ValueError):
+        return None
+
+    return length if length >= 0 else None
+
+
+def _scope_to_environ(scope):
+    """Translates an ASGI HTTP connection scope into a WSGI environ dict.
+
+    Args:
+        scope (dict): The ASGI connection scope.
+
+    Returns:
+        dict: A PEP-3333 style environ, less ``wsgi.input``.
+
+    """
+
+    path = scope['path']
+    root_path = scope.get('root_path', '')
+
+    # NOTE(kgriffs): Some servers include the root path in the path,
+    # while others do not. Normalize to WSGI semantics, so that routing
+    # is always done relative to where the app is mounted.
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    server = scope.get('server') or ('localhost', 80)
+
+    env = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path,
+        'PATH_INFO': path,
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/' + scope.get('http_version', '1.1'),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.errors': sys.stderr,
+        'asgi.scope': scope,
+    }
+
+    client = scope.get('client')
+    if client:
+        env['REMOTE_ADDR'] = client[0]
+
+    for name, value in scope['headers']:
+        # NOTE(kgriffs): Per the ASGI spec, header names are lowercased
+        # by the server.
+        name = name.decode('latin-1')
+        value = value.decode('latin-1')
+
+        try:
+            key = _ENV_KEYS[name]
+        except KeyError:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+
+            if len(_ENV_KEYS) < _MAX_ENV_KEYS:
+                _ENV_KEYS[name] = key
+
+        # NOTE(kgriffs): Fold repeated headers into a single value, as
+        # WSGI servers do.
+        if key in env:
+            sep = '; ' if key == 'HTTP_COOKIE' else ','
+            value = env[key] + sep + value
+
+        env[key] = value
+
+    return env
@@ -0,0 +1,37 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from falcon import response
+
+
+class Response(response.Response):
+    """Represents an HTTP response to a client request, sent via ASGI.
+
+    This class works just like :py:class:`falcon.Response`, except that
+    `stream` may also be asynchronous.
+
+    Attributes:
+        stream: A file-like object with a *read()* method that takes a
+            size argument and returns a block of bytes, an iterable
+            object yielding blocks of bytes, or an asynchronous
+            iterable (i.e., one that can be consumed with
+            ``async for``), such as an async generator. The *read()*
+            method may be a coroutine function. In any case, each
+            block is sent to the client as soon as it is available,
+            and the stream is closed afterwards if it has a *close()*
+            method (which may also be a coroutine function).
+
+    """
+
+    __slots__ = ()
@@ -0,0 +1,245 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from falcon.errors import HTTPBadRequest
+from falcon.request import _body_too_large
+
+
+class BoundedStream(object):
+    """Asynchronous reader for the body of an ASGI request.
+
+    This is the asyncio counterpart of ``request_helpers.Body``. The
+    body is received from the server a block at a time, as it is
+    read, so that a single event loop can serve any number of slow
+    uploads at once, without ever buffering a body in its entirety
+    unless asked to. For example::
+
+        async def on_put(self, req, resp, name):
+            async for block in req.stream:
+                await self.storage.write(name, block)
+
+    No more than the number of bytes given by the request's
+    Content-Length header are ever returned, and any excess is
+    discarded. Should the client disconnect before that many bytes
+    have been received, reading raises ``HTTPBadRequest``, rather than
+    passing a truncated body off as complete. When the length is not
+    known in advance, the stream simply ends early.
+
+    Args:
+        receive: The ASGI receive coroutine function.
+
+    Keyword Args:
+        content_length (int): Number of bytes in the body, or ``None``
+            if not known in advance (default ``None``).
+        max_size (int): Maximum number of bytes that may be received,
+            regardless of `content_length` (default ``None``, i.e.,
+            no limit). Reading past this point raises
+            ``HTTPRequestEntityTooLarge``, which protects the app from
+            bodies of unknown length, e.g., when the client uses
+            chunked transfer encoding.
+
+    Attributes:
+        bytes_received (int): Number of bytes received so far.
+
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_bytes_remaining',
+        '_eof',
+        '_max_size',
+        '_pos',
+        '_receive',
+        'bytes_received',
+    )
+
+    def __init__(self, receive, content_length=None, max_size=None):
+        self._receive = receive
+        self._bytes_remaining = content_length
+        self._max_size = max_size
+        self._buffer = b''
+        self._pos = 0
+        self._eof = content_length == 0
+        self.bytes_received = 0
+
+    @property
+    def eof(self):
+        """``True`` once the entire body has been read."""
+        return self._eof and self._pos == len(self._buffer)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """Returns the next block of the body, as received."""
+
+        if self._pos == len(self._buffer) and not await self._fill():
+            raise StopAsyncIteration
+
+        return self._take(len(self._buffer))
+
+    async def read(self, size=None):
+        """Reads from the stream.
+
+        Args:
+            size (int): Number of bytes to read (default ``None``).
+                Fewer are returned only once the end of the body has
+                been reached. If ``None`` or -1, the remainder of the
+                body is read.
+
+        Returns:
+            bytes: Data read from the stream.
+
+        """
+
+        if size is None or size < 0:
+            size = -1
+
+        chunks = []
+        buffer = self._buffer
+
+        while size:
+            if self._pos == len(buffer):
+                if not await self._fill():
+                    break
+
+                buffer = self._buffer
+
+            chunk = self._take(size if size > 0 else len(buffer))
+            chunks.append(chunk)
+
+            if size > 0:
+                size -= len(chunk)
+
+        # PERF(kgriffs): Avoid copying a block that was read in one go.
+        if len(chunks) == 1:
+            return chunks[0]
+
+        return b''.join(chunks)
+
+    async def readall(self):
+        """Reads the remainder of the body.
+
+        Returns:
+            bytes: Data read from the stream.
+
+        """
+
+        return await self.read()
+
+    async def readinto(self, buffer):
+        """Reads from the stream into a preallocated, writable buffer.
+
+        Args:
+            buffer: Object supporting the buffer protocol, such as a
+                *bytearray* or a *memoryview* of one. It is filled
+                unless the end of the body is reached first.
+
+        Returns:
+            int: Number of bytes read into `buffer`.
+
+        """
+
+        view = memoryview(buffer).cast('B')
+        size = len(view)
+        count = 0
+
+        while count < size:
+            if self._pos == len(self._buffer) and not await self._fill():
+                break
+
+            # PERF(kgriffs): Copy straight from the received block, rather
+            # than via an intermediate bytes object.
+            start = self._pos
+            end = min(start + size - count, len(self._buffer))
+
+            view[count:count + end - start] = (
+                memoryview(self._buffer)[start:end])
+
+            count += end - start
+            self._pos = end
+
+        return count
+
+    def _take(self, size):
+        """Removes up to `size` bytes from the head of the buffer."""
+
+        buffer = self._buffer
+        start = self._pos
+        end = min(start + size, len(buffer))
+
+        self._pos = end
+
+        if start == 0 and end == len(buffer):
+            return buffer
+
+        return buffer[start:end]
+
+    async def _fill(self):
+        """Receives the next non-empty block of the body.
+
+        Returns:
+            bool: ``True`` if a block was received, or ``False`` if the
+            end of the body was reached instead.
+
+        """
+
+        while not self._eof:
+            event = await self._receive()
+
+            if event['type'] == 'http.disconnect':
+                self._eof = True
+
+                if self._bytes_remaining:
+                    raise _body_incomplete(self._bytes_remaining)
+
+                break
+
+            if not event.get('more_body', False):
+                self._eof = True
+
+            block = event.get('body')
+            if not block:
+                continue
+
+            remaining = self._bytes_remaining
+            if remaining is not None:
+                if len(block) >= remaining:
+                    block = block[:remaining]
+                    self._eof = True
+
+                self._bytes_remaining = remaining - len(block)
+
+            self.bytes_received += len(block)
+
+            max_size = self._max_size
+            if max_size is not None and self.bytes_received > max_size:
+                self._eof = True
+                raise _body_too_large(max_size)
+
+            self._buffer = block
+            self._pos = 0
+
+            return True
+
+        return False
+
+
+def _body_incomplete(bytes_remaining):
+    """Create the error for a body cut short by the client disconnecting."""
+
+    msg = ('The client disconnected before sending the remaining ' +
+           str(bytes_remaining) + ' bytes of the request body.')
+
+    return HTTPBadRequest('Incomplete request body', msg)
@@ -0,0 +1,271 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for testing ASGI apps in-process, without a server."""
+
+import asyncio
+
+import falcon.status_codes as status
+from falcon.testing.helpers import DEFAULT_HOST
+from falcon.util import uri
+
+# NOTE(kgriffs): ASGI only passes along the status code, so look up
+# the rest of the status line for the benefit of test assertions.
+_STATUS_LINES = dict(
+    (int(value[:3]), value)
+    for name, value in vars(status).items()
+    if name.startswith('HTTP_') and isinstance(value, str)
+)
+
+
+class Result(object):
+    """The response to a simulated request.
+
+    Attributes:
+        status (str): HTTP status line, such as "200 OK".
+        status_code (int): HTTP status code, such as 200.
+        headers (list): Response headers, as a list of
+            ``(name, value)`` tuples of strings.
+        headers_dict (dict): Response headers, keyed by lowercased
+            name. If a header was repeated, the last value wins.
+        chunks (list): Blocks of the body, in the order in which
+            they were sent by the app.
+        content (bytes): The complete body.
+        text (str): The body, decoded as UTF-8.
+
+    """
+
+    __slots__ = ('status_code', 'headers', 'chunks')
+
+    def __init__(self, status_code, headers, chunks):
+        self.status_code = status_code
+        self.headers = headers
+        self.chunks = chunks
+
+    @property
+    def status(self):
+        try:
+            return _STATUS_LINES[self.status_code]
+        except KeyError:
+            return str(self.status_code)
+
+    @property
+    def headers_dict(self):
+        return dict(self.headers)
+
+    @property
+    def content(self):
+        return b''.join(self.chunks)
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+
+def create_scope(path='/', query_string='', method='GET', headers=None,
+                 scheme='http', host=DEFAULT_HOST, port=None, root_path='',
+                 http_version='1.1'):
+    """Creates a mock ASGI connection scope for simulating HTTP requests.
+
+    Args:
+        path (str, optional): The path for the request (default '/').
+            Like ASGI servers, the path is percent-decoded.
+        query_string (str, optional): The query string to simulate,
+            without a leading '?' (default '')
+        method (str): The HTTP method to use (default 'GET')
+        headers (dict or list, optional): Headers as a dict or an
+            iterable collection of ``(key, value)`` tuples. A Host
+            header is added, unless one is given.
+        scheme (str): URL scheme, either 'http' or 'https' (default 'http')
+        host(str): Hostname for the request (default 'falconframework.org')
+        port (int, optional): The TCP port to simulate. Defaults to
+            the standard port used by the given scheme.
+        root_path (str): Path at which the app is mounted (default '')
+        http_version (str): HTTP version to simulate (default '1.1')
+
+    """
+
+    scheme = scheme.lower()
+    if port is None:
+        port = 80 if scheme == 'http' else 443
+
+    if headers is None:
+        headers = ()
+    elif isinstance(headers, dict):
+        headers = headers.items()
+
+    encoded_headers = [
+        (name.lower().encode('latin-1'), value.encode('latin-1'))
+        for name, value in headers
+    ]
+
+    if not any(name == b'host' for name, __ in encoded_headers):
+        host_header = host
+        if port != (80 if scheme == 'http' else 443):
+            host_header += ':' + str(port)
+
+        encoded_headers.append((b'host', host_header.encode('latin-1')))
+
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': http_version,
+        'method': method,
+        'scheme': scheme,
+        'path': root_path + uri.decode(path),
+        'root_path': root_path,
+        'query_string': query_string.encode('latin-1'),
+        'headers': encoded_headers,
+        'server': (host, port),
+        'client': ('127.0.0.1', 65133),
+    }
+
+
+def simulate_request(app, method='GET', path='/', query_string='',
+                     headers=None, body=b'', chunk_size=None, **kwargs):
+    """Simulates a request to an ASGI app, and returns the response.
+
+    The app is run to completion on a new event loop, talking to a
+    simulated server by way of the ASGI receive and send callables.
+    The server checks that the app follows the protocol, i.e., that it
+    starts the response before sending the body, and that it stops
+    sending events once the body is complete.
+
+    Args:
+        app: The ASGI app to call.
+        method (str): The HTTP method to use (default 'GET')
+        path (str): The path for the request (default '/')
+        query_string (str): The query string to simulate, without a
+            leading '?' (default '')
+        headers (dict or list): Request headers (default ``None``)
+        body (str or bytes): The request body (default ``b''``). A
+            Content-Length header is added for a non-empty body,
+            unless either it or Transfer-Encoding is given.
+        chunk_size (int): When given, the body is passed to the app in
+            blocks of at most this many bytes, rather than in a single
+            event (default ``None``).
+
+    Keyword Args:
+        Any other keyword arguments are passed to ``create_scope()``.
+
+    Returns:
+        Result: The response, as sent by the app.
+
+    """
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(simulate_request_async(
+            app, method=method, path=path, query_string=query_string,
+            headers=headers, body=body, chunk_size=chunk_size, **kwargs))
+    finally:
+        loop.close()
+
+
+async def simulate_request_async(app, method='GET', path='/', query_string='',
+                                 headers=None, body=b'', chunk_size=None,
+                                 **kwargs):
+    """Like ``simulate_request()``, but runs on the current event loop.
+
+    This makes it possible to simulate several requests concurrently,
+    e.g., by way of ``asyncio.gather()``.
+
+    """
+
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+
+    headers = list(dict(headers).items()) if headers else []
+    if body and not any(name.lower() in ('content-length',
+                                         'transfer-encoding')
+                        for name, __ in headers):
+        headers.append(('Content-Length', str(len(body))))
+
+    scope = create_scope(path=path, query_string=query_string,
+                         method=method, headers=headers, **kwargs)
+
+    server = _SimulatedServer(body, chunk_size)
+    await app(scope, server.receive, server.send)
+
+    if not server.complete.is_set():
+        raise RuntimeError('The app did not complete the response')
+
+    return Result(server.status_code, server.headers, server.chunks)
+
+
+class _SimulatedServer(object):
+    """Provides the ASGI receive and send callables for a request."""
+
+    def __init__(self, body, chunk_size):
+        events = []
+        if chunk_size:
+            for start in range(0, len(body), chunk_size):
+                events.append({
+                    'type': 'http.request',
+                    'body': body[start:start + chunk_size],
+                    'more_body': True,
+                })
+
+            events.append({'type': 'http.request'})
+        else:
+            events.append({'type': 'http.request', 'body': body})
+
+        events.reverse()
+
+        self.events = events
+        self.status_code = None
+        self.headers = None
+        self.chunks = []
+        self.complete = asyncio.Event()
+
+    async def receive(self):
+        if self.events:
+            return self.events.pop()
+
+        # NOTE(kgriffs): As with a real server, the client "disconnects"
+        # once the response has been sent.
+        await self.complete.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, event):
+        if self.complete.is_set():
+            raise RuntimeError('Event sent after the response was '
+                               'complete: ' + repr(event))
+
+        if self.status_code is None:
+            if event['type'] != 'http.response.start':
+                raise RuntimeError('Expected http.response.start, got: ' +
+                                   repr(event))
+
+            self.status_code = event['status']
+            self.headers = [
+                (name.decode('latin-1'), value.decode('latin-1'))
+                for name, value in event.get('headers', ())
+            ]
+
+            return
+
+        if event['type'] != 'http.response.body':
+            raise RuntimeError('Expected http.response.body, got: ' +
+                               repr(event))
+
+        block = event.get('body', b'')
+        if not isinstance(block, bytes):
+            raise RuntimeError('Body must be bytes, got: ' + repr(block))
+
+        if block:
+            self.chunks.append(block)
+
+        if not event.get('more_body', False):
+            self.complete.set()
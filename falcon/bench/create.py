@@ -38,6 +38,162 @@ def falcon(body, headers):
     return falcon_app
 
 
+def falcon_layers(body, headers):
+    """Like falcon(), but with several middleware components and hooks.
+
+    Used to measure the per-layer overhead of the request pipeline.
+    """
+
+    import falcon
+
+    class NoopMiddleware(object):
+        def process_request(self, req, resp, params):
+            pass
+
+        def process_response(self, req, resp):
+            pass
+
+    def noop_before(req, resp, resource, params):
+        pass
+
+    def noop_after(req, resp, resource):
+        pass
+
+    path = '/hello/{account_id}/test'
+    falcon_app = falcon.API('text/plain',
+                            before=[noop_before] * 3,
+                            after=[noop_after] * 3,
+                            middleware=[NoopMiddleware() for i in range(3)])
+
+    class HelloResource:
+        def on_get(self, req, resp, account_id):
+            user_agent = req.user_agent  # NOQA
+            limit = req.get_param('limit') or '10'  # NOQA
+            resp.data = body
+            resp.set_headers(headers)
+
+    falcon_app.add_route(path, HelloResource())
+
+    return falcon_app
+
+
+def falcon_hooks_0(body, headers):
+    """Like falcon(), but with the same resource as falcon_hooks_1().
+
+    Used as the baseline for measuring how the cost of hooks grows
+    with their number.
+    """
+
+    return _falcon_hooks(body, headers, 0)
+
+
+def falcon_hooks_1(body, headers):
+    """Like falcon(), but with 1 before and 1 after hook."""
+    return _falcon_hooks(body, headers, 1)
+
+
+def falcon_hooks_2(body, headers):
+    """Like falcon(), but with 2 before and 2 after hooks."""
+    return _falcon_hooks(body, headers, 2)
+
+
+def falcon_hooks_4(body, headers):
+    """Like falcon(), but with 4 before and 4 after hooks."""
+    return _falcon_hooks(body, headers, 4)
+
+
+def falcon_hooks_8(body, headers):
+    """Like falcon(), but with 8 before and 8 after hooks."""
+    return _falcon_hooks(body, headers, 8)
+
+
+def _falcon_hooks(body, headers, count):
+    """Create an app with `count` before and `count` after hooks.
+
+    About half of each are applied to the responder, and the rest to
+    the resource class.
+    """
+
+    import falcon
+
+    def noop_before(req, resp, resource, params):
+        pass
+
+    def noop_after(req, resp):
+        pass
+
+    def on_get(self, req, resp, account_id):
+        user_agent = req.user_agent  # NOQA
+        limit = req.get_param('limit') or '10'  # NOQA
+        resp.data = body
+        resp.set_headers(headers)
+
+    method_hooks = count - count // 2
+    for __ in range(method_hooks):
+        on_get = falcon.before(noop_before)(on_get)
+        on_get = falcon.after(noop_after)(on_get)
+
+    HelloResource = type('HelloResource', (object,), {'on_get': on_get})
+
+    for __ in range(count - method_hooks):
+        HelloResource = falcon.before(noop_before)(HelloResource)
+        HelloResource = falcon.after(noop_after)(HelloResource)
+
+    path = '/hello/{account_id}/test'
+    falcon_app = falcon.API('text/plain')
+    falcon_app.add_route(path, HelloResource())
+
+    return falcon_app
+
+
+def falcon_errors(body, headers):
+    """Like falcon(), but the responder raises an HTTPError.
+
+    Used to measure the overhead of the error path, including
+    constructing the error and serializing its representation.
+    """
+
+    import falcon
+
+    path = '/hello/{account_id}/test'
+    falcon_app = falcon.API('text/plain')
+
+    class HelloResource:
+        def on_get(self, req, resp, account_id):
+            raise falcon.HTTPUnauthorized(
+                'Authentication required',
+                'Please provide an auth token as part of the request.',
+                scheme='Token; realm="bench"',
+                href='http://example.com/api/auth')
+
+    falcon_app.add_route(path, HelloResource())
+
+    return falcon_app
+
+
+def falcon_errors_frozen(body, headers):
+    """Like falcon_errors(), but raises a prebuilt, frozen error."""
+
+    import falcon
+
+    path = '/hello/{account_id}/test'
+    falcon_app = falcon.API('text/plain')
+
+    auth_required = falcon.HTTPUnauthorized(
+        'Authentication required',
+        'Please provide an auth token as part of the request.',
+        scheme='Token; realm="bench"',
+        href='http://example.com/api/auth').freeze()
+
+    class HelloResource:
+        def on_get(self, req, resp, account_id):
+            raise auth_required
+
+    falcon_app.add_route(path, HelloResource())
+
+    return falcon_app
+
+
 def falcon_ext(body, headers):
     from falcon.bench.queues import api
     return api.create(body, headers)
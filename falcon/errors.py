@@ -215,6 +215,31 @@ class HTTPPreconditionFailed(HTTPError):
         HTTPError.__init__(self, status.HTTP_412, title, description, **kwargs)
 
 
+class HTTPRequestEntityTooLarge(HTTPError):
+    """413 Payload Too Large.
+
+    The server is refusing to process a request because the request
+    payload is larger than the server is willing or able to process.
+    (RFC 7231)
+
+    Args:
+        title (str): Error title (e.g., 'Request Body Limit Exceeded').
+        description (str): Human-friendly description of the error, along with
+            a helpful suggestion or two.
+        retry_after (date or int, optional): Value for the Retry-After
+            header, in case the condition is temporary (default *None*).
+        kwargs (optional): Same as for ``HTTPError``.
+
+    """
+
+    def __init__(self, title, description, retry_after=None, **kwargs):
+        if retry_after is not None:
+            headers = kwargs.setdefault('headers', {})
+            headers['Retry-After'] = str(retry_after)
+
+        HTTPError.__init__(self, status.HTTP_413, title, description, **kwargs)
+
+
 class HTTPUnsupportedMediaType(HTTPError):
     """415 Unsupported Media Type.
 
@@ -313,11 +338,13 @@ class HTTPInvalidHeader(HTTPBadRequest):
     def __init__(self, msg, header_name, **kwargs):
         description = ('The value provided for the {0} header is '
                        'invalid. {1}')
-        description = description.format(header_name, msg)
 
         super(HTTPInvalidHeader, self).__init__('Invalid header value',
                                                 description, **kwargs)
 
+        # PERF(kgriffs): Defer formatting until the description is used
+        self._description_args = (header_name, msg)
+
 
 class HTTPMissingHeader(HTTPBadRequest):
     """HTTP header is missing. Inherits from ``HTTPBadRequest``.
@@ -330,11 +357,13 @@ class HTTPMissingHeader(HTTPBadRequest):
 
     def __init__(self, header_name, **kwargs):
         description = ('The {0} header is required.')
-        description = description.format(header_name)
 
         super(HTTPMissingHeader, self).__init__('Missing header value',
                                                 description, **kwargs)
 
+        # PERF(kgriffs): Defer formatting until the description is used
+        self._description_args = (header_name,)
+
 
 class HTTPInvalidParam(HTTPBadRequest):
     """HTTP parameter is invalid. Inherits from ``HTTPBadRequest``.
@@ -348,11 +377,13 @@ class HTTPInvalidParam(HTTPBadRequest):
 
     def __init__(self, msg, param_name, **kwargs):
         description = 'The "{0}" query parameter is invalid. {1}'
-        description = description.format(param_name, msg)
 
         super(HTTPInvalidParam, self).__init__('Invalid query parameter',
                                                description, **kwargs)
 
+        # PERF(kgriffs): Defer formatting until the description is used
+        self._description_args = (param_name, msg)
+
 
 class HTTPMissingParam(HTTPBadRequest):
     """HTTP parameter is missing. Inherits from ``HTTPBadRequest``.
@@ -365,7 +396,9 @@ class HTTPMissingParam(HTTPBadRequest):
 
     def __init__(self, param_name, **kwargs):
         description = 'The "{0}" query parameter is required.'
-        description = description.format(param_name)
 
         super(HTTPMissingParam, self).__init__('Missing query parameter',
                                                description, **kwargs)
+
+        # PERF(kgriffs): Defer formatting until the description is used
+        self._description_args = (param_name,)
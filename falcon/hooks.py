@@ -19,6 +19,9 @@ import six
 
 from falcon import HTTP_METHODS
 
+# NOTE(kgriffs): Coroutine functions require Python 3.5+
+_iscoroutinefunction = getattr(inspect, 'iscoroutinefunction', None)
+
 
 def before(action):
     """Decorator to execute the given action function *before* the responder.
@@ -167,6 +170,90 @@ def _has_self(spec):
     return len(spec.args) > 0 and spec.args[0] == 'self'
 
 
+def _is_async(func):
+    """Checks whether the given hook or responder is a coroutine function.
+
+    Shims and wrappers are seen through by way of their ``__wrapped__``
+    attribute, and for callable objects, ``__call__`` is checked.
+
+    """
+
+    if _iscoroutinefunction is None:  # pragma: no cover
+        return False
+
+    if _iscoroutinefunction(func):
+        return True
+
+    func = getattr(func, '__wrapped__', func)
+
+    return (_iscoroutinefunction(func) or
+            _iscoroutinefunction(getattr(func, '__call__', None)))
+
+
+def _adapt_before(action):
+    """Adapt a "before" hook to the (req, resp, resource, params) signature.
+
+    Args:
+        action: A "before" hook, taking either (req, resp, params) or
+            (req, resp, resource, params).
+
+    Returns:
+        callable: `action` itself if it already accepts a `resource`
+        argument, or a shim that drops `resource` before calling it.
+
+    """
+
+    # NOTE(swistakm): introspect action function to guess if it can handle
+    # additional resource argument without breaking backwards compatibility
+    action_spec = _get_argspec(action)
+
+    if len(action_spec.args) == (5 if _has_self(action_spec) else 4):
+        return action
+
+    # TODO(kgriffs): This decorator does not work on callable
+    # classes in Python vesions prior to 3.4.
+    #
+    # @wraps(action)
+    def shim(req, resp, resource, kwargs):
+        # NOTE(kgriffs): Don't have to pass "self" even if has_self,
+        # since method is assumed to be bound.
+        return action(req, resp, kwargs)
+
+    shim.__wrapped__ = action
+    return shim
+
+
+def _adapt_after(action):
+    """Adapt an "after" hook to the (req, resp, resource) signature.
+
+    Args:
+        action: An "after" hook, taking either (req, resp) or
+            (req, resp, resource).
+
+    Returns:
+        callable: `action` itself if it already accepts a `resource`
+        argument, or a shim that drops `resource` before calling it.
+
+    """
+
+    # NOTE(swistakm): introspect action function to guess if it can handle
+    # additional resource argument without breaking backwards compatibility
+    spec = _get_argspec(action)
+
+    if len(spec.args) == (4 if _has_self(spec) else 3):
+        return action
+
+    # TODO(kgriffs): This decorator does not work on callable
+    # classes in Python vesions prior to 3.4.
+    #
+    # @wraps(action)
+    def shim(req, resp, resource):
+        return action(req, resp)
+
+    shim.__wrapped__ = action
+    return shim
+
+
 def _wrap_with_after(action, responder, resource=None, is_method=False):
     """Execute the given action function after a responder method.
 
@@ -182,38 +269,8 @@ def _wrap_with_after(action, responder, resource=None, is_method=False):
 
     """
 
-    # NOTE(swistakm): introspect action function to guess if it can handle
-    # additional resource argument without breaking backwards compatibility
-    spec = _get_argspec(action)
-
-    # NOTE(swistakm): create shim before checking what will be actually
-    # decorated. This helps to avoid excessive nesting
-    if len(spec.args) == (4 if _has_self(spec) else 3):
-        shim = action
-    else:
-        # TODO(kgriffs): This decorator does not work on callable
-        # classes in Python vesions prior to 3.4.
-        #
-        # @wraps(action)
-        def shim(req, resp, resource):
-            action(req, resp)
-
-    # NOTE(swistakm): method must be decorated differently than
-    # normal function
-    if is_method:
-        @wraps(responder)
-        def do_after(self, req, resp, **kwargs):
-            responder(self, req, resp, **kwargs)
-            shim(req, resp, self)
-    else:
-        assert resource is not None
-
-        @wraps(responder)
-        def do_after(req, resp, **kwargs):
-            responder(req, resp, **kwargs)
-            shim(req, resp, resource)
-
-    return do_after
+    assert is_method or resource is not None
+    return _wrap_with_hooks((), (action,), responder, resource, is_method)
 
 
 def _wrap_with_before(action, responder, resource=None, is_method=False):
@@ -231,61 +288,158 @@ def _wrap_with_before(action, responder, resource=None, is_method=False):
 
     """
 
-    # NOTE(swistakm): introspect action function to guess if it can handle
-    # additional resource argument without breaking backwards compatibility
-    action_spec = _get_argspec(action)
+    assert is_method or resource is not None
+    return _wrap_with_hooks((action,), (), responder, resource, is_method)
+
+
+def _wrap_with_hooks(before, after, responder, resource, is_method=False):
+    """Wrap responder on the given resource with "before" and "after" hooks.
+
+    Rather than nesting one closure per hook, all of the hooks are
+    called in turn from a single wrapper, after having been adapted to
+    a common signature in advance. If `responder` is itself such a
+    wrapper, the new hooks are merged with its own, so that however
+    many times a responder is decorated, and whether or not global
+    hooks are applied on top of that, it is only ever wrapped once.
+
+    Args:
+        before: An iterable of "before" hooks, to be run ahead of any
+            that `responder` was already wrapped with
+        after: An iterable of "after" hooks, to be run following any
+            that `responder` was already wrapped with
+        responder: A method of a resource to wrap
+        resource: A reference to the resource instance providing the
+            responder. Ignored when `is_method` is ``True``.
+        is_method: Whether or not `responder` is an unbound method
+            (default False), in which case the wrapper will pass its
+            `self` param to the hooks as the resource
+
+    """
+
+    # NOTE(kgriffs): Adapting a hook that was already adapted is a no-op,
+    # so API may pass in its prepared global hooks as-is.
+    before = tuple(_adapt_before(action) for action in before or ())
+    after = tuple(_adapt_after(action) for action in after or ())
+
+    if not (before or after):
+        return responder
+
+    unwrapped = _unwrap_hooks(responder, resource, is_method)
+    if unwrapped is not None:
+        responder, inner_before, inner_after = unwrapped
+
+        before += inner_before
+        after = inner_after + after
+
+    compile_hooks = _compile_hooks
+    compile_method_hooks = _compile_method_hooks
+
+    if any(_is_async(func) for func in (responder,) + before + after):
+        # NOTE(kgriffs): Imported here, since the module requires
+        # Python 3.5+.
+        from falcon.asgi import hooks as async_hooks
+
+        compile_hooks = async_hooks._compile_hooks
+        compile_method_hooks = async_hooks._compile_method_hooks
 
-    # NOTE(swistakm): create shim before checking what will be actually
-    # decorated. This allows to avoid excessive nesting
-    if len(action_spec.args) == (5 if _has_self(action_spec) else 4):
-        shim = action
-    else:
-        # TODO(kgriffs): This decorator does not work on callable
-        # classes in Python vesions prior to 3.4.
-        #
-        # @wraps(action)
-        def shim(req, resp, resource, kwargs):
-            # NOTE(kgriffs): Don't have to pass "self" even if has_self,
-            # since method is assumed to be bound.
-            action(req, resp, kwargs)
-
-    # NOTE(swistakm): method must be decorated differently than
-    # normal function
     if is_method:
-        @wraps(responder)
-        def do_before(self, req, resp, **kwargs):
-            shim(req, resp, self, kwargs)
-            responder(self, req, resp, **kwargs)
+        do_hooks = compile_method_hooks(before, after, responder)
     else:
-        assert resource is not None
-
-        @wraps(responder)
-        def do_before(req, resp, **kwargs):
-            shim(req, resp, resource, kwargs)
-            responder(req, resp, **kwargs)
+        do_hooks = compile_hooks(before, after, responder, resource)
 
-    return do_before
+    do_hooks._falcon_hooks = (do_hooks, responder, resource, before, after,
+                              is_method)
+    return do_hooks
 
 
-def _wrap_with_hooks(before, after, responder, resource):
-    """Wrap responder on the given resource with "before" and "after" hooks.
+def _unwrap_hooks(responder, resource, is_method):
+    """Look inside a wrapper that was created by ``_wrap_with_hooks()``.
 
     Args:
-        before: An iterable of one or more "before" hooks
-        after: An iterable of one or more "after" hooks
-        responder: A method of a resource to wrap
-        resource: A reference to the resource instance providing the responder
+        responder: The responder that is about to be wrapped.
+        resource: The resource instance providing the responder, if any.
+        is_method: Whether or not `responder` is an unbound method.
+
+    Returns:
+        tuple: ``(responder, before, after)``, where `responder` is the
+        one originally wrapped (bound to `resource`, if need be), and
+        `before` and `after` are the tuples of adapted hooks it was
+        wrapped with; or ``None`` if `responder` is not a wrapper, or
+        can not be merged with.
 
     """
 
-    if after is not None:
+    func = getattr(responder, '__func__', responder)
+    hooks = getattr(func, '_falcon_hooks', None)
+
+    # NOTE(kgriffs): functools.wraps() copies the marker to any other
+    # decorator that is applied on top of one of our wrappers, in which
+    # case that decorator must not be bypassed.
+    if hooks is None or hooks[0] is not func:
+        return None
+
+    __, inner, __, before, after, inner_is_method = hooks
+
+    if not inner_is_method:
+        return None
+
+    if not is_method:
+        # NOTE(kgriffs): The hooks were applied to the resource's class
+        # by way of the decorators, and global hooks are now being
+        # applied on top for a given instance of that class.
+        bind = getattr(inner, '__get__', None)
+        bound_to = getattr(responder, '__self__', None)
+
+        if bind is None or bound_to is not resource:
+            return None
+
+        inner = bind(resource, type(resource))
+
+    return inner, before, after
+
+
+def _compile_hooks(before, after, responder, resource):
+    """Create a single wrapper that runs hooks around a bound responder."""
+
+    @wraps(responder)
+    def do_hooks(req, resp, **kwargs):
+        # NOTE(kgriffs): Hooks are executed in natural (first...last)
+        # order. If one of them, or the responder, sets an error on the
+        # response, the rest are skipped, as if the error was raised.
+        for action in before:
+            action(req, resp, resource, kwargs)
+
+            if resp._error is not None:
+                return
+
+        responder(req, resp, **kwargs)
+
+        for action in after:
+            if resp._error is not None:
+                return
+
+            action(req, resp, resource)
+
+    return do_hooks
+
+
+def _compile_method_hooks(before, after, responder):
+    """Like ``_compile_hooks()``, but wraps an unbound method."""
+
+    @wraps(responder)
+    def do_hooks(self, req, resp, **kwargs):
+        for action in before:
+            action(req, resp, self, kwargs)
+
+            if resp._error is not None:
+                return
+
+        responder(self, req, resp, **kwargs)
+
         for action in after:
-            responder = _wrap_with_after(action, responder, resource)
+            if resp._error is not None:
+                return
 
-    if before is not None:
-        # Wrap in reversed order to achieve natural (first...last)
-        # execution order.
-        for action in reversed(before):
-            responder = _wrap_with_before(action, responder, resource)
+            action(req, resp, self)
 
-    return responder
+    return do_hooks
@@ -23,9 +23,15 @@ if sys.version_info < (2, 7):  # pragma: no cover
 else:  # pragma: no cover
     from collections import OrderedDict
 
+from falcon.response_helpers import HeaderSet
 from falcon.util import uri
 
 
+# NOTE(kgriffs): Read-only subclasses created by HTTPError.freeze(),
+# keyed by the class of the error being frozen.
+_frozen_types = {}
+
+
 class HTTPError(Exception):
     """Represents a generic HTTP error.
 
@@ -44,11 +50,17 @@ class HTTPError(Exception):
         title (str): Error title to send to the client. Will be ``None`` if
             the error should result in an HTTP response with an empty body.
         description (str): Description of the error to send to the client.
-        headers (dict): Extra headers to add to the response.
-        link (str): An href that the client can provide to the user for
-            getting help.
+        headers (dict): Extra headers to add to the response. Once the
+            error is frozen, this will be a
+            :py:class:`~.HeaderSet` instead.
+        link (dict): An href that the client can provide to the user for
+            getting help, along with its text and relation type. The
+            dictionary is built on first access, rather than when
+            the error is raised.
         code (int): An internal application code that a user can reference when
             requesting support for the error.
+        frozen (bool): ``True`` if :py:meth:`~.freeze` was called on the
+            error, in which case it can no longer be modified.
 
     Args:
         status (str): HTTP status code and text, such as "400 Bad Request"
@@ -89,32 +101,130 @@ class HTTPError(Exception):
     __slots__ = (
         'status',
         'title',
-        'description',
+        '_description',
+        '_description_args',
         'headers',
-        'link',
+        '_href',
+        '_href_text',
+        '_link',
         'code',
     )
 
+    frozen = False
+
     def __init__(self, status, title=None, description=None, headers=None,
                  href=None, href_text=None, code=None):
         self.status = status
         self.title = title
-        self.description = description
         self.headers = headers
         self.code = code
 
-        if href:
-            link = self.link = OrderedDict()
-            link['text'] = (href_text or 'API documention for this error')
-            link['href'] = uri.encode(href)
-            link['rel'] = 'help'
-        else:
-            self.link = None
+        self._description = description
+        self._description_args = None
+
+        # PERF(kgriffs): Defer building the link until the error is
+        # serialized, since errors are often raised only to be caught
+        # and handled by the app itself.
+        self._href = href
+        self._href_text = href_text
+        self._link = None
 
     @property
     def has_representation(self):
         return True
 
+    @property
+    def description(self):
+        description = self._description
+
+        # NOTE(kgriffs): Child classes may pass a template for the
+        # description, along with its arguments, in which case the
+        # description is formatted on first access.
+        args = self._description_args
+        if args is not None:
+            description = self._description = description.format(*args)
+            self._description_args = None
+
+        return description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._description_args = None
+
+    @property
+    def link(self):
+        link = self._link
+
+        if link is None and self._href:
+            link = self._link = OrderedDict()
+            link['text'] = (self._href_text or
+                            'API documention for this error')
+            link['href'] = uri.encode(self._href)
+            link['rel'] = 'help'
+
+        return link
+
+    @link.setter
+    def link(self, value):
+        self._link = value
+        self._href = None
+
+    def freeze(self):
+        """Makes the error immutable, so that it can be raised repeatedly.
+
+        Errors that do not vary from one request to the next, such as
+        a 404 with no body, or a 401 that always carries the same
+        WWW-Authenticate header, can be created and frozen once, at
+        module or resource level, and then raised over and over
+        again. That way, the cost of constructing the error, formatting
+        its description, building its link, and normalizing its headers
+        is only paid once::
+
+            NOT_FOUND = falcon.HTTPNotFound().freeze()
+
+            AUTH_REQUIRED = falcon.HTTPUnauthorized(
+                'Authentication required',
+                'Please provide an auth token as part of the request.',
+                scheme='Token; realm="example"').freeze()
+
+            class ThingsResource(object):
+                def on_get(self, req, resp, thing_id):
+                    if req.auth is None:
+                        raise AUTH_REQUIRED
+
+                    if thing_id not in self._things:
+                        raise NOT_FOUND
+
+        Once frozen, the error's attributes can no longer be set, and
+        its headers are converted to a :py:class:`~.HeaderSet`, so that
+        they can be shared with each response.
+
+        Note:
+            The error's class is replaced with a read-only subclass of
+            the same name, so ``isinstance()`` checks and error handlers
+            registered for the original class are unaffected.
+
+        Returns:
+            HTTPError: The error itself, for convenience.
+
+        """
+
+        if self.frozen:
+            return self
+
+        # NOTE(kgriffs): Resolve everything that is otherwise computed
+        # lazily, since the error can not be modified after this.
+        self.description
+        self.link
+
+        if self.headers is not None and not isinstance(self.headers,
+                                                       HeaderSet):
+            self.headers = HeaderSet(self.headers)
+
+        self.__class__ = _get_frozen_type(type(self))
+        return self
+
     def to_dict(self, obj_type=dict):
         """Returns a basic dictionary representing the error.
 
@@ -148,8 +258,14 @@ class HTTPError(Exception):
 
         return obj
 
-    def to_json(self):
-        """Returns a pretty-printed JSON representation of the error.
+    def to_json(self, compact=False):
+        """Returns a JSON representation of the error.
+
+        Keyword Args:
+            compact (bool): Set to ``True`` to omit indentation and any
+                whitespace between tokens, which makes the document
+                smaller and faster to generate (default ``False``, i.e.,
+                pretty-print the document).
 
         Returns:
             A JSON document for the error.
@@ -157,6 +273,10 @@ class HTTPError(Exception):
         """
 
         obj = self.to_dict(OrderedDict)
+
+        if compact:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
         return json.dumps(obj, indent=4, separators=(',', ': '),
                           ensure_ascii=False)
 
@@ -213,3 +333,37 @@ class NoRepresentation(object):
     @property
     def has_representation(self):
         return False
+
+
+def _frozen_setattr(self, name, value):
+    # NOTE(kgriffs): Allow the interpreter's own attributes, such as
+    # __traceback__, to be reset.
+    if name.startswith('__'):
+        Exception.__setattr__(self, name, value)
+        return
+
+    raise AttributeError('Frozen errors can not be modified')
+
+
+def _frozen_delattr(self, name):
+    raise AttributeError('Frozen errors can not be modified')
+
+
+def _get_frozen_type(error_type):
+    """Returns a read-only subclass of the given HTTPError type."""
+
+    try:
+        return _frozen_types[error_type]
+    except KeyError:
+        pass
+
+    frozen_type = type(error_type.__name__, (error_type,), {
+        '__slots__': (),
+        '__module__': error_type.__module__,
+        '__doc__': error_type.__doc__,
+        '__setattr__': _frozen_setattr,
+        '__delattr__': _frozen_delattr,
+        'frozen': True,
+    })
+
+    return _frozen_types.setdefault(error_type, frozen_type)
@@ -0,0 +1,236 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from falcon.response_helpers import HeaderSet, join_data
+import falcon.status_codes as status
+from falcon.util import LRUCache
+
+
+DEFAULT_CACHEABLE_STATUSES = frozenset([
+    status.HTTP_200,
+    status.HTTP_203,
+    status.HTTP_301,
+    status.HTTP_404,
+    status.HTTP_410,
+])
+"""Status codes of responses that are cached by default."""
+
+# NOTE(kgriffs): Rough per-entry overhead, in bytes, used when
+# accounting for the memory budget.
+_ENTRY_OVERHEAD = 256
+
+
+class ResponseCacheMiddleware(object):
+    """Caches responses to GET and HEAD requests in process memory.
+
+    Responses are cached only when they carry a Cache-Control header
+    with a positive "s-maxage" or "max-age" directive (or when a
+    `default_ttl` is given), and do not specify "no-store" or
+    "private". Responses that set cookies, use "Vary: \\*", or stream
+    their content are never cached. Nor are responses to requests that
+    carry an Authorization header, unless the response explicitly
+    allows it with a "public" or "s-maxage" directive (see also
+    RFC 7234, Section 3.2), since the cache is shared by all clients.
+
+    Cache keys consist of the request method, `req.relative_uri`, and
+    the values of any request headers named by the response's Vary
+    header, so that, e.g., compressed and uncompressed variants of a
+    resource are cached separately.
+
+    On a hit, the cached status, headers and encoded body are replayed
+    from *process_request*, and the response is marked as complete so
+    that any remaining middleware, along with the responder and its
+    hooks, are skipped. An Age header is added to replayed responses.
+
+    Entries are evicted in least-recently-used order once the total
+    size of the cached bodies and headers exceeds `max_bytes`. The
+    cache is shared by all threads serving the app.
+
+    Example::
+
+        import falcon
+        from falcon.middleware import ResponseCacheMiddleware
+
+        api = falcon.API(middleware=[ResponseCacheMiddleware()])
+
+    Note:
+        This component should come first in the list of middleware
+        passed to :py:class:`~.API`, so that cache hits bypass the
+        other components, and so that what is cached is the final
+        response, as modified by every other component.
+
+    Keyword Args:
+        max_bytes (int): Memory budget for the cache, in bytes
+            (default 64 MiB).
+        default_ttl (float): Number of seconds to cache responses that
+            do not specify a max-age (default ``None``, i.e., do not
+            cache such responses).
+        statuses (iterable of str): Status lines of cacheable responses
+            (default ``DEFAULT_CACHEABLE_STATUSES``).
+
+    """
+
+    __slots__ = ('_cache', '_default_ttl', '_statuses')
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, default_ttl=None,
+                 statuses=DEFAULT_CACHEABLE_STATUSES):
+
+        self._cache = LRUCache(max_bytes, sizeof=_sizeof)
+        self._default_ttl = default_ttl
+        self._statuses = frozenset(statuses)
+
+    def process_request(self, req, resp, params):
+        if req.method not in ('GET', 'HEAD'):
+            return
+
+        base_key = (req.method, req.relative_uri)
+
+        # NOTE(kgriffs): The names of the headers that the cached
+        # response varies on are themselves cached under the base key.
+        vary = self._cache.get(base_key)
+        if vary is None:
+            return
+
+        key = base_key + (tuple(req.get_header(name) for name in vary),)
+
+        entry = self._cache.get(key)
+        if entry is None:
+            return
+
+        now = time.time()
+        if entry.expires <= now:
+            self._cache.pop(key)
+            return
+
+        resp.status = entry.status
+        resp.set_headers(entry.headers)
+        resp.set_header('Age', str(int(now - entry.created)))
+        resp.data = entry.data
+
+        resp.complete = True
+
+    def process_response(self, req, resp):
+        if resp.complete or req.method not in ('GET', 'HEAD'):
+            return
+
+        if resp.status not in self._statuses:
+            return
+
+        if resp.stream is not None or resp._cookies is not None:
+            return
+
+        ttl = self._get_ttl(resp, req.auth is not None)
+        if not ttl:
+            return
+
+        vary = resp.vary
+        if vary is None:
+            vary = ()
+        else:
+            vary = tuple(name.strip().lower() for name in vary.split(','))
+            if '*' in vary:
+                return
+
+        data = resp.body_encoded
+        if data is None and resp.data is not None:
+            data = join_data(resp.data)
+
+        now = time.time()
+
+        entry = _CacheEntry()
+        entry.status = resp.status
+        entry.headers = HeaderSet(resp._wsgi_headers())
+        entry.data = data
+        entry.created = now
+        entry.expires = now + ttl
+
+        base_key = (req.method, req.relative_uri)
+        key = base_key + (tuple(req.get_header(name) for name in vary),)
+
+        self._cache.set(base_key, vary)
+        self._cache.set(key, entry)
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._cache.clear()
+
+    def _get_ttl(self, resp, authorized):
+        """Derive the number of seconds to cache a response, if any."""
+
+        cache_control = resp.cache_control
+        if cache_control is None:
+            return None if authorized else self._default_ttl
+
+        max_age = None
+        shared_max_age = None
+        public = False
+
+        for directive in cache_control.lower().split(','):
+            name, _, value = directive.strip().partition('=')
+
+            if name in ('no-store', 'private', 'no-cache'):
+                return None
+
+            if name == 'public':
+                public = True
+
+            if name == 'max-age' or name == 's-maxage':
+                try:
+                    seconds = int(value.strip('"'))
+                except ValueError:
+                    return None
+
+                if name == 'max-age':
+                    max_age = seconds
+                else:
+                    shared_max_age = seconds
+
+        if shared_max_age is not None:
+            return shared_max_age
+
+        # NOTE(kgriffs): The response was meant for the client that
+        # authorized the request, not for everyone sharing the cache.
+        if authorized and not public:
+            return None
+
+        if max_age is not None:
+            return max_age
+
+        return self._default_ttl
+
+
+class _CacheEntry(object):
+    """A cached response."""
+
+    __slots__ = ('created', 'data', 'expires', 'headers', 'status')
+
+
+def _sizeof(value):
+    """Estimate the memory used by a cached value, in bytes."""
+
+    if isinstance(value, _CacheEntry):
+        size = _ENTRY_OVERHEAD
+
+        if value.data is not None:
+            size += len(value.data)
+
+        for name, header_value in value.headers.items():
+            size += len(name) + len(header_value)
+
+        return size
+
+    # NOTE(kgriffs): A tuple of header names under a base key
+    return _ENTRY_OVERHEAD + sum(len(name) for name in value)
@@ -0,0 +1,307 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import zlib
+
+from falcon import DEFAULT_MEDIA_TYPE
+from falcon.response_helpers import join_data
+import falcon.status_codes as status
+
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+    'text/',
+)
+"""Media type prefixes that are compressed by default."""
+
+# NOTE(kgriffs): Window bits for zlib.compressobj(). Adding 16 to
+# MAX_WBITS tells zlib to write a gzip header and trailer, while
+# MAX_WBITS by itself results in the zlib format that HTTP calls
+# "deflate" (see also RFC 7230, Section 4.2.2).
+_WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+_SKIP_STATUS_CODES = set([
+    status.HTTP_100,
+    status.HTTP_101,
+    status.HTTP_204,
+    status.HTTP_206,
+    status.HTTP_304,
+])
+
+
+class CompressionMiddleware(object):
+    """Compresses response content using gzip or deflate.
+
+    The content coding is negotiated with the client using the
+    Accept-Encoding request header. When the client accepts both,
+    gzip is preferred unless the client gives deflate a higher
+    q-value.
+
+    Fully-buffered content (i.e., `resp.body` or `resp.data`) is
+    compressed in one go and stored in `resp.data`, so that the
+    framework will set Content-Length to the length of the compressed
+    content. Streamed content is compressed incrementally as the WSGI
+    server iterates over the response, in which case `resp.stream_len`
+    is cleared since the compressed length is not known in advance.
+
+    Responses are left untouched if they already specify a
+    Content-Encoding, if they carry a Content-Range or a
+    "Cache-Control: no-transform" directive, or if their status
+    code does not allow for a body. A strong ETag is converted
+    to a weak one when the response is compressed, since the
+    compressed representation is not byte-for-byte identical to the
+    original.
+
+    Example::
+
+        import falcon
+        from falcon.middleware import CompressionMiddleware
+
+        api = falcon.API(middleware=[CompressionMiddleware()])
+
+    Note:
+        This component should come first in the list of middleware
+        passed to :py:class:`~.API`, so that its *process_response*
+        method runs after that of every other component.
+
+    Keyword Args:
+        min_size (int): Content smaller than this number of bytes is
+            not compressed, since the savings would not make up for the
+            overhead (default 1024). When a stream is given without
+            a `stream_len`, it is always compressed.
+        level (int): zlib compression level, from 1 (fastest) to
+            9 (smallest), or -1 for zlib's default (default 6).
+        media_types (tuple of str): Media type prefixes that are
+            eligible for compression, such as 'application/json' or
+            'text/' (default ``DEFAULT_COMPRESSIBLE_TYPES``).
+        default_media_type (str): Media type to assume for responses
+            that do not set Content-Type explicitly. This should match
+            the `media_type` passed to :py:class:`~.API`
+            (default ``falcon.DEFAULT_MEDIA_TYPE``).
+        block_size (int): Number of bytes to read from a file-like
+            `resp.stream` at a time (default 64 KiB).
+
+    """
+
+    __slots__ = ('_block_size', '_default_media_type', '_level',
+                 '_media_types', '_min_size')
+
+    def __init__(self, min_size=1024, level=6,
+                 media_types=DEFAULT_COMPRESSIBLE_TYPES,
+                 default_media_type=DEFAULT_MEDIA_TYPE,
+                 block_size=64 * 1024):
+
+        self._min_size = min_size
+        self._level = level
+        self._media_types = tuple(t.lower() for t in media_types)
+        self._default_media_type = default_media_type.lower()
+        self._block_size = block_size
+
+    def process_response(self, req, resp):
+        if resp.status in _SKIP_STATUS_CODES:
+            return
+
+        if not self._is_eligible(resp):
+            return
+
+        _vary_on_accept_encoding(resp)
+
+        coding = negotiate_encoding(req.get_header('Accept-Encoding'))
+        if coding is None:
+            return
+
+        data = resp.body_encoded
+        if data is None and resp.data is not None:
+            data = join_data(resp.data)
+
+        if data is not None:
+            if len(data) < self._min_size:
+                return
+
+            compressor = zlib.compressobj(self._level, zlib.DEFLATED,
+                                          _WBITS[coding])
+
+            compressed = compressor.compress(data) + compressor.flush()
+
+            # NOTE(kgriffs): Small or already-compressed content may not
+            # shrink at all, in which case it is cheaper for everyone
+            # to send it as-is.
+            if len(compressed) >= len(data):
+                return
+
+            resp.body = None
+            resp.data = compressed
+
+        elif resp.stream is not None:
+            if (resp.stream_len is not None and
+                    resp.stream_len < self._min_size):
+                return
+
+            resp.stream = self._compress_stream(resp.stream, coding)
+            resp.stream_len = None
+
+        else:
+            return
+
+        resp.set_header('Content-Encoding', coding)
+
+        etag = resp.etag
+        if etag is not None and not etag.startswith('W/'):
+            resp.etag = 'W/' + etag
+
+    def _is_eligible(self, resp):
+        """Check whether the response's content may be compressed."""
+
+        if resp.get_header('Content-Encoding') is not None:
+            return False
+
+        if resp.content_range is not None:
+            return False
+
+        cache_control = resp.cache_control
+        if cache_control is not None and (
+                'no-transform' in cache_control.lower()):
+            return False
+
+        media_type = resp.content_type
+        if media_type is None:
+            media_type = self._default_media_type
+        else:
+            media_type = media_type.lower()
+
+        return media_type.startswith(self._media_types)
+
+    def _compress_stream(self, stream, coding):
+        """Lazily compress a file-like object or an iterable of blocks."""
+
+        compressor = zlib.compressobj(self._level, zlib.DEFLATED,
+                                      _WBITS[coding])
+
+        return _CompressedStream(stream, compressor, self._block_size)
+
+
+class _CompressedStream(object):
+    """Iterable that compresses the blocks of a stream as they are read.
+
+    The WSGI server is required to call close() on the iterable that it
+    is given, whether or not it iterated over it (e.g., it never does
+    for a HEAD request), so the source stream is closed from there as
+    well as once it has been exhausted.
+
+    Args:
+        stream: File-like object or iterable of blocks to compress.
+        compressor: zlib compression object.
+        block_size (int): Number of bytes to read from a file-like
+            `stream` at a time.
+
+    """
+
+    __slots__ = ('_block_size', '_compressor', '_stream')
+
+    def __init__(self, stream, compressor, block_size):
+        self._stream = stream
+        self._compressor = compressor
+        self._block_size = block_size
+
+    def __iter__(self):
+        stream = self._stream
+        compressor = self._compressor
+
+        if hasattr(stream, 'read'):
+            block_size = self._block_size
+            blocks = iter(lambda: stream.read(block_size), b'')
+        else:
+            blocks = stream
+
+        try:
+            for block in blocks:
+                compressed = compressor.compress(block)
+
+                # NOTE(kgriffs): zlib buffers its output internally, so
+                # don't bother the WSGI server with empty chunks.
+                if compressed:
+                    yield compressed
+
+            yield compressor.flush()
+
+        finally:
+            self.close()
+
+    def close(self):
+        close = getattr(self._stream, 'close', None)
+        if close is not None:
+            close()
+
+
+def negotiate_encoding(accept_encoding):
+    """Choose a content coding based on an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): Value of the Accept-Encoding header, or
+            ``None`` if the header was not present.
+
+    Returns:
+        str: Either 'gzip' or 'deflate', or ``None`` if the client does
+        not accept either coding.
+
+    """
+
+    if not accept_encoding:
+        return None
+
+    qvalues = {}
+
+    for coding in accept_encoding.split(','):
+        coding, _, params = coding.partition(';')
+
+        qvalue = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+
+        qvalues[coding.strip().lower()] = qvalue
+
+    default = qvalues.get('*', 0.0)
+
+    gzip_q = qvalues.get('gzip', qvalues.get('x-gzip', default))
+    deflate_q = qvalues.get('deflate', default)
+
+    if gzip_q > 0 and gzip_q >= deflate_q:
+        return 'gzip'
+
+    if deflate_q > 0:
+        return 'deflate'
+
+    return None
+
+
+def _vary_on_accept_encoding(resp):
+    """Add Accept-Encoding to the response's Vary header, if missing."""
+
+    vary = resp.vary
+
+    if vary is None:
+        resp.vary = ('Accept-Encoding',)
+    elif vary != '*' and 'accept-encoding' not in vary.lower():
+        resp.vary = (vary, 'Accept-Encoding')
@@ -0,0 +1,133 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+
+from falcon.response_helpers import join_data
+import falcon.status_codes as status
+from falcon import util
+
+
+class ConditionalGetMiddleware(object):
+    """Answers conditional GET and HEAD requests with "304 Not Modified".
+
+    After the responder has run, the If-None-Match and If-Modified-Since
+    request headers are compared against the response's ETag and
+    Last-Modified headers using
+    :py:meth:`~.Request.matches_validators`. When the client's
+    copy is still fresh, the response is converted to a 304, and its
+    body is discarded before the WSGI server has a chance to iterate
+    over it.
+
+    If the responder did not set an ETag, a strong one is derived from
+    a hash of the buffered response body (i.e., `resp.body` or
+    `resp.data`). Streamed responses are never hashed, since that would
+    require consuming the stream.
+
+    Responders that can determine their validators cheaply should
+    also call :py:meth:`~.Request.matches_validators` themselves,
+    so that they can skip serializing the body altogether.
+
+    Example::
+
+        import falcon
+        from falcon.middleware import ConditionalGetMiddleware
+
+        api = falcon.API(middleware=[ConditionalGetMiddleware()])
+
+    Note:
+        When used together with :py:class:`~.CompressionMiddleware`,
+        this component should come after it in the list of middleware,
+        so that 304 responses are not needlessly compressed.
+
+    Keyword Args:
+        auto_etag (bool): Set to ``False`` to disable computing an
+            ETag for responses that do not already have one
+            (default ``True``).
+
+    """
+
+    __slots__ = ('_auto_etag',)
+
+    def __init__(self, auto_etag=True):
+        self._auto_etag = auto_etag
+
+    def process_response(self, req, resp):
+        if resp.status != status.HTTP_200:
+            return
+
+        if req.method not in ('GET', 'HEAD'):
+            return
+
+        etag = resp.etag
+        if etag is None and self._auto_etag:
+            data = resp.body_encoded
+            if data is None and resp.data is not None:
+                data = join_data(resp.data)
+
+            if data is not None:
+                etag = resp.etag = compute_etag(data)
+
+        last_modified = resp.last_modified
+        if last_modified is not None:
+            try:
+                last_modified = util.http_date_to_dt(last_modified)
+            except ValueError:
+                last_modified = None
+
+        if req.matches_validators(etag, last_modified):
+            set_not_modified(resp)
+
+
+def compute_etag(data):
+    """Computes a strong entity tag for the given content.
+
+    Args:
+        data (bytes): Content of the representation.
+
+    Returns:
+        str: A quoted entity tag, suitable for use as the value of
+        the ETag response header.
+
+    """
+
+    # PERF(kgriffs): MD5 is used for speed. The tag only needs to change
+    # when the content does, so collision resistance is not a concern.
+    return '"' + hashlib.md5(data).hexdigest() + '"'
+
+
+def set_not_modified(resp):
+    """Converts a response to "304 Not Modified".
+
+    The response's body, data and stream are cleared, and the stream
+    is closed if it has a close() method. Headers are left as-is,
+    since RFC 7232 requires validators and caching headers to be sent
+    along with a 304.
+
+    Args:
+        resp (Response): The response to convert.
+
+    """
+
+    stream = resp.stream
+    if stream is not None:
+        close = getattr(stream, 'close', None)
+        if close is not None:
+            close()
+
+    resp.status = status.HTTP_304
+    resp.body = None
+    resp.data = None
+    resp.stream = None
+    resp.stream_len = None
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 from datetime import datetime
 
 try:
@@ -42,6 +43,12 @@ TRUE_STRINGS = ('true', 'True', 'yes')
 FALSE_STRINGS = ('false', 'False', 'no')
 WSGI_CONTENT_HEADERS = ('CONTENT_TYPE', 'CONTENT_LENGTH')
 
+# NOTE(kgriffs): The 'q' type code (signed long long) is not
+# available under Python 2.
+DEFAULT_ARRAY_TYPECODE = 'q' if six.PY3 else 'l'
+FLOAT_TYPECODES = ('f', 'd')
+NUMERIC_TYPECODES = frozenset('bBhHiIlLqQfd' if six.PY3 else 'bBhHiIlLfd')
+
 
 _maybe_wrap_wsgi_stream = True
 
@@ -121,6 +128,18 @@ class Request(object):
                 encoded according to the standard W3C algorithm (see
                 also http://goo.gl/6rlcux).
 
+            Note:
+                Falcon never reads `stream` before routing the request
+                when the client sent "Expect: 100-continue", or when
+                ``RequestOptions.max_content_length`` is set. Form
+                parameters are parsed in this case after the
+                *process_request* middleware methods have been executed,
+                just before the responder is called. Since WSGI servers
+                send the "100 Continue" interim response when the app
+                first reads from the input stream, a request that is
+                rejected by a middleware component is answered without
+                the client ever sending the body.
+
         date (datetime): Value of the Date header, converted to a
             `datetime.datetime` instance. The header value is assumed to
             conform to RFC 1123.
@@ -157,6 +176,10 @@ class Request(object):
             ``get_header`` method or one of the convenience attributes
             instead, to get a value for a specific header.
 
+        cookies (dict): A dict of name/value cookie pairs, parsed from
+            the Cookie header the first time this attribute is accessed.
+            The same dict is returned on subsequent accesses, so it
+            should be treated as read-only. (See also RFC 6265)
         params (dict): The mapping of request query parameter names to their
             values.  Where the parameter appears multiple times in the query
             string, the value mapped to that parameter key will be a list of
@@ -166,6 +189,8 @@ class Request(object):
     """
 
     __slots__ = (
+        '_body_pending',
+        '_cached_cookies',
         '_cached_headers',
         '_cached_uri',
         '_cached_relative_uri',
@@ -230,6 +255,7 @@ class Request(object):
         else:
             self.query_string = six.text_type()
 
+        self._cached_cookies = None
         self._cached_headers = None
         self._cached_uri = None
         self._cached_relative_uri = None
@@ -252,12 +278,22 @@ class Request(object):
                 # will continue using the same type for wsgi.input.
                 _maybe_wrap_wsgi_stream = False
 
-        # PERF(kgriffs): Technically, we should spend a few more
-        # cycles and parse the content type for real, but
-        # this heuristic will work virtually all the time.
-        if (self.content_type is not None and
-                'application/x-www-form-urlencoded' in self.content_type):
-            self._parse_form_urlencoded()
+        # NOTE(kgriffs): When a maximum content length is configured,
+        # the body must not be touched until the limit has been
+        # checked by the framework.
+        self._body_pending = self.options.max_content_length is not None
+
+        if self._has_form_body():
+            # NOTE(kgriffs): If the client is waiting for a
+            # "100 Continue" interim response before sending the body,
+            # defer reading it until the request has been routed and
+            # has passed through the process_request middleware, so
+            # that the request can still be rejected without the
+            # client ever transmitting the body.
+            if self._body_pending or self._expects_continue():
+                self._body_pending = True
+            else:
+                self._parse_form_urlencoded()
 
     # ------------------------------------------------------------------------
     # Properties
@@ -474,6 +510,20 @@ class Request(object):
     def params(self):
         return self._params
 
+    @property
+    def cookies(self):
+        if self._cached_cookies is None:
+            # PERF(kgriffs): try..except is faster than .get
+            try:
+                header_value = self.env['HTTP_COOKIE']
+            except KeyError:
+                self._cached_cookies = {}
+            else:
+                self._cached_cookies = helpers.parse_cookie_header(
+                    header_value)
+
+        return self._cached_cookies
+
     # ------------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------------
@@ -526,6 +576,83 @@ class Request(object):
 
         return (preferred_type if preferred_type else None)
 
+    def matches_validators(self, etag=None, last_modified=None):
+        """Determines whether the client already has a fresh copy.
+
+        Compares the If-None-Match and If-Modified-Since request headers
+        against the given validators, as described in RFC 7232, Section 6.
+        Responders may call this method as soon as the validators for the
+        requested resource are known, in order to skip rendering the
+        response body entirely. For example::
+
+            def on_get(self, req, resp, thing_id):
+                etag, modified = self.store.get_validators(thing_id)
+
+                resp.etag = etag
+                resp.last_modified = modified
+
+                if req.matches_validators(etag, modified):
+                    resp.status = falcon.HTTP_304
+                    return
+
+                resp.body = self.store.render(thing_id)
+
+        Note:
+            Conditional GET only applies to GET and HEAD requests, so this
+            method always returns ``False`` for any other method.
+
+        Keyword Args:
+            etag (str): Current entity tag for the resource, including
+                the surrounding double quotes, as in ``'"2a4f"'``
+                (default ``None``). Weak entity tags are compared using
+                the weak comparison function.
+            last_modified (datetime): Time, in UTC, at which the resource
+                was last modified (default ``None``).
+
+        Returns:
+            bool: ``True`` if a "304 Not Modified" response may be sent
+            in lieu of the resource's current representation, otherwise
+            ``False``.
+
+        """
+
+        if self.method not in ('GET', 'HEAD'):
+            return False
+
+        if_none_match = self.if_none_match
+        if if_none_match is not None:
+            # NOTE(kgriffs): When If-None-Match is present, RFC 7232
+            # requires If-Modified-Since to be ignored.
+            if etag is None:
+                return False
+
+            if if_none_match.strip() == '*':
+                return True
+
+            etag = helpers.strip_weak_prefix(etag)
+
+            for tag in if_none_match.split(','):
+                if helpers.strip_weak_prefix(tag.strip()) == etag:
+                    return True
+
+            return False
+
+        if last_modified is None:
+            return False
+
+        if_modified_since = self.if_modified_since
+        if if_modified_since is None:
+            return False
+
+        try:
+            since = util.http_date_to_dt(if_modified_since)
+        except ValueError:
+            # NOTE(kgriffs): Per RFC 7232, an invalid date is ignored
+            return False
+
+        # NOTE(kgriffs): HTTP dates only have a resolution of one second
+        return last_modified.replace(microsecond=0) <= since
+
     def get_header(self, name, required=False):
         """Return a header value as a string.
 
@@ -831,6 +958,92 @@ class Request(object):
 
         raise HTTPMissingParam(name)
 
+    def get_param_as_array(self, name, typecode=DEFAULT_ARRAY_TYPECODE,
+                           required=False, store=None):
+        """Return the value of a query string parameter as a numeric array.
+
+        Like ``get_param_as_list``, list items must be comma-separated or
+        must be provided as multiple instances of the same param in the
+        query string. However, rather than building a list of Python
+        objects, each element is converted and packed directly into an
+        ``array.array`` of the given type. This is much more compact than
+        a list when a client submits a large number of values, such as
+        a bulk list of IDs.
+
+        Note:
+            Arrays support the buffer protocol, and so the result may be
+            passed to ``numpy.frombuffer`` in order to create a NumPy
+            array without copying the data.
+
+        Args:
+            name (str): Parameter name, case-sensitive (e.g., 'ids')
+            typecode (str, optional): A numeric type code, as defined by
+                the standard ``array`` module, to use for the array
+                (default 'q', i.e., signed 64-bit integers). The
+                elements will be parsed as floats for the 'f' and 'd' type
+                codes, and as integers otherwise.
+
+                Note:
+                    Python 2 does not support the 'q' type code, so 'l' is
+                    used as the default instead.
+
+            required (bool, optional): Set to True to raise HTTPBadRequest
+                instead of returning gracefully when the parameter is not
+                found (default False)
+            store (dict, optional): A dict-like object in which to place the
+                value of the param, but only if the param is found (default
+                *None*).
+
+        Returns:
+            array.array: The value of the param if it is found. Otherwise,
+            returns *None* unless required is True. As with
+            ``get_param_as_list``, empty elements will be discarded.
+
+        Raises
+            HTTPBadRequest: The param was not found in the request, but was
+                required. Also raised if one or more of the elements
+                could not be parsed, or were out of range for the
+                given type code.
+            ValueError: `typecode` is not a numeric type code that is
+                supported by the ``array`` module.
+        """
+
+        # NOTE(kgriffs): Check this up front, so that the mistake is
+        # not mistaken for a bad value from the client.
+        if typecode not in NUMERIC_TYPECODES:
+            raise ValueError('Invalid array type code: ' + repr(typecode))
+
+        params = self._params
+
+        # PERF: Use if..in since it is a good all-around performer; we don't
+        #       know how likely params are to be specified by clients.
+        if name in params:
+            items = params[name]
+
+            if not isinstance(items, list):
+                items = [items]
+
+            convert = float if typecode in FLOAT_TYPECODES else int
+
+            # PERF(kgriffs): Feed the array from an iterator so that we
+            # don't have to create an intermediate list of numbers.
+            try:
+                items = array.array(typecode, six.moves.map(convert, items))
+
+            except (ValueError, OverflowError):
+                msg = 'The value is not formatted correctly.'
+                raise HTTPInvalidParam(msg, name)
+
+            if store is not None:
+                store[name] = items
+
+            return items
+
+        if not required:
+            return None
+
+        raise HTTPMissingParam(name)
+
     # TODO(kgriffs): Use the nocover pragma only for the six.PY3 if..else
     def log_error(self, message):  # pragma: no cover
         """Write an error message to the server's log.
@@ -881,6 +1094,48 @@ class Request(object):
             # but it had an invalid value.
             pass
 
+    def _has_form_body(self):
+        # PERF(kgriffs): Technically, we should spend a few more
+        # cycles and parse the content type for real, but
+        # this heuristic will work virtually all the time.
+        return (self.content_type is not None and
+                'application/x-www-form-urlencoded' in self.content_type)
+
+    def _expects_continue(self):
+        try:
+            expect = self.env['HTTP_EXPECT']
+        except KeyError:
+            return False
+
+        return expect.lower() == '100-continue'
+
+    def _prepare_body(self):
+        """Check the body size and parse deferred form params, if needed.
+
+        Called by the framework just before routing to the responder
+        whenever `_body_pending` is set.
+
+        Raises:
+            HTTPRequestEntityTooLarge: The Content-Length of the request
+                exceeds ``RequestOptions.max_content_length``.
+
+        """
+
+        self._body_pending = False
+        self._check_content_length()
+
+        if self._has_form_body():
+            self._parse_form_urlencoded()
+
+    def _check_content_length(self):
+        """Raise an error if the request body is declared to be too large."""
+
+        max_length = self.options.max_content_length
+        if max_length is not None:
+            length = self.content_length
+            if length is not None and length > max_length:
+                raise _body_too_large(max_length)
+
     def _parse_form_urlencoded(self):
         # NOTE(kgriffs): This assumes self.stream has been patched
         # above in the case of wsgiref, so that self.content_length
@@ -890,7 +1145,10 @@ class Request(object):
         # overhead to do that won't usually be helpful, since
         # content length will only ever be read once per
         # request in most cases.
-        body = self.stream.read()
+        self._parse_form_body(self.stream.read())
+
+    def _parse_form_body(self, body):
+        """Add the params in a URL-encoded form body to the query params."""
 
         # NOTE(kgriffs): According to http://goo.gl/6rlcux the
         # body should be US-ASCII. Enforcing this also helps
@@ -913,6 +1171,15 @@ class Request(object):
             self._params.update(extra_params)
 
 
+def _body_too_large(max_length):
+    """Create the error for a request body that exceeds the given size."""
+
+    msg = ('The size of the request body may not exceed ' +
+           str(max_length) + ' bytes.')
+
+    return HTTPRequestEntityTooLarge('Request body is too large', msg)
+
+
 # PERF: To avoid typos and improve storage space and speed over a dict.
 class RequestOptions(object):
     """This class is a container for Request options.
@@ -920,11 +1187,18 @@ class RequestOptions(object):
     Attributes:
         keep_blank_qs_values (bool): Set to ``True`` in order to retain
             blank values in query string parameters (default ``False``.)
+        max_content_length (int): Maximum size, in bytes, of request
+            bodies (default ``None``, i.e., no limit). Requests whose
+            Content-Length header exceeds this value are rejected with
+            "413 Payload Too Large" after the *process_request* middleware
+            methods have run, but before the body is read.
 
     """
     __slots__ = (
         'keep_blank_qs_values',
+        'max_content_length',
     )
 
     def __init__(self):
         self.keep_blank_qs_values = False
+        self.max_content_length = None
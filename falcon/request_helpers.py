@@ -34,6 +34,67 @@ def header_property(wsgi_name):
     return property(fget)
 
 
+def parse_cookie_header(header_value):
+    """Parses the value of a Cookie header into a dict.
+
+    This is a deliberately simple parser that avoids the overhead of
+    ``Cookie.SimpleCookie``, such as creating a *Morsel* for each cookie.
+    Malformed pairs are skipped. If a cookie name appears more than once,
+    the first value is used, since per RFC 6265 user agents list cookies
+    having more specific paths first.
+
+    Args:
+        header_value (str): Value of the Cookie header, e.g.,
+            'session=5f2b; theme="dark"'.
+
+    Returns:
+        dict: A mapping of cookie names to values. Values that were
+        surrounded with double quotes are unquoted.
+
+    """
+
+    cookies = {}
+
+    # PERF(kgriffs): As with query strings, split+partition was found
+    # to be faster than using a regex.
+    for pair in header_value.split(';'):
+        name, sep, value = pair.partition('=')
+        if not sep:
+            continue
+
+        name = name.strip()
+        if not name or name in cookies:
+            continue
+
+        value = value.strip()
+        if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+            value = value[1:-1]
+
+        cookies[name] = value
+
+    return cookies
+
+
+def strip_weak_prefix(etag):
+    """Removes the weakness indicator, if any, from an entity tag.
+
+    Used to implement the weak comparison function described in
+    RFC 7232, Section 2.3.2.
+
+    Args:
+        etag (str): Entity tag, e.g., 'W/"2a4f"' or '"2a4f"'.
+
+    Returns:
+        str: The opaque tag, e.g., '"2a4f"'.
+
+    """
+
+    if etag.startswith('W/'):
+        return etag[2:]
+
+    return etag
+
+
 class Body(object):
     """Wrap wsgi.input streams to make them more robust.
 
@@ -128,3 +189,144 @@ class Body(object):
         """
 
         return self._read(hint, self.stream.readlines)
+
+
+class StreamTee(object):
+    """Copy a request body to any number of consumers in a single pass.
+
+    Each block read from the stream is fed to every given hasher (e.g.,
+    ``hashlib.md5()``) and written to the destination file, if any. A
+    single buffer is allocated up front and reused for every block when
+    the stream supports ``readinto()``, so that copying a large upload
+    does not allocate a new bytes object for each block.
+
+    For example::
+
+        def on_put(self, req, resp, name):
+            with open(os.path.join(STORAGE, name), 'wb') as f:
+                tee = StreamTee(req.stream, f,
+                                hashers=[hashlib.md5(), hashlib.sha256()],
+                                stream_len=req.content_length)
+                tee.run()
+
+            resp.etag = '"' + tee.hexdigests['md5'] + '"'
+
+    Args:
+        stream: File-like object from which to read, such as ``req.stream``.
+            If `stream` is an instance of ``Body``, the underlying stream
+            is read directly, and its length is used for `stream_len`
+            unless another value is given.
+        destination: File-like object with a *write()* method, to which
+            the data will be copied (default ``None``).
+        hashers (iterable): Objects implementing *update()*, such as those
+            returned by the ``hashlib`` constructors (default ``None``).
+        stream_len (int): Number of bytes to read from the stream, such
+            as ``req.content_length`` (default ``None``). If not specified,
+            the stream is read until EOF. Specifying the length avoids
+            blocking on streams, such as sockets, that only signal EOF
+            when the connection is closed.
+        block_size (int): Size of the buffer to use for copying the data,
+            in bytes (default 64 KiB).
+
+    Attributes:
+        bytes_read (int): Number of bytes copied so far.
+        hashers (tuple): The hashers passed to the initializer.
+
+    """
+
+    __slots__ = (
+        'bytes_read',
+        'destination',
+        'hashers',
+        'stream',
+        'stream_len',
+        '_block_size',
+    )
+
+    def __init__(self, stream, destination=None, hashers=None,
+                 stream_len=None, block_size=64 * 1024):
+        if isinstance(stream, Body):
+            if stream_len is None:
+                stream_len = stream.stream_len
+
+            stream = stream.stream
+
+        self.stream = stream
+        self.destination = destination
+        self.hashers = tuple(hashers) if hashers else ()
+        self.stream_len = stream_len
+        self.bytes_read = 0
+        self._block_size = block_size
+
+    @property
+    def hexdigests(self):
+        """Hex digests of the data copied so far, keyed by hasher name.
+
+        Names are lowercased, since some versions of Python report,
+        e.g., 'MD5' rather than 'md5'.
+
+        """
+
+        return dict((hasher.name.lower(), hasher.hexdigest())
+                    for hasher in self.hashers)
+
+    def run(self):
+        """Copy the remainder of the stream.
+
+        Returns:
+            int: Total number of bytes copied.
+
+        """
+
+        # PERF(kgriffs): Bind outside of the loop
+        consumers = [hasher.update for hasher in self.hashers]
+        if self.destination is not None:
+            consumers.append(self.destination.write)
+
+        if hasattr(self.stream, 'readinto'):
+            blocks = self._readinto_blocks()
+        else:
+            blocks = self._read_blocks()
+
+        for block in blocks:
+            for consume in consumers:
+                consume(block)
+
+        return self.bytes_read
+
+    def _remaining(self):
+        if self.stream_len is None:
+            return self._block_size
+
+        return min(self._block_size, self.stream_len - self.bytes_read)
+
+    def _readinto_blocks(self):
+        view = memoryview(bytearray(self._block_size))
+        readinto = self.stream.readinto
+
+        while True:
+            size = self._remaining()
+            if size <= 0:
+                break
+
+            count = readinto(view[:size])
+            if not count:
+                break
+
+            self.bytes_read += count
+            yield view[:count]
+
+    def _read_blocks(self):
+        read = self.stream.read
+
+        while True:
+            size = self._remaining()
+            if size <= 0:
+                break
+
+            block = read(size)
+            if not block:
+                break
+
+            self.bytes_read += len(block)
+            yield block
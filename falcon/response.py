@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
 import six
 
-from falcon.response_helpers import header_property, format_range
+from falcon.response_helpers import header_property, format_range, HeaderSet
 from falcon.util import dt_to_http, uri
 
 
+# NOTE(kgriffs): See also RFC 6265, Section 4.1.1
+_COOKIE_NAME = re.compile(r"^[!#$%&'*+\-.^_`|~0-9A-Za-z]+\Z")
+_COOKIE_VALUE = re.compile(r'^[\x21\x23-\x2B\x2D-\x3A\x3C-\x5B\x5D-\x7E]*\Z')
+_COOKIE_EXPIRED = 'Thu, 01 Jan 1970 00:00:00 GMT'
+
+DEFAULT_STREAM_BLOCK_SIZE = 8 * 1024  # 8 KiB
+
+
 class Response(object):
     """Represents an HTTP response to a client request.
 
@@ -37,7 +47,16 @@ class Response(object):
             data is already a byte string, use the data attribute
             instead (it's faster).
         body_encoded (bytes): Returns a UTF-8 encoded version of `body`.
-        data (bytes): Byte string representing response content.
+        data (bytes): Byte string representing response content. May also
+            be a *memoryview*, or a list or tuple of byte strings and/or
+            memoryviews, in which case the buffers are passed to the WSGI
+            server as-is, without first concatenating them.
+
+            Note:
+                PEP 3333 requires the WSGI iterable to yield byte strings,
+                so only use memoryviews with servers that accept any
+                buffer object (e.g., Gunicorn, uWSGI). The reference
+                server, wsgiref, does not.
 
             Note:
                 Under Python 2.x, if your content is of type *str*, setting
@@ -59,27 +78,46 @@ class Response(object):
             file-like objects.
 
         stream_len (int): Expected length of *stream* (e.g., file size).
+        complete (bool): Set to ``True`` from within a middleware
+            component's *process_request* method in order to skip the
+            remaining *process_request* methods, as well as the responder,
+            once the response has been fully prepared (default ``False``).
+        stream_block_size (int): Number of bytes to read at a time from a
+            file-like *stream*, overriding
+            ``ResponseOptions.stream_block_size`` for this response
+            (default ``None``). Larger blocks reduce per-block overhead
+            when sending large files.
     """
 
     __slots__ = (
         '_body',  # Stuff
         '_body_encoded',  # Stuff
+        'complete',
+        '_cookies',
         'data',
+        '_error',
         '_headers',
+        '_header_set',
         'status',
         'stream',
-        'stream_len'
+        'stream_len',
+        'stream_block_size',
     )
 
     def __init__(self):
         self.status = '200 OK'
+        self.complete = False
         self._headers = {}
+        self._header_set = None
+        self._cookies = None
+        self._error = None
 
         self._body = None
         self._body_encoded = None
         self.data = None
         self.stream = None
         self.stream_len = None
+        self.stream_block_size = None
 
     def _get_body(self):
         return self._body
@@ -123,6 +161,181 @@ class Response(object):
         self.stream = stream
         self.stream_len = stream_len
 
+    def set_error(self, error):
+        """Responds with an error, without raising it.
+
+        May be called from a hook, a middleware component's
+        *process_request* or *process_response* method, or a responder,
+        in lieu of raising `error`. Once the hook, method, or responder
+        returns, request processing stops just as if the error had been
+        raised at that point, and the error is converted to a response
+        in the same way, including the use of any error handler that was
+        registered for its type, and the unwinding of the middleware
+        stack.
+
+        Since no exception is raised and caught along the way, this is
+        the cheaper option for errors that are expected to occur often,
+        such as when rejecting requests in order to enforce a rate limit::
+
+            TOO_MANY_REQUESTS = falcon.HTTPError(
+                '429 Too Many Requests', 'Rate limit exceeded').freeze()
+
+            class RateLimitMiddleware(object):
+                def process_request(self, req, resp, params):
+                    if not self._bucket.consume(req.remote_addr):
+                        resp.set_error(TOO_MANY_REQUESTS)
+
+        An error that is not an instance of HTTPError, and for which no
+        error handler was registered, is raised once the hook, method,
+        or responder returns, since there is no way to convert it to a
+        response.
+
+        Args:
+            error (HTTPError): The error to respond with. See also
+                :py:meth:`~.HTTPError.freeze`.
+
+        """
+
+        self._error = error
+
+        # NOTE(kgriffs): Piggyback on the complete flag, so that the
+        # middleware stack will not have to check for both.
+        self.complete = True
+
+    def set_cookie(self, name, value, expires=None, max_age=None,
+                   domain=None, path=None, secure=True, http_only=True):
+        """Set a response cookie.
+
+        Each cookie is sent to the client as a separate Set-Cookie
+        header. The header value is formatted directly, rather than
+        by way of ``Cookie.SimpleCookie``, which is comparatively slow.
+
+        Note:
+            Calling this method more than once for the same cookie name,
+            domain and path replaces the previous value. Cookies that
+            differ only in domain or path are distinct, and are each
+            sent to the client.
+
+        Args:
+            name (str): Cookie name. Must be a valid RFC 2616 token.
+            value (str): Cookie value. Characters that are not allowed
+                in an RFC 6265 cookie value (such as whitespace, double
+                quotes, commas, semicolons and backslashes) must be
+                escaped or encoded by the app before calling this method.
+
+        Keyword Args:
+            expires (datetime): Expiration date of the cookie, as a UTC
+                *datetime.datetime* instance (default ``None``).
+            max_age (int): Number of seconds until the cookie expires
+                (default ``None``).
+            domain (str): Restrict the cookie to the given domain and its
+                subdomains (default ``None``).
+            path (str): Restrict the cookie to the given path prefix
+                (default ``None``).
+            secure (bool): Direct the client to only return the cookie
+                over HTTPS (default ``True``).
+            http_only (bool): Direct the client to hide the cookie from
+                scripts running in the browser (default ``True``).
+
+        Raises:
+            ValueError: The name or value contained illegal characters.
+
+        """
+
+        if not _COOKIE_NAME.match(name):
+            raise ValueError('Invalid cookie name: ' + repr(name))
+
+        if not _COOKIE_VALUE.match(value):
+            raise ValueError('Invalid value for cookie ' + name)
+
+        # PERF(kgriffs): Concatenation is faster than formatting
+        header_value = name + '=' + value
+
+        if expires is not None:
+            header_value += '; Expires=' + dt_to_http(expires)
+
+        if max_age is not None:
+            header_value += '; Max-Age=' + str(max_age)
+
+        if domain is not None:
+            header_value += '; Domain=' + domain
+
+        if path is not None:
+            header_value += '; Path=' + path
+
+        if secure:
+            header_value += '; Secure'
+
+        if http_only:
+            header_value += '; HttpOnly'
+
+        if self._cookies is None:
+            self._cookies = {}
+
+        self._cookies[(name, domain, path)] = header_value
+
+    def unset_cookie(self, name, domain=None, path=None):
+        """Direct the client to remove a cookie.
+
+        The cookie is cleared by setting it to an empty value that
+        expired in the past.
+
+        Note:
+            In order for the cookie to be removed by the client, `domain`
+            and `path` must match the values that were used when the
+            cookie was originally set.
+
+        Args:
+            name (str): Cookie name. Must be a valid RFC 2616 token.
+
+        Keyword Args:
+            domain (str): Domain of the cookie (default ``None``).
+            path (str): Path of the cookie (default ``None``).
+
+        Raises:
+            ValueError: The name contained illegal characters.
+
+        """
+
+        if not _COOKIE_NAME.match(name):
+            raise ValueError('Invalid cookie name: ' + repr(name))
+
+        if self._cookies is None:
+            self._cookies = {}
+
+        header_value = name + '=; Expires=' + _COOKIE_EXPIRED + '; Max-Age=0'
+
+        if domain is not None:
+            header_value += '; Domain=' + domain
+
+        if path is not None:
+            header_value += '; Path=' + path
+
+        self._cookies[(name, domain, path)] = header_value
+
+    def get_header(self, name):
+        """Retrieve the raw string value for the given header.
+
+        Args:
+            name (str): Header name, case-insensitive.
+
+        Returns:
+            str: The value of the specified header if set, or ``None``
+            otherwise.
+
+        """
+
+        name = name.lower()
+
+        try:
+            return self._headers[name]
+        except KeyError:
+            header_set = self._header_set
+            if header_set is None:
+                return None
+
+            return header_set._headers.get(name)
+
     def set_header(self, name, value):
         """Set a header for this response to a given value.
 
@@ -141,7 +354,13 @@ class Response(object):
         """
 
         # NOTE(kgriffs): normalize name by lowercasing it
-        self._headers[name.lower()] = value
+        name = name.lower()
+
+        header_set = self._header_set
+        if header_set is not None and name in header_set._headers:
+            self._unshare_headers()
+
+        self._headers[name] = value
 
     def append_header(self, name, value):
         """Set or append a header for this response to a given value.
@@ -161,6 +380,11 @@ class Response(object):
 
         """
         name = name.lower()
+
+        header_set = self._header_set
+        if header_set is not None and name in header_set._headers:
+            self._unshare_headers()
+
         if name in self._headers:
             value = self._headers[name] + ',' + value
 
@@ -173,21 +397,42 @@ class Response(object):
             Calling this method overwrites existing values, if any.
 
         Args:
-            headers (dict or list): A dictionary of header names and values
-                to set, or list of (name, value) tuples. Both names and
-                values must be of type str or StringType, and only character
-                values 0x00 through 0xFF may be used on platforms that use
-                wide characters.
+            headers (dict, list or HeaderSet): A dictionary of header names
+                and values to set, a list of (name, value) tuples, or a
+                :py:class:`~.HeaderSet`. Both names and values must be of
+                type str or StringType, and only character values 0x00
+                through 0xFF may be used on platforms that use wide
+                characters.
 
                 Note:
                     Falcon can process a list of tuples slightly faster
-                    than a dict.
+                    than a dict, and a HeaderSet faster still, since
+                    its names are normalized in advance. When no other
+                    headers have been set on the response, the HeaderSet
+                    is attached as-is, without copying it.
 
         Raises:
             ValueError: headers was not a dictionary or list of tuples.
 
         """
 
+        if isinstance(headers, HeaderSet):
+            # PERF(kgriffs): Share the set if nothing else has been set
+            # yet; it will only be copied if one of its headers is
+            # modified later on.
+            if self._header_set is None and not self._headers:
+                self._header_set = headers
+                return
+
+            if self._header_set is not None:
+                self._unshare_headers()
+
+            self._headers.update(headers._headers)
+            return
+
+        if self._header_set is not None:
+            self._unshare_headers()
+
         if isinstance(headers, dict):
             headers = headers.items()
 
@@ -304,6 +549,10 @@ class Response(object):
         if anchor is not None:
             value += '; anchor="' + uri.encode(anchor) + '"'
 
+        header_set = self._header_set
+        if header_set is not None and 'link' in header_set._headers:
+            self._unshare_headers()
+
         _headers = self._headers
         if 'link' in _headers:
             _headers['link'] += ', ' + value
@@ -395,6 +644,20 @@ class Response(object):
         """,
         lambda v: ', '.join(v))
 
+    def _unshare_headers(self):
+        """Copy the shared HeaderSet, if any, into this response's headers.
+
+        Headers that were set after the HeaderSet was attached take
+        precedence over the values in the set.
+
+        """
+
+        headers = self._header_set._headers.copy()
+        headers.update(self._headers)
+
+        self._headers = headers
+        self._header_set = None
+
     def _wsgi_headers(self, media_type=None):
         """Convert headers into the format expected by WSGI servers.
 
@@ -405,18 +668,64 @@ class Response(object):
         """
 
         headers = self._headers
+        header_set = self._header_set
 
         # PERF(kgriffs): Using "in" like this is faster than using
         # dict.setdefault (tested on py27).
         set_content_type = (media_type is not None and
                             'content-type' not in headers)
 
-        if set_content_type:
-            headers['content-type'] = media_type
+        if header_set is not None:
+            # NOTE(kgriffs): The set's items are already in WSGI form,
+            # so we only need to copy the list and tack on any headers
+            # that were set on this particular response.
+            items = header_set._items[:]
+            if headers:
+                items += headers.items()
 
-        if six.PY2:  # pragma: no cover
-            # PERF(kgriffs): Don't create an extra list object if
-            # it isn't needed.
-            return headers.items()
+            if set_content_type and 'content-type' not in header_set._headers:
+                items.append(('content-type', media_type))
 
-        return list(headers.items())  # pragma: no cover
+        else:
+            if set_content_type:
+                headers['content-type'] = media_type
+
+            if six.PY2:  # pragma: no cover
+                # PERF(kgriffs): Don't create an extra list object if
+                # it isn't needed.
+                items = headers.items()
+            else:
+                items = list(headers.items())  # pragma: no cover
+
+        # NOTE(kgriffs): Set-Cookie can not be folded into a single
+        # comma-separated header, so each cookie gets its own.
+        if self._cookies is not None:
+            items += [('set-cookie', value)
+                      for value in self._cookies.values()]
+
+        return items
+
+
+class ResponseOptions(object):
+    """This class is a container for Response options.
+
+    Attributes:
+        add_date_header (bool): Set to ``True`` to add a Date header to
+            every response that does not already have one
+            (default ``False``). The header's value is formatted at
+            most once per second; see also ``falcon.http_now()``.
+        stream_block_size (int): Default number of bytes to read at a
+            time from a file-like ``resp.stream`` (default 8 KiB). When
+            ``resp.stream_len`` is smaller than this value, only
+            ``resp.stream_len`` bytes are requested. May be overridden
+            per response via ``resp.stream_block_size``.
+
+    """
+    __slots__ = (
+        'add_date_header',
+        'stream_block_size',
+    )
+
+    def __init__(self):
+        self.add_date_header = False
+        self.stream_block_size = DEFAULT_STREAM_BLOCK_SIZE
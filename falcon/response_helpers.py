@@ -12,6 +12,85 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
+import six
+
+
+class HeaderSet(object):
+    """An immutable set of response headers that may be shared.
+
+    Header names are normalized once, when the set is created, and the
+    list of (name, value) tuples that will be passed to the WSGI server
+    is built ahead of time. Passing a `HeaderSet` to
+    :py:meth:`~.Response.set_headers` on an otherwise pristine response
+    simply attaches the set, rather than copying each header. The set
+    is only copied into the response if one of its headers is later
+    modified or removed.
+
+    A `HeaderSet` is typically created once, at module or resource
+    level, and then applied to every response::
+
+        CORS_HEADERS = falcon.HeaderSet({
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Max-Age': '86400',
+        })
+
+        class ThingsResource(object):
+            def on_get(self, req, resp):
+                resp.set_headers(CORS_HEADERS)
+
+    Args:
+        headers (dict or list): A dictionary of header names and values,
+            or list of (name, value) tuples. Both names and values must
+            be of type str or StringType, and only character values 0x00
+            through 0xFF may be used on platforms that use wide
+            characters.
+
+    """
+
+    __slots__ = ('_headers', '_items')
+
+    def __init__(self, headers):
+        if isinstance(headers, dict):
+            headers = headers.items()
+
+        normalized = {}
+        for name, value in headers:
+            normalized[name.lower()] = value
+
+        self._headers = normalized
+        self._items = list(normalized.items())
+
+    def __contains__(self, name):
+        return name.lower() in self._headers
+
+    def __len__(self):
+        return len(self._headers)
+
+    def get(self, name, default=None):
+        """Return the value of a header in the set (case-insensitive).
+
+        Args:
+            name (str): Header name.
+
+        Keyword Args:
+            default: Value to return if the header is not in the set
+                (default ``None``).
+
+        """
+
+        return self._headers.get(name.lower(), default)
+
+    def items(self):
+        """Return a new list of (name, value) tuples.
+
+        Header names are lowercased.
+
+        """
+
+        return self._items[:]
+
 
 def header_property(name, doc, transform=None):
     """Creates a header getter/setter.
@@ -31,16 +110,34 @@ def header_property(name, doc, transform=None):
         try:
             return self._headers[normalized_name]
         except KeyError:
-            return None
+            header_set = self._header_set
+            if header_set is None:
+                return None
+
+            return header_set._headers.get(normalized_name)
 
     if transform is None:
         def fset(self, value):
+            header_set = self._header_set
+            if (header_set is not None and
+                    normalized_name in header_set._headers):
+                self._unshare_headers()
+
             self._headers[normalized_name] = value
     else:
         def fset(self, value):
+            header_set = self._header_set
+            if (header_set is not None and
+                    normalized_name in header_set._headers):
+                self._unshare_headers()
+
             self._headers[normalized_name] = transform(value)
 
     def fdel(self):
+        header_set = self._header_set
+        if header_set is not None and normalized_name in header_set._headers:
+            self._unshare_headers()
+
         del self._headers[normalized_name]
 
     return property(fget, fset, fdel, doc)
@@ -60,3 +157,141 @@ def format_range(value):
             str(value[0]) + '-' +
             str(value[1]) + '/' +
             str(value[2]))
+
+
+def join_data(data):
+    """Converts the value of `resp.data` to a single byte string.
+
+    Args:
+        data: A byte string, a buffer such as a *memoryview*, or a list
+            or tuple of such buffers.
+
+    Returns:
+        bytes: The concatenated content. Byte strings are returned as-is.
+
+    """
+
+    if isinstance(data, six.binary_type):
+        return data
+
+    if isinstance(data, (list, tuple)):
+        return b''.join([
+            buf if isinstance(buf, six.binary_type)
+            else memoryview(buf).tobytes()
+            for buf in data
+        ])
+
+    return memoryview(data).tobytes()
+
+
+def data_length(data):
+    """Gets the number of bytes in the value of `resp.data`.
+
+    Args:
+        data: A byte string, a buffer such as a *memoryview*, or a list
+            or tuple of such buffers.
+
+    Returns:
+        int: The total size of the buffers, in bytes. Note that the
+        ``len()`` of a buffer counts its items, which may well be
+        larger than a byte each.
+
+    """
+
+    if isinstance(data, (list, tuple)):
+        return sum(_buffer_length(buf) for buf in data)
+
+    return _buffer_length(data)
+
+
+def _buffer_length(buf):
+    """Gets the size, in bytes, of a single buffer."""
+
+    if isinstance(buf, six.binary_type):
+        return len(buf)
+
+    view = memoryview(buf)
+
+    # NOTE(kgriffs): memoryview.nbytes requires Python 3.3+
+    try:
+        return view.nbytes
+    except AttributeError:  # pragma: no cover
+        return len(view.tobytes())
+
+
+def coalesce_stream(chunks, max_size=64 * 1024, max_count=None,
+                    max_latency=None):
+    """Batches the chunks yielded by an iterable into larger blocks.
+
+    Generators that yield many small chunks (e.g., one row at a time)
+    cause most WSGI servers to issue a write syscall per chunk. Wrapping
+    such a generator with this function lets the responder keep its
+    lazy generator while the server writes fewer, larger blocks::
+
+        resp.stream = falcon.coalesce_stream(self._render_rows(cursor),
+                                             max_latency=0.1)
+
+    A block is yielded as soon as any one of the given thresholds is
+    reached, and whatever remains is yielded once the iterable is
+    exhausted. Empty chunks are skipped.
+
+    Note:
+        Since the source is pulled lazily, the latency bound can only
+        be enforced when a chunk arrives. If the source blocks for a
+        long time, the chunks buffered so far are held until either
+        the next chunk arrives or the source is exhausted.
+
+    Args:
+        chunks (iterable): Iterable yielding byte strings.
+
+    Keyword Args:
+        max_size (int): Yield a block once at least this many bytes
+            have been buffered (default 64 KiB).
+        max_count (int): Yield a block once this many chunks have been
+            buffered (default ``None``, i.e., no limit).
+        max_latency (float): Yield a block once the oldest buffered
+            chunk has been held for at least this many seconds
+            (default ``None``, i.e., no limit).
+
+    Returns:
+        generator: An iterator over the coalesced blocks. Closing it
+        also closes `chunks`, if it has a close() method.
+
+    """
+
+    buffered = []
+    size = 0
+    started = 0
+
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            if max_latency is not None and not buffered:
+                started = time.time()
+
+            buffered.append(chunk)
+            size += len(chunk)
+
+            if (size >= max_size or
+                    (max_count is not None and len(buffered) >= max_count) or
+                    (max_latency is not None and
+                     time.time() - started >= max_latency)):
+
+                # PERF(kgriffs): Avoid a copy when there is only one chunk
+                if len(buffered) == 1:
+                    yield buffered[0]
+                else:
+                    yield b''.join(buffered)
+
+                buffered = []
+                size = 0
+
+        if buffered:
+            yield b''.join(buffered)
+
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
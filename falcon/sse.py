@@ -0,0 +1,288 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Server-Sent Events (SSE) helpers.
+
+See also: https://html.spec.whatwg.org/multipage/server-sent-events.html
+
+"""
+
+import time
+
+import six
+from six.moves import queue
+
+
+MEDIA_TYPE = 'text/event-stream'
+
+_HEARTBEAT = b':\n\n'
+
+
+class Event(object):
+    """A single server-sent event.
+
+    Events are serialized the first time they are sent, and the result
+    is cached, so that broadcasting the same event to a number of
+    streams only formats it once. Therefore, an event should not be
+    modified after it has been sent.
+
+    Keyword Args:
+        data (str): Event payload (default ``None``). Multi-line data
+            is split into several "data" fields, as required by the
+            SSE framing rules. Unicode strings are encoded as UTF-8.
+        event (str): Event type, which the client may use to dispatch
+            the event to a specific listener (default ``None``).
+        event_id (str): Event ID. The client will send the ID of the
+            last event it received in the Last-Event-ID header when
+            reconnecting (default ``None``).
+        retry (int): Number of milliseconds the client should wait
+            before reconnecting after the connection is lost
+            (default ``None``).
+        comment (str): Comment to include in the event. Comments are
+            ignored by clients (default ``None``).
+
+    Raises:
+        ValueError: `event` or `event_id` contained a line break.
+
+    """
+
+    __slots__ = ('comment', 'data', 'event', 'event_id', 'retry',
+                 '_serialized')
+
+    def __init__(self, data=None, event=None, event_id=None, retry=None,
+                 comment=None):
+
+        for value in (event, event_id):
+            if value is not None and ('\n' in value or '\r' in value):
+                raise ValueError('Event types and IDs may not contain '
+                                 'line breaks: ' + repr(value))
+
+        self.data = data
+        self.event = event
+        self.event_id = event_id
+        self.retry = retry
+        self.comment = comment
+
+        self._serialized = None
+
+    def serialize(self):
+        """Format the event according to the SSE wire format.
+
+        Returns:
+            bytes: The serialized event, including the terminating
+            blank line.
+
+        """
+
+        if self._serialized is not None:
+            return self._serialized
+
+        lines = []
+
+        if self.comment is not None:
+            lines.extend(': ' + line for line in _split_lines(self.comment))
+
+        if self.event is not None:
+            lines.append('event: ' + self.event)
+
+        if self.event_id is not None:
+            lines.append('id: ' + self.event_id)
+
+        if self.retry is not None:
+            lines.append('retry: ' + str(self.retry))
+
+        data = self.data
+        if data is not None:
+            if isinstance(data, six.binary_type):
+                data = data.decode('utf-8')
+
+            # NOTE(kgriffs): An empty string still results in a single,
+            # empty data field, so that the client dispatches the event.
+            lines.extend('data: ' + line for line in _split_lines(data))
+
+        serialized = ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+        self._serialized = serialized
+        return serialized
+
+
+class EventStream(object):
+    """An iterable that frames events for use as `resp.stream`.
+
+    Each event is yielded to the WSGI server as a separate block, so
+    that it is flushed to the client immediately. While the source is
+    idle, a comment line is sent every `heartbeat` seconds to keep
+    proxies and load balancers from timing out the connection.
+
+    The source may be either a queue (i.e., any object with a
+    ``get(block, timeout)`` method, such as *queue.Queue*), or an
+    iterable. Either one should produce :py:class:`~.Event` instances,
+    or strings to send as the data of an otherwise empty event. When
+    the source is a queue, the stream ends when ``None`` is taken from
+    it. When the source is an iterable, it may yield ``None`` while it
+    has nothing to send, in which case a heartbeat is sent if one is
+    due; the stream ends when the iterable is exhausted.
+
+    Note:
+        Under a threaded WSGI server, each open stream ties up a worker
+        thread. Servers that use green threads (e.g., Gunicorn with
+        gevent workers) can hold many idle streams cheaply, since
+        waiting on a (monkey-patched) queue does not block the worker.
+
+    Args:
+        source: Queue or iterable producing events.
+
+    Keyword Args:
+        heartbeat (float): Number of seconds of inactivity after which
+            to send a heartbeat (default 15). Set to ``None`` to disable
+            heartbeats.
+        retry (int): Reconnection delay, in milliseconds, to send to
+            the client at the start of the stream (default ``None``).
+
+    """
+
+    __slots__ = ('_heartbeat', '_retry', '_source')
+
+    def __init__(self, source, heartbeat=15.0, retry=None):
+        self._source = source
+        self._heartbeat = heartbeat
+        self._retry = retry
+
+    def __iter__(self):
+        if self._retry is not None:
+            yield Event(retry=self._retry).serialize()
+
+        if hasattr(self._source, 'get'):
+            events = self._iter_queue()
+        else:
+            events = self._iter_iterable()
+
+        for event in events:
+            yield event
+
+    def close(self):
+        """Close the source, if it has a close() method."""
+
+        close = getattr(self._source, 'close', None)
+        if close is not None:
+            close()
+
+    def _iter_queue(self):
+        source = self._source
+        heartbeat = self._heartbeat
+
+        while True:
+            try:
+                event = source.get(True, heartbeat)
+            except queue.Empty:
+                yield _HEARTBEAT
+                continue
+
+            if event is None:
+                break
+
+            yield _serialize(event)
+
+    def _iter_iterable(self):
+        heartbeat = self._heartbeat
+        last_sent = time.time()
+
+        for event in self._source:
+            if event is None:
+                if heartbeat is None:
+                    continue
+
+                now = time.time()
+                if now - last_sent >= heartbeat:
+                    last_sent = now
+                    yield _HEARTBEAT
+
+                continue
+
+            yield _serialize(event)
+
+            if heartbeat is not None:
+                last_sent = time.time()
+
+
+def set_event_stream(req, resp, source, heartbeat=15.0, retry=None):
+    """Configure a response to stream server-sent events.
+
+    Sets the response's content type, disables caching and buffering by
+    intermediaries (including the "X-Accel-Buffering" header recognized
+    by Nginx), and assigns an :py:class:`~.EventStream` to `resp.stream`
+    with an unknown length. For example::
+
+        def on_get(self, req, resp, job_id):
+            def progress(last_event_id):
+                start = int(last_event_id) + 1 if last_event_id else 0
+                for step in self.jobs.watch(job_id, start):
+                    yield sse.Event(data=step.json, event_id=str(step.num))
+
+            sse.set_event_stream(req, resp, progress)
+
+    Note:
+        "Cache-Control: no-transform" is included, so that the stream
+        is left alone by :py:class:`~.CompressionMiddleware`, which
+        would otherwise hold events back in its compression buffer.
+
+    Args:
+        req (Request): The request for the event stream.
+        resp (Response): The response to configure.
+        source: Queue or iterable producing events (see also
+            :py:class:`~.EventStream`). If `source` is callable, it is
+            called with the value of the request's Last-Event-ID header
+            (or ``None``), so that events the client missed while
+            reconnecting may be replayed, and its return value is used
+            as the source.
+
+    Keyword Args:
+        heartbeat (float): Number of seconds of inactivity after which
+            to send a heartbeat (default 15).
+        retry (int): Reconnection delay, in milliseconds, to send to
+            the client (default ``None``).
+
+    Returns:
+        EventStream: The stream that was assigned to `resp.stream`.
+
+    """
+
+    if callable(source):
+        source = source(req.get_header('Last-Event-ID'))
+
+    resp.content_type = MEDIA_TYPE
+    resp.cache_control = ('no-cache', 'no-transform')
+    resp.set_header('X-Accel-Buffering', 'no')
+
+    stream = EventStream(source, heartbeat=heartbeat, retry=retry)
+    resp.set_stream(stream, None)
+
+    return stream
+
+
+def _serialize(event):
+    """Serialize an Event, or a string to use as an event's data."""
+
+    if isinstance(event, Event):
+        return event.serialize()
+
+    return Event(data=event).serialize()
+
+
+def _split_lines(text):
+    """Split text on CRLF, CR or LF, per the SSE framing rules."""
+
+    # NOTE(kgriffs): str.splitlines() is not used here, since it also
+    # splits on other characters, such as form feeds.
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
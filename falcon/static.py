@@ -0,0 +1,349 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+import mimetypes
+import os
+import stat
+import time
+
+from falcon.errors import (HTTPMethodNotAllowed, HTTPNotFound,
+                           HTTPRangeNotSatisfiable)
+from falcon.middleware.compression import negotiate_encoding
+import falcon.status_codes as status
+from falcon.util import dt_to_http, LRUCache
+
+
+# PERF(kgriffs): These errors never vary, so build them just once
+_NOT_FOUND = HTTPNotFound().freeze()
+_METHOD_NOT_ALLOWED = HTTPMethodNotAllowed(['GET', 'HEAD']).freeze()
+
+
+class StaticResource(object):
+    """Serves files from a directory on the local filesystem.
+
+    An instance of this class is meant to be registered as a sink, which
+    is done for you by :py:meth:`~.API.add_static_route`. The remainder
+    of the request path, after the given prefix, is mapped to a file
+    under `directory`. Paths containing ".." segments are rejected.
+
+    Only GET and HEAD are allowed. Responses include ETag,
+    Last-Modified and Accept-Ranges headers; conditional requests are
+    answered with "304 Not Modified", and a single byte range may be
+    requested via the Range header (honoring If-Range).
+
+    If the client accepts gzip and a precompressed sibling of the
+    requested file exists (e.g., "app.js.gz" for "app.js"), the
+    sibling is served instead, along with "Content-Encoding: gzip".
+
+    To avoid stat'ing each file and guessing its type on every request,
+    file metadata (including the ETag and content type) is cached in an
+    LRU for `cache_ttl` seconds. The body of a GET response is always
+    checked against the cached size and ETag once the file is opened,
+    so that a file rewritten in the meantime is never served with stale
+    headers.
+
+    Note:
+        WSGI does not give apps access to the client socket, so
+        ``os.sendfile()`` can not be called directly. Instead, full
+        (non-range) responses pass the open file to the WSGI server's
+        *wsgi.file_wrapper*, which servers such as Gunicorn and uWSGI
+        implement using ``sendfile()`` for zero-copy transfers.
+
+    Args:
+        prefix (str): The path prefix that the resource is mounted on,
+            such as '/static'.
+        directory (str): The directory from which to serve files.
+
+    Keyword Args:
+        cache_size (int): Maximum number of files for which to cache
+            metadata (default 1024).
+        cache_ttl (float): Number of seconds for which cached metadata
+            is trusted before the file is stat'ed again (default 5).
+        cache_control (list): Cache directives to use as the value of
+            the Cache-Control header, such as ``['max-age=3600']``
+            (default ``None``).
+
+    """
+
+    __slots__ = ('_cache', '_cache_control', '_cache_ttl', '_directory',
+                 '_prefix')
+
+    def __init__(self, prefix, directory, cache_size=1024, cache_ttl=5,
+                 cache_control=None):
+
+        directory = os.path.abspath(directory)
+        if not os.path.isdir(directory):
+            raise ValueError('{0} is not a directory'.format(directory))
+
+        self._prefix = prefix.rstrip('/') + '/'
+        self._directory = directory
+        self._cache = LRUCache(cache_size)
+        self._cache_ttl = cache_ttl
+        self._cache_control = cache_control
+
+    def __call__(self, req, resp, **kwargs):
+        if req.method not in ('GET', 'HEAD'):
+            raise _METHOD_NOT_ALLOWED
+
+        path = self._resolve(req.path)
+        info = self._get_info(path)
+
+        if self._cache_control is not None:
+            resp.cache_control = self._cache_control
+
+        resp.content_type = info.content_type
+        resp.set_header('Accept-Ranges', 'bytes')
+
+        encoding = None
+        if info.gz_size is not None:
+            resp.vary = ('Accept-Encoding',)
+
+            # NOTE(kgriffs): Byte ranges always refer to the identity
+            # representation, so serve that when a range is requested.
+            if (req.range is None and
+                    negotiate_encoding(req.get_header('Accept-Encoding')) ==
+                    'gzip'):
+                encoding = 'gzip'
+
+        if encoding is None:
+            file_path = path
+            etag = info.etag
+            size = info.size
+        else:
+            file_path = path + '.gz'
+            etag = info.gz_etag
+            size = info.gz_size
+
+            resp.set_header('Content-Encoding', encoding)
+
+        modified = info.modified
+        last_modified = info.last_modified
+
+        stream = None
+        if req.method == 'GET':
+            stream = self._open(path, file_path)
+
+            # NOTE(kgriffs): The cached metadata may be up to cache_ttl
+            # seconds old, but the headers must describe the file that
+            # is actually served, so check it against the open file.
+            st = os.fstat(stream.fileno())
+            actual_etag = _make_etag(st, encoding)
+
+            if actual_etag != etag:
+                self._cache.pop(path)
+
+                etag = actual_etag
+                size = st.st_size
+
+                if encoding is None:
+                    modified = _get_modified(st)
+                    last_modified = dt_to_http(modified)
+
+        resp.etag = etag
+        resp.set_header('Last-Modified', last_modified)
+
+        try:
+            self._set_body(req, resp, stream, etag, modified, last_modified,
+                           size)
+        except Exception:
+            if stream is not None:
+                stream.close()
+
+            raise
+
+    def _set_body(self, req, resp, stream, etag, modified, last_modified,
+                  size):
+        """Set the status and body, or the length of the body for HEAD."""
+
+        if req.matches_validators(etag, modified):
+            resp.status = status.HTTP_304
+
+            if stream is not None:
+                stream.close()
+
+            return
+
+        first, last = self._get_range(req, etag, last_modified, size)
+
+        if first is not None:
+            resp.status = status.HTTP_206
+            resp.content_range = (first, last, size)
+            size = last - first + 1
+
+        if stream is None:
+            # NOTE(kgriffs): Falcon does not derive Content-Length for
+            # HEAD requests, so set it explicitly.
+            resp.set_header('Content-Length', str(size))
+            return
+
+        if first is None:
+            # NOTE(kgriffs): Pass the file object itself, so that the
+            # server may use wsgi.file_wrapper (and thus sendfile)
+            resp.set_stream(stream, size)
+        else:
+            stream.seek(first)
+            resp.set_stream(_read_range(stream, size), size)
+
+    def _open(self, path, file_path):
+        """Open the file to serve, dropping its metadata if it is gone."""
+
+        try:
+            return open(file_path, 'rb')
+        except (IOError, OSError):
+            self._cache.pop(path)
+            raise _NOT_FOUND
+
+    def _resolve(self, request_path):
+        """Map a request path to a file path under the directory."""
+
+        if not request_path.startswith(self._prefix):
+            raise _NOT_FOUND
+
+        segments = []
+        for segment in request_path[len(self._prefix):].split('/'):
+            if not segment or segment == '.':
+                continue
+
+            if (segment == '..' or '\\' in segment or '\x00' in segment or
+                    os.sep in segment):
+                raise _NOT_FOUND
+
+            segments.append(segment)
+
+        if not segments:
+            raise _NOT_FOUND
+
+        return os.path.join(self._directory, *segments)
+
+    def _get_info(self, path):
+        """Return cached metadata for a file, refreshing it if stale."""
+
+        now = time.time()
+
+        info = self._cache.get(path)
+        if info is None or info.expires < now:
+            info = _FileInfo.load(path)
+            if info is None:
+                self._cache.pop(path)
+                raise _NOT_FOUND
+
+            info.expires = now + self._cache_ttl
+            self._cache.set(path, info)
+
+        return info
+
+    def _get_range(self, req, etag, last_modified, size):
+        """Return the (first, last) byte positions requested, if any."""
+
+        byte_range = req.range
+        if byte_range is None:
+            return None, None
+
+        # NOTE(kgriffs): Per RFC 7233, if the validator in If-Range does
+        # not match, the entire representation must be sent instead.
+        if_range = req.if_range
+        if if_range is not None and if_range not in (etag, last_modified):
+            return None, None
+
+        first, last = byte_range
+
+        if first < 0:
+            first = max(size + first, 0)
+            last = size - 1
+        elif last < 0 or last >= size:
+            last = size - 1
+
+        if first >= size or first > last:
+            raise HTTPRangeNotSatisfiable(size)
+
+        return first, last
+
+
+def _read_range(stream, length, block_size=64 * 1024):
+    """Yield up to `length` bytes from a file, then close it."""
+
+    try:
+        while length > 0:
+            block = stream.read(min(block_size, length))
+            if not block:
+                break
+
+            length -= len(block)
+            yield block
+
+    finally:
+        stream.close()
+
+
+def _get_modified(st):
+    """Get a file's modification time, from the result of stat()."""
+    return datetime.utcfromtimestamp(int(st.st_mtime))
+
+
+def _make_etag(st, encoding=None):
+    """Make the ETag for a file, from the result of stat()."""
+
+    # NOTE(kgriffs): Like many web servers, derive the ETag from the
+    # modification time and size, rather than hashing the content.
+    etag = '"{0:x}-{1:x}'.format(int(st.st_mtime), st.st_size)
+
+    if encoding is not None:
+        etag += '-gz'
+
+    return etag + '"'
+
+
+class _FileInfo(object):
+    """Metadata for a file being served by StaticResource."""
+
+    __slots__ = ('content_type', 'etag', 'expires', 'gz_etag', 'gz_size',
+                 'last_modified', 'modified', 'size')
+
+    @classmethod
+    def load(cls, path):
+        """Stat a file and its gzip sibling; return None if not found."""
+
+        try:
+            st = os.stat(path)
+        except (IOError, OSError):
+            return None
+
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        info = cls()
+
+        info.size = st.st_size
+        info.modified = _get_modified(st)
+        info.last_modified = dt_to_http(info.modified)
+        info.etag = _make_etag(st)
+
+        content_type, _ = mimetypes.guess_type(path)
+        info.content_type = content_type or 'application/octet-stream'
+
+        info.gz_size = None
+        info.gz_etag = None
+
+        try:
+            gz_st = os.stat(path + '.gz')
+        except (IOError, OSError):
+            pass
+        else:
+            if stat.S_ISREG(gz_st.st_mode):
+                info.gz_size = gz_st.st_size
+                info.gz_etag = _make_etag(gz_st, 'gzip')
+
+        info.expires = 0
+        return info
@@ -15,7 +15,6 @@
 import random
 import io
 import sys
-from datetime import datetime
 
 import six
 
@@ -34,7 +33,7 @@ def httpnow():
 
     """
 
-    return falcon.dt_to_http(datetime.utcnow())
+    return falcon.http_now()
 
 
 def rand_string(min, max):
@@ -1,5 +1,7 @@
 # Hoist misc. utils
 from falcon.util.misc import *  # NOQA
+from falcon.util import lru
 from falcon.util import structures
 
 CaseInsensitiveDict = structures.CaseInsensitiveDict
+LRUCache = lru.LRUCache
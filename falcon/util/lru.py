@@ -0,0 +1,146 @@
+# Copyright 2013 by Rackspace Hosting, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+
+
+class LRUCache(object):
+    """A thread-safe, bounded mapping that evicts least-recently-used items.
+
+    The capacity of the cache may be expressed either as a number of
+    items, or, when a `sizeof` function is given, as the total size of
+    the cached values as reported by that function (e.g., a number of
+    bytes).
+
+    Args:
+        capacity (int): Maximum number of items, or maximum total size
+            of the cached values when `sizeof` is specified.
+
+    Keyword Args:
+        sizeof (callable): Function of the form ``func(value)`` that
+            returns the size of a value, as an int (default ``None``).
+            Values that are larger than the cache's entire capacity
+            are not cached.
+
+    """
+
+    __slots__ = ('_capacity', '_items', '_lock', '_size', '_sizeof')
+
+    def __init__(self, capacity, sizeof=None):
+        self._capacity = capacity
+        self._sizeof = sizeof
+        self._size = 0
+
+        # NOTE(kgriffs): Values are stored as (value, size) tuples, and
+        # the order of the dict tracks recency, oldest first.
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def capacity(self):
+        """Maximum number of items or total size of the cache."""
+        return self._capacity
+
+    @property
+    def size(self):
+        """Current number of items or total size of the cached values."""
+        return self._size
+
+    def get(self, key, default=None):
+        """Return a cached value, marking it as recently used.
+
+        Args:
+            key: Key of the value to return.
+
+        Keyword Args:
+            default: Value to return if the key is not in the cache
+                (default ``None``).
+
+        """
+
+        with self._lock:
+            try:
+                # PERF(kgriffs): Re-inserting the item moves it to the
+                # end; OrderedDict.move_to_end() is not available
+                # under Python 2.
+                entry = self._items.pop(key)
+            except KeyError:
+                return default
+
+            self._items[key] = entry
+
+        return entry[0]
+
+    def set(self, key, value):
+        """Add or replace a value, evicting older items as needed.
+
+        Args:
+            key: Key under which to store the value.
+            value: Value to store.
+
+        """
+
+        size = 1 if self._sizeof is None else self._sizeof(value)
+
+        with self._lock:
+            items = self._items
+
+            previous = items.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            if size > self._capacity:
+                return
+
+            self._size += size
+            while self._size > self._capacity:
+                _, (_, evicted_size) = items.popitem(last=False)
+                self._size -= evicted_size
+
+            items[key] = (value, size)
+
+    def pop(self, key, default=None):
+        """Remove a value from the cache and return it.
+
+        Args:
+            key: Key of the value to remove.
+
+        Keyword Args:
+            default: Value to return if the key is not in the cache
+                (default ``None``).
+
+        """
+
+        with self._lock:
+            entry = self._items.pop(key, None)
+            if entry is None:
+                return default
+
+            self._size -= entry[1]
+
+        return entry[0]
+
+    def clear(self):
+        """Remove all values from the cache."""
+
+        with self._lock:
+            self._items.clear()
+            self._size = 0
@@ -15,6 +15,7 @@
 import datetime
 import functools
 import inspect
+import time
 import warnings
 
 import six
@@ -23,6 +24,7 @@ __all__ = (
     'deprecated',
     'dt_to_http',
     'http_date_to_dt',
+    'http_now',
     'to_query_str',
     'get_bound_method',
 )
@@ -69,6 +71,17 @@ def deprecated(instructions):
     return decorator
 
 
+# NOTE(kgriffs): HTTP dates always use English day and month names,
+# whereas strftime's %a and %b depend on the current locale.
+_WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# NOTE(kgriffs): A (timestamp, formatted) tuple, replaced wholesale so
+# that threads never see a half-updated value.
+_http_now_cache = (None, None)
+
+
 def dt_to_http(dt):
     """Converts a datetime instance to an HTTP date string.
 
@@ -81,8 +94,38 @@ def dt_to_http(dt):
 
     """
 
+    # PERF(kgriffs): %-formatting with lookup tables is faster than
+    # strftime, and is not affected by the locale.
+    #
     # Tue, 15 Nov 1994 12:45:26 GMT
-    return dt.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    return '%s, %02d %s %04d %02d:%02d:%02d GMT' % (
+        _WEEKDAY_NAMES[dt.weekday()], dt.day, _MONTH_NAMES[dt.month - 1],
+        dt.year, dt.hour, dt.minute, dt.second)
+
+
+def http_now():
+    """Returns the current UTC time as an HTTP date string.
+
+    The formatted string is cached for the remainder of the current
+    second, and the cache is shared by all threads, so this function
+    is cheap enough to call for every response.
+
+    Returns:
+        str: An RFC 1123 date string, e.g.:
+            "Tue, 15 Nov 1994 12:45:26 GMT".
+
+    """
+
+    global _http_now_cache
+
+    now = int(time.time())
+
+    cached_now, formatted = _http_now_cache
+    if cached_now != now:
+        formatted = dt_to_http(datetime.datetime.utcfromtimestamp(now))
+        _http_now_cache = (now, formatted)
+
+    return formatted
 
 
 def http_date_to_dt(http_date):
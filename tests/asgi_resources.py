@@ -0,0 +1,404 @@
+"""Coroutine-based resources, middleware and hooks for test_asgi.
+
+These are kept out of test_asgi itself, since the syntax requires
+Python 3.5+, while the test module must still be importable under
+earlier versions in order to be skipped.
+
+"""
+
+import asyncio
+import threading
+
+import falcon
+from falcon.asgi import testing as asgi_testing
+
+
+async def tick():
+    # NOTE(kgriffs): Yield to the event loop, so that the tests are
+    # sure to exercise actual suspension of each coroutine.
+    await asyncio.sleep(0)
+
+
+class AsyncBlocks(object):
+    """An async iterator over the given blocks of bytes."""
+
+    def __init__(self, blocks):
+        self.blocks = list(blocks)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await tick()
+
+        if not self.blocks:
+            raise StopAsyncIteration
+
+        return self.blocks.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncReader(object):
+    """A file-like object with a coroutine read() method."""
+
+    def __init__(self, data):
+        self.data = data
+        self.block_sizes = []
+
+    async def read(self, size):
+        await tick()
+
+        self.block_sizes.append(size)
+
+        block = self.data[:size]
+        self.data = self.data[size:]
+        return block
+
+
+class ThingsResource(object):
+
+    def __init__(self, calls=None):
+        self.calls = calls if calls is not None else []
+
+    async def on_get(self, req, resp, thing_id):
+        await tick()
+        self.calls.append('on_get')
+
+        resp.set_header('X-Thing', thing_id)
+        detail = req.get_param('detail') or ''
+        resp.body = 'thing ' + thing_id + ' ' + detail
+
+    async def on_post(self, req, resp, thing_id):
+        await tick()
+
+        resp.status = falcon.HTTP_201
+        resp.data = await req.stream.read()
+        resp.content_type = req.content_type
+
+    on_head = on_get
+
+    def on_put(self, req, resp, thing_id):
+        resp.body = 'sync ' + thing_id + req.stream.read().decode('utf-8')
+
+    async def on_delete(self, req, resp, thing_id):
+        await tick()
+        raise falcon.HTTPForbidden('Not allowed', 'Things are forever.')
+
+
+class FormResource(object):
+
+    async def on_post(self, req, resp):
+        resp.body = req.get_param('name')
+
+
+class FrozenErrorResource(object):
+
+    not_found = falcon.HTTPNotFound().freeze()
+
+    async def on_get(self, req, resp):
+        await tick()
+        raise self.not_found
+
+
+class ValueResource(object):
+    """Regular responders and hooks that return values."""
+
+    def on_get(self, req, resp):
+        resp.body = 'value'
+        return 'ignored'
+
+    @falcon.after(lambda req, resp, resource: 42)
+    async def on_put(self, req, resp):
+        await tick()
+        resp.body = 'hooked'
+
+    def on_delete(self, req, resp):
+        raise ValueError()
+
+
+class CaptureResource(object):
+
+    def __init__(self):
+        self.req = None
+
+    async def on_get(self, req, resp):
+        self.req = req
+
+
+class StreamingResource(object):
+
+    def __init__(self):
+        self.stream = None
+
+    async def on_get(self, req, resp, kind):
+        if kind == 'async-iterable':
+            self.stream = AsyncBlocks([b'Hello', b', ', b'World!'])
+            resp.stream = self.stream
+
+        elif kind == 'async-read':
+            self.stream = AsyncReader(b'Hello, World!')
+            resp.set_stream(self.stream, 13)
+            resp.stream_block_size = 5
+
+        else:
+            resp.stream = [b'Hello', b', ', b'World!']
+
+
+class AsyncMiddleware(object):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    async def process_request(self, req, resp, params):
+        await tick()
+        self.calls.append(self.name + '.process_request')
+
+        if req.get_header('X-Fail') == self.name:
+            resp.set_error(falcon.HTTPUnauthorized('Go away', 'Nope.'))
+
+    async def process_response(self, req, resp):
+        await tick()
+        self.calls.append(self.name + '.process_response')
+
+
+class SyncMiddleware(object):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def process_request(self, req, resp, params):
+        self.calls.append(self.name + '.process_request')
+
+    def process_response(self, req, resp):
+        self.calls.append(self.name + '.process_response')
+
+
+def make_hooked_resource(calls):
+
+    async def check_auth(req, resp, resource, params):
+        await tick()
+        calls.append('check_auth')
+
+        if req.get_header('Authorization') is None:
+            raise falcon.HTTPUnauthorized('Auth required', 'No token.')
+
+    def validate(req, resp, params):
+        calls.append('validate')
+
+    async def serialize(req, resp):
+        await tick()
+        calls.append('serialize')
+        resp.body = resp.body.upper()
+
+    class HookedResource(object):
+
+        @falcon.after(serialize)
+        @falcon.before(check_auth)
+        @falcon.before(validate)
+        async def on_get(self, req, resp):
+            await tick()
+            calls.append('on_get')
+            resp.body = 'hooked'
+
+    return HookedResource()
+
+
+def make_after_hook(calls):
+
+    async def after(req, resp, resource):
+        await tick()
+        calls.append('after')
+
+    return after
+
+
+async def handle_value_error(ex, req, resp, params):
+    await tick()
+
+    resp.status = falcon.HTTP_400
+    resp.body = 'Bad value: ' + str(ex)
+
+
+class FaultyResource(object):
+
+    async def on_get(self, req, resp):
+        await tick()
+        raise ValueError('eleven')
+
+
+def run_lifespan(app, events):
+    """Runs the app's lifespan protocol, returning the events it sent."""
+
+    events = list(reversed(events))
+    sent = []
+
+    async def receive():
+        return events.pop()
+
+    async def send(event):
+        sent.append(event['type'])
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(app({'type': 'lifespan'}, receive, send))
+    finally:
+        loop.close()
+
+    return sent
+
+
+class ThreadsResource(object):
+    """Records the thread on which each of its responders and hooks ran."""
+
+    def __init__(self):
+        self.threads = {}
+
+    def _record(self, name):
+        self.threads[name] = threading.current_thread()
+
+    def on_get(self, req, resp):
+        self._record('on_get')
+
+    async def on_post(self, req, resp):
+        self._record('on_post')
+
+    @falcon.before(lambda req, resp, resource, params:
+                   resource._record('before'))
+    async def on_put(self, req, resp):
+        self._record('on_put')
+
+
+class BlockingResource(object):
+
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def on_get(self, req, resp):
+        assert self.gate.wait(5)
+        resp.body = 'done'
+
+
+def simulate_overload(app, pool, resource, count):
+    """Sends concurrent requests, more than the pool can take on.
+
+    The requests that are accepted block until the overflow has been
+    rejected.
+
+    """
+
+    overflow = count - (pool.max_workers + pool.max_queue)
+
+    async def open_gate():
+        while pool.stats()['rejected'] < overflow:
+            await asyncio.sleep(0.001)
+
+        resource.gate.set()
+
+    async def run():
+        results = await asyncio.gather(open_gate(), *[
+            asgi_testing.simulate_request_async(app, 'GET', '/blocking')
+            for __ in range(count)
+        ])
+
+        return results[1:]
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def make_receive(blocks, disconnect=False, received=None):
+    """Creates an ASGI receive callable for the given blocks of a body.
+
+    Each event is also appended to `received`, if given.
+
+    """
+
+    events = [{'type': 'http.request', 'body': block, 'more_body': True}
+              for block in blocks]
+
+    if disconnect:
+        events.append({'type': 'http.disconnect'})
+    else:
+        events.append({'type': 'http.request'})
+
+    events.reverse()
+
+    async def receive():
+        await tick()
+
+        event = events.pop()
+        if received is not None:
+            received.append(event)
+
+        return event
+
+    return receive
+
+
+def call_app(app, scope, receive):
+    """Calls an ASGI app on a new event loop.
+
+    Returns:
+        list: The events sent by the app.
+
+    """
+
+    sent = []
+
+    async def send(event):
+        sent.append(event)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(app(scope, receive, send))
+    finally:
+        loop.close()
+
+    return sent
+
+
+def read_stream(stream, method, *args):
+    """Reads a stream until EOF, by calling one of its methods in turn.
+
+    Returns:
+        list: The result of each call, up to and including the first
+        one that returned no data.
+
+    """
+
+    async def read_all():
+        results = []
+
+        if method == '__aiter__':
+            async for block in stream:
+                results.append(block)
+
+        elif method == 'readinto':
+            buffer = bytearray(args[0])
+            while True:
+                count = await stream.readinto(buffer)
+                results.append(bytes(buffer[:count]))
+                if not count:
+                    break
+
+        else:
+            while True:
+                results.append(await getattr(stream, method)(*args))
+                if not results[-1]:
+                    break
+
+        return results
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(read_all())
+    finally:
+        loop.close()
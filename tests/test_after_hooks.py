@@ -254,6 +254,23 @@ class TestHooks(testing.TestBase):
         self.assertEqual(falcon.HTTP_743, self.srmock.status)
         self.assertEqual(actual_body, u'fluffy and cute and smart')
 
+    def test_global_after_hook_type_error_after_exception(self):
+        calls = []
+
+        def broken(req, resp, resource):
+            calls.append(resource)
+            raise TypeError('Bug in hook')
+
+        self.api = falcon.API(after=broken)
+
+        resource = FaultyResource()
+        self.api.add_route(self.test_route, resource)
+
+        # NOTE(kgriffs): The hook must be called only once, and its
+        # error must not be mistaken for a signature mismatch.
+        self.assertRaises(TypeError, self.simulate_request, self.test_route)
+        self.assertEqual(calls, [resource])
+
     def test_output_validator(self):
         self.simulate_request(self.test_route)
         self.assertEqual(falcon.HTTP_723, self.srmock.status)
@@ -0,0 +1,526 @@
+import sys
+import threading
+
+import ddt
+import testtools
+
+import falcon
+import falcon.testing as testing
+
+if sys.version_info >= (3, 5):
+    import falcon.asgi
+    from falcon.asgi import testing as asgi_testing
+    from tests import asgi_resources as resources
+
+
+@ddt.ddt
+@testtools.skipIf(sys.version_info < (3, 5), 'ASGI requires Python 3.5+')
+class TestASGI(testing.TestBase):
+
+    def before(self):
+        self.calls = []
+        self.app = falcon.asgi.API()
+
+        self.things = resources.ThingsResource(self.calls)
+        self.app.add_route('/things/{thing_id}', self.things)
+
+    def simulate(self, *args, **kwargs):
+        return asgi_testing.simulate_request(self.app, *args, **kwargs)
+
+    def test_async_responder(self):
+        result = self.simulate('GET', '/things/42',
+                               query_string='detail=full')
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.text, 'thing 42 full')
+        self.assertEqual(result.headers_dict['x-thing'], '42')
+        self.assertEqual(result.headers_dict['content-length'], '13')
+        self.assertEqual(result.headers_dict['content-type'],
+                         falcon.DEFAULT_MEDIA_TYPE)
+        self.assertEqual(self.calls, ['on_get'])
+
+    def test_sync_responder(self):
+        result = self.simulate('PUT', '/things/7')
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.text, 'sync 7')
+
+    @ddt.data(None, 1, 4)
+    def test_request_body(self, chunk_size):
+        result = self.simulate('POST', '/things/1', body='{"a": 1}',
+                               headers={'Content-Type': 'application/json'},
+                               chunk_size=chunk_size)
+
+        self.assertEqual(result.status, falcon.HTTP_201)
+        self.assertEqual(result.content, b'{"a": 1}')
+        self.assertEqual(result.headers_dict['content-type'],
+                         'application/json')
+
+    @ddt.data(None, 3)
+    def test_sync_responder_request_body(self, chunk_size):
+        result = self.simulate('PUT', '/things/7', body=' and more',
+                               chunk_size=chunk_size)
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.text, 'sync 7 and more')
+
+    @ddt.data('GET', 'HEAD', 'DELETE')
+    def test_sync_responder_no_body(self, method):
+        class BodyResource(object):
+            def on_get(self, req, resp):
+                resp.set_header('X-Body', repr(req.stream.read()))
+
+            on_head = on_delete = on_get
+
+        self.app.add_route('/body', BodyResource())
+
+        received = []
+        headers = {'Content-Length': '0'} if method == 'DELETE' else None
+        scope = asgi_testing.create_scope('/body', method=method,
+                                          headers=headers)
+
+        sent = resources.call_app(
+            self.app, scope, resources.make_receive([], received=received))
+
+        # NOTE(kgriffs): The app must not wait on the client for a body
+        # that will never come.
+        self.assertEqual(received, [])
+        self.assertIn((b'x-body', b"b''"), sent[0]['headers'])
+
+    def test_sync_responder_large_body(self):
+        bodies = []
+
+        class BodyResource(object):
+            def on_put(self, req, resp):
+                bodies.append(req.stream.read())
+
+        self.app.add_route('/body', BodyResource())
+
+        # NOTE(kgriffs): Large enough to be spooled to disk.
+        body = b'x' * (3 * 1024 * 1024)
+
+        result = self.simulate('PUT', '/body', body=body,
+                               chunk_size=64 * 1024)
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(bodies, [body])
+
+    @ddt.data(None, 2)
+    def test_form_body(self, chunk_size):
+        self.app.add_route('/form', resources.FormResource())
+
+        result = self.simulate(
+            'POST', '/form', body='name=Flapjack',
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            chunk_size=chunk_size)
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.text, 'Flapjack')
+
+    @ddt.data(True, False)
+    def test_max_content_length(self, declared):
+        self.app.req_options.max_content_length = 4
+
+        # NOTE(kgriffs): Without a Content-Length header, the limit is
+        # enforced while the body is read.
+        headers = {'Content-Type': 'text/plain'}
+        if not declared:
+            headers['Transfer-Encoding'] = 'chunked'
+
+        result = self.simulate('POST', '/things/1', body='12345',
+                               headers=headers, chunk_size=2)
+
+        self.assertEqual(result.status, falcon.HTTP_413)
+
+        result = self.simulate('POST', '/things/1', body='1234',
+                               headers=headers, chunk_size=2)
+
+        self.assertEqual(result.status, falcon.HTTP_201)
+        self.assertEqual(result.content, b'1234')
+
+        result = self.simulate('POST', '/nowhere', body='12345',
+                               headers=headers)
+        self.assertEqual(result.status, falcon.HTTP_404)
+
+    def test_request_properties(self):
+        resource = resources.CaptureResource()
+        self.app.add_route('/capture', resource)
+
+        self.simulate('GET', '/capture', query_string='x=1&y=2',
+                      headers={'Accept': 'text/plain', 'X-Custom': 'yes'},
+                      root_path='/api', scheme='https', port=8443)
+
+        req = resource.req
+        self.assertIsInstance(req, falcon.asgi.Request)
+        self.assertEqual(req.path, '/capture')
+        self.assertEqual(req.app, '/api')
+        self.assertEqual(req.params, {'x': '1', 'y': '2'})
+        self.assertEqual(req.accept, 'text/plain')
+        self.assertEqual(req.get_header('X-Custom'), 'yes')
+        self.assertEqual(req.uri, 'https://falconframework.org:8443'
+                                  '/api/capture?x=1&y=2')
+        self.assertEqual(req.scope['type'], 'http')
+
+    def test_not_found_and_head(self):
+        result = self.simulate('GET', '/nowhere')
+        self.assertEqual(result.status, falcon.HTTP_404)
+
+        result = self.simulate('HEAD', '/things/42')
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.content, b'')
+
+    def test_http_error(self):
+        result = self.simulate('DELETE', '/things/42')
+
+        self.assertEqual(result.status, falcon.HTTP_403)
+        self.assertIn('Things are forever.', result.text)
+
+    def test_async_error_handler(self):
+        self.app.add_route('/faulty', resources.FaultyResource())
+        self.app.add_error_handler(ValueError, resources.handle_value_error)
+
+        result = self.simulate('GET', '/faulty')
+
+        self.assertEqual(result.status, falcon.HTTP_400)
+        self.assertEqual(result.text, 'Bad value: eleven')
+
+    @ddt.data(True, False)
+    def test_frozen_error_traceback_released(self, with_handler):
+        if with_handler:
+            def handler(ex, req, resp, params):
+                resp.status = ex.status
+
+            self.app.add_error_handler(falcon.HTTPNotFound, handler)
+
+        resource = resources.FrozenErrorResource()
+        self.app.add_route('/frozen', resource)
+
+        for i in range(10):
+            self.assertEqual(self.simulate('GET', '/frozen').status,
+                             falcon.HTTP_404)
+            self.assertIsNone(resource.not_found.__traceback__)
+            self.assertIsNone(resource.not_found.__context__)
+
+    def test_sync_return_values_ignored(self):
+        class ValueMiddleware(object):
+            def process_response(self, req, resp):
+                return True
+
+        apps = (falcon.asgi.API(),
+                falcon.asgi.API(middleware=ValueMiddleware()))
+        for app in apps:
+            self.app = app
+            self.app.add_route('/value', resources.ValueResource())
+            self.app.add_error_handler(
+                ValueError, lambda ex, req, resp, params: resp)
+
+            result = self.simulate('GET', '/value')
+            self.assertEqual(result.status, falcon.HTTP_200)
+            self.assertEqual(result.text, 'value')
+
+            result = self.simulate('PUT', '/value')
+            self.assertEqual(result.text, 'hooked')
+
+            result = self.simulate('DELETE', '/value')
+            self.assertEqual(result.status, falcon.HTTP_200)
+
+    def test_set_unhandled_error(self):
+        class FaultyResource(object):
+            def on_get(self, req, resp):
+                resp.set_error(ValueError())
+
+        self.app.add_route('/faulty', FaultyResource())
+        self.assertRaises(ValueError, self.simulate, 'GET', '/faulty')
+
+    def test_unhandled_error(self):
+        self.app.add_route('/faulty', resources.FaultyResource())
+        self.assertRaises(ValueError, self.simulate, 'GET', '/faulty')
+
+    def test_middleware(self):
+        self.app = falcon.asgi.API(middleware=[
+            resources.AsyncMiddleware('first', self.calls),
+            resources.SyncMiddleware('second', self.calls),
+        ])
+
+        self.app.add_route('/things/{thing_id}', self.things,
+                           middleware=resources.AsyncMiddleware('third',
+                                                                self.calls))
+
+        result = self.simulate('GET', '/things/42')
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(self.calls, [
+            'first.process_request',
+            'second.process_request',
+            'third.process_request',
+            'on_get',
+            'third.process_response',
+            'second.process_response',
+            'first.process_response',
+        ])
+
+        del self.calls[:]
+
+        result = self.simulate('GET', '/things/42',
+                               headers={'X-Fail': 'first'})
+        self.assertEqual(result.status, falcon.HTTP_401)
+        self.assertEqual(self.calls, ['first.process_request'])
+
+    def test_hooks(self):
+        self.app.add_route('/hooked', resources.make_hooked_resource(
+            self.calls))
+
+        result = self.simulate('GET', '/hooked',
+                               headers={'Authorization': 'Token 42'})
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.text, 'HOOKED')
+        self.assertEqual(self.calls,
+                         ['check_auth', 'validate', 'on_get', 'serialize'])
+
+        del self.calls[:]
+
+        result = self.simulate('GET', '/hooked')
+        self.assertEqual(result.status, falcon.HTTP_401)
+        self.assertEqual(self.calls, ['check_auth'])
+
+    def test_global_hooks(self):
+        after = resources.make_after_hook(self.calls)
+
+        self.app = falcon.asgi.API(after=after)
+        self.app.add_route('/things/{thing_id}', self.things)
+
+        self.simulate('GET', '/things/42')
+        self.assertEqual(self.calls, ['on_get', 'after'])
+
+        del self.calls[:]
+
+        result = self.simulate('DELETE', '/things/42')
+        self.assertEqual(result.status, falcon.HTTP_403)
+        self.assertEqual(self.calls, ['after'])
+
+    @ddt.data('async-iterable', 'async-read', 'iterable')
+    def test_streaming(self, kind):
+        resource = resources.StreamingResource()
+        self.app.add_route('/stream/{kind}', resource)
+
+        result = self.simulate('GET', '/stream/' + kind)
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(result.content, b'Hello, World!')
+
+        if kind == 'async-iterable':
+            self.assertEqual(result.chunks, [b'Hello', b', ', b'World!'])
+            self.assertNotIn('content-length', result.headers_dict)
+            self.assertTrue(resource.stream.closed)
+
+        elif kind == 'async-read':
+            self.assertEqual(result.chunks, [b'Hello', b', Wor', b'ld!'])
+            self.assertEqual(resource.stream.block_sizes, [5, 5, 5, 5])
+            self.assertEqual(result.headers_dict['content-length'], '13')
+
+    def test_lifespan(self):
+        sent = resources.run_lifespan(self.app, [
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ])
+
+        self.assertEqual(sent, ['lifespan.startup.complete',
+                                'lifespan.shutdown.complete'])
+
+    def test_wsgi_rejects_coroutine_responder(self):
+        api = falcon.API()
+        self.assertRaises(TypeError, api.add_route, '/things/{thing_id}',
+                          self.things)
+
+
+@ddt.ddt
+@testtools.skipIf(sys.version_info < (3, 5), 'ASGI requires Python 3.5+')
+class TestBoundedStream(testing.TestBase):
+
+    def stream(self, blocks, **kwargs):
+        receive = resources.make_receive(blocks,
+                                         kwargs.pop('disconnect', False))
+        return falcon.asgi.BoundedStream(receive, **kwargs)
+
+    @ddt.data(
+        (1, [b'a', b'b', b'c', b'd', b'e', b'']),
+        (2, [b'ab', b'cd', b'e', b'']),
+        (4, [b'abcd', b'e', b'']),
+        (None, [b'abcde', b'']),
+        (-1, [b'abcde', b'']),
+    )
+    @ddt.unpack
+    def test_read(self, size, expected):
+        stream = self.stream([b'abc', b'', b'de'])
+
+        self.assertEqual(resources.read_stream(stream, 'read', size),
+                         expected)
+        self.assertTrue(stream.eof)
+        self.assertEqual(stream.bytes_received, 5)
+
+    def test_readall(self):
+        stream = self.stream([b'abc', b'de'])
+        self.assertEqual(resources.read_stream(stream, 'readall'),
+                         [b'abcde', b''])
+
+    def test_iteration(self):
+        stream = self.stream([b'abc', b'', b'de'])
+        self.assertEqual(resources.read_stream(stream, '__aiter__'),
+                         [b'abc', b'de'])
+
+    def test_readinto(self):
+        stream = self.stream([b'abc', b'de'])
+        self.assertEqual(resources.read_stream(stream, 'readinto', 2),
+                         [b'ab', b'cd', b'e', b''])
+
+    def test_content_length(self):
+        stream = self.stream([b'abc', b'def'], content_length=4)
+        self.assertEqual(resources.read_stream(stream, 'read'),
+                         [b'abcd', b''])
+
+        stream = self.stream([b'abc'], content_length=0)
+        self.assertEqual(resources.read_stream(stream, 'read'), [b''])
+
+    def test_max_size(self):
+        stream = self.stream([b'abc', b'de'], max_size=4)
+        self.assertRaises(falcon.HTTPRequestEntityTooLarge,
+                          resources.read_stream, stream, 'read', 3)
+
+    def test_disconnect(self):
+        stream = self.stream([b'abc'], disconnect=True)
+        self.assertEqual(resources.read_stream(stream, 'read'),
+                         [b'abc', b''])
+        self.assertTrue(stream.eof)
+
+    @ddt.data('read', 'readall', '__aiter__')
+    def test_disconnect_incomplete(self, method):
+        stream = self.stream([b'abc'], content_length=10, disconnect=True)
+        self.assertRaises(falcon.HTTPBadRequest,
+                          resources.read_stream, stream, method)
+        self.assertTrue(stream.eof)
+
+    def test_disconnect_complete(self):
+        stream = self.stream([b'abc'], content_length=3, disconnect=True)
+        self.assertEqual(resources.read_stream(stream, 'read'),
+                         [b'abc', b''])
+
+
+@testtools.skipIf(sys.version_info < (3, 5), 'ASGI requires Python 3.5+')
+class TestThreadPool(testing.TestBase):
+
+    def before(self):
+        self.pool = falcon.asgi.ThreadPool(max_workers=2, max_queue=1)
+        self.app = falcon.asgi.API(thread_pool=self.pool)
+
+    def after(self):
+        self.pool.shutdown()
+
+    def simulate(self, *args, **kwargs):
+        return asgi_testing.simulate_request(self.app, *args, **kwargs)
+
+    def test_sync_responder_offloaded(self):
+        resource = resources.ThreadsResource()
+        self.app.add_route('/threads', resource)
+
+        self.simulate('GET', '/threads')
+        self.simulate('POST', '/threads')
+
+        main = threading.current_thread()
+        self.assertIsNot(resource.threads['on_get'], main)
+        self.assertIs(resource.threads['on_post'], main)
+
+        self.assertEqual(self.pool.stats()['submitted'], 1)
+        self.assertEqual(self.pool.queue_depth, 0)
+
+    def test_hooks_offloaded(self):
+        resource = resources.ThreadsResource()
+        self.app.add_route('/threads', resource)
+
+        self.simulate('PUT', '/threads')
+
+        main = threading.current_thread()
+        self.assertIsNot(resource.threads['before'], main)
+        self.assertIs(resource.threads['on_put'], main)
+
+    def test_sync_hooks_offloaded_with_responder(self):
+        calls = []
+        self.app = falcon.asgi.API(
+            after=lambda req, resp: calls.append(threading.current_thread()),
+            thread_pool=self.pool)
+
+        resource = resources.ThreadsResource()
+        self.app.add_route('/threads', resource)
+
+        self.simulate('GET', '/threads')
+
+        # NOTE(kgriffs): The hook and the responder make a single trip.
+        self.assertIs(calls[0], resource.threads['on_get'])
+        self.assertEqual(self.pool.stats()['submitted'], 1)
+
+    def test_default_responders_not_offloaded(self):
+        self.app.add_route('/threads', resources.ThreadsResource())
+
+        self.assertEqual(self.simulate('GET', '/nowhere').status,
+                         falcon.HTTP_404)
+        self.assertEqual(self.simulate('DELETE', '/threads').status,
+                         falcon.HTTP_405)
+
+        self.assertEqual(self.pool.stats()['submitted'], 0)
+
+    def test_sync_streams_offloaded(self):
+        threads = []
+
+        class Reader(object):
+            def __init__(self):
+                self.blocks = [b'ab', b'cd']
+
+            def read(self, size):
+                threads.append(threading.current_thread())
+                return self.blocks.pop(0) if self.blocks else b''
+
+        def generate():
+            for block in (b'ab', b'cd'):
+                threads.append(threading.current_thread())
+                yield block
+
+        class StreamResource(object):
+            def on_get(self, req, resp, kind):
+                resp.stream = Reader() if kind == 'file' else generate()
+
+        self.app.add_route('/stream/{kind}', StreamResource())
+
+        for kind in ('file', 'generator'):
+            del threads[:]
+
+            result = self.simulate('GET', '/stream/' + kind)
+            self.assertEqual(result.content, b'abcd')
+
+            self.assertTrue(threads)
+            self.assertNotIn(threading.current_thread(), threads)
+
+    def test_queue_full(self):
+        resource = resources.BlockingResource()
+        self.app.add_route('/blocking', resource)
+
+        results = resources.simulate_overload(self.app, self.pool,
+                                              resource, 4)
+
+        statuses = sorted(result.status for result in results)
+        self.assertEqual(statuses, [falcon.HTTP_200] * 3 + [falcon.HTTP_503])
+
+        rejected = [r for r in results if r.status == falcon.HTTP_503][0]
+        self.assertEqual(rejected.headers_dict['retry-after'], '1')
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['submitted'], 3)
+        self.assertEqual(stats['rejected'], 1)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['active'], 0)
+        self.assertGreaterEqual(stats['max_queue_depth'], 1)
+        self.assertGreater(stats['wait_time_max'], 0)
+        self.assertGreaterEqual(stats['wait_time'], stats['wait_time_max'])
+
+        self.assertIsNone(self.pool._rejection.__traceback__)
+
+    def test_max_queue_requires_max_workers(self):
+        self.assertRaises(ValueError, falcon.asgi.ThreadPool, max_queue=10)
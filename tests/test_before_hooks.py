@@ -1,5 +1,6 @@
-import json
+import functools
 import io
+import json
 
 import falcon
 import falcon.testing as testing
@@ -308,3 +309,68 @@ class TestHooks(testing.TestBase):
         self.simulate_request('/wrapped_aware', query_string='limit=101')
         self.assertEqual(falcon.HTTP_400, self.srmock.status)
         self.assertEqual('fuzzy', self.wrapped_aware_resource.bunnies)
+
+    def test_hook_order_when_flattened(self):
+        calls = []
+
+        def record(name):
+            def before(req, resp, resource, params):
+                calls.append('before ' + name)
+
+            def after(req, resp, resource):
+                calls.append('after ' + name)
+
+            return before, after
+
+        global_before, global_after = record('global')
+        class_before, class_after = record('class')
+        one_before, one_after = record('one')
+        two_before, two_after = record('two')
+
+        def other_decorator(responder):
+            @functools.wraps(responder)
+            def do_other(self, req, resp, **kwargs):
+                calls.append('other')
+                responder(self, req, resp, **kwargs)
+
+            return do_other
+
+        @falcon.before(class_before)
+        @falcon.after(class_after)
+        class HookedResource(object):
+
+            @falcon.before(one_before)
+            @falcon.after(one_after)
+            @other_decorator
+            @falcon.before(two_before)
+            @falcon.after(two_after)
+            def on_get(self, req, resp):
+                calls.append('on_get')
+
+        self.api = falcon.API(before=global_before, after=global_after)
+        self.api.add_route(self.test_route, HookedResource())
+
+        self.simulate_request(self.test_route)
+        self.assertEqual(falcon.HTTP_200, self.srmock.status)
+
+        # NOTE(kgriffs): The hooks are merged into as few wrappers as
+        # possible, while executing in the same order as when each
+        # hook had a wrapper of its own.
+        self.assertEqual(calls, [
+            'before global',
+            'before class',
+            'before one',
+            'other',
+            'before two',
+            'on_get',
+            'after two',
+            'after one',
+            'after class',
+            'after global',
+        ])
+
+        # NOTE(kgriffs): other_decorator can't be merged with, so the
+        # hooks on either side of it end up in two separate wrappers.
+        __, __, __, before, after, __ = HookedResource.on_get._falcon_hooks
+        self.assertEqual(len(before), 2)
+        self.assertEqual(len(after), 2)
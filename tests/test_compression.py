@@ -0,0 +1,178 @@
+import gzip
+import io
+import zlib
+
+import ddt
+
+import falcon
+from falcon.middleware import CompressionMiddleware
+from falcon.middleware.compression import negotiate_encoding
+import falcon.testing as testing
+
+
+SAMPLE_BODY = u'{"things": [' + u', '.join([u'"thing"'] * 1000) + u']}'
+
+
+class CompressibleResource(object):
+
+    def on_get(self, req, resp):
+        resp.body = SAMPLE_BODY
+        resp.etag = '"fa0d1a60ef6616bb"'
+
+    def on_post(self, req, resp):
+        resp.data = SAMPLE_BODY.encode('utf-8')
+        resp.content_type = 'image/png'
+
+    def on_put(self, req, resp):
+        resp.body = u'{}'
+
+    def on_patch(self, req, resp):
+        data = SAMPLE_BODY.encode('utf-8')
+        resp.data = [data[:100], memoryview(data)[100:]]
+
+
+class StreamResource(object):
+
+    def __init__(self):
+        self.stream = None
+
+    def on_get(self, req, resp):
+        data = SAMPLE_BODY.encode('utf-8')
+        self.stream = io.BytesIO(data)
+        resp.set_stream(self.stream, len(data))
+
+    def on_post(self, req, resp):
+        data = SAMPLE_BODY.encode('utf-8')
+        resp.stream = (data[i:i + 100] for i in range(0, len(data), 100))
+
+
+@ddt.ddt
+class TestCompressionMiddleware(testing.TestBase):
+
+    def before(self):
+        self.api = falcon.API(middleware=[CompressionMiddleware()])
+        self.api.add_route(self.test_route, CompressibleResource())
+
+    def _decompress(self, body, wbits):
+        return zlib.decompress(b''.join(body), wbits).decode('utf-8')
+
+    @ddt.data(
+        ('gzip', 'gzip'),
+        ('gzip, deflate', 'gzip'),
+        ('deflate', 'deflate'),
+        ('gzip;q=0.5, deflate', 'deflate'),
+        ('x-gzip', 'gzip'),
+        ('*', 'gzip'),
+        ('*;q=0, deflate', 'deflate'),
+        ('identity', None),
+        ('gzip;q=0', None),
+        ('gzip;q=bogus', None),
+        ('', None),
+        (None, None),
+    )
+    @ddt.unpack
+    def test_negotiate_encoding(self, accept_encoding, expected):
+        self.assertEqual(negotiate_encoding(accept_encoding), expected)
+
+    def test_gzip_body(self):
+        body = self.simulate_request(self.test_route,
+                                     headers={'Accept-Encoding': 'gzip'})
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertEqual(headers['vary'], 'Accept-Encoding')
+        self.assertEqual(headers['etag'], 'W/"fa0d1a60ef6616bb"')
+
+        self.assertEqual(int(headers['content-length']), len(body[0]))
+        self.assertLess(len(body[0]), len(SAMPLE_BODY))
+
+        data = gzip.GzipFile(fileobj=io.BytesIO(body[0])).read()
+        self.assertEqual(data.decode('utf-8'), SAMPLE_BODY)
+
+    def test_deflate_body(self):
+        body = self.simulate_request(self.test_route,
+                                     headers={'Accept-Encoding': 'deflate'})
+
+        self.assertEqual(self.srmock.headers_dict['content-encoding'],
+                         'deflate')
+        self.assertEqual(self._decompress(body, zlib.MAX_WBITS), SAMPLE_BODY)
+
+    def test_data_buffers(self):
+        body = self.simulate_request(self.test_route, method='PATCH',
+                                     headers={'Accept-Encoding': 'deflate'})
+
+        self.assertEqual(self.srmock.headers_dict['content-encoding'],
+                         'deflate')
+        self.assertEqual(self._decompress(body, zlib.MAX_WBITS), SAMPLE_BODY)
+
+    def test_not_accepted(self):
+        body = self.simulate_request(self.test_route, decode='utf-8')
+
+        headers = self.srmock.headers_dict
+        self.assertNotIn('content-encoding', headers)
+        self.assertEqual(headers['vary'], 'Accept-Encoding')
+        self.assertEqual(headers['etag'], '"fa0d1a60ef6616bb"')
+        self.assertEqual(body, SAMPLE_BODY)
+
+    def test_media_type_not_allowed(self):
+        self.simulate_request(self.test_route, method='POST',
+                              headers={'Accept-Encoding': 'gzip'})
+
+        headers = self.srmock.headers_dict
+        self.assertNotIn('content-encoding', headers)
+        self.assertNotIn('vary', headers)
+        self.assertEqual(int(headers['content-length']),
+                         len(SAMPLE_BODY))
+
+    def test_min_size(self):
+        body = self.simulate_request(self.test_route, method='PUT',
+                                     headers={'Accept-Encoding': 'gzip'},
+                                     decode='utf-8')
+
+        self.assertNotIn('content-encoding', self.srmock.headers_dict)
+        self.assertEqual(body, u'{}')
+
+    def test_stream(self):
+        resource = StreamResource()
+        self.api.add_route('/stream', resource)
+
+        body = self.simulate_request('/stream',
+                                     headers={'Accept-Encoding': 'gzip'})
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertNotIn('content-length', headers)
+
+        # NOTE(kgriffs): Nothing is compressed until the body is iterated
+        self.assertFalse(resource.stream.closed)
+
+        data = self._decompress(body, 16 + zlib.MAX_WBITS)
+        self.assertEqual(data, SAMPLE_BODY)
+        self.assertTrue(resource.stream.closed)
+
+    def test_stream_closed_without_iterating(self):
+        resource = StreamResource()
+
+        req = falcon.Request(testing.create_environ(
+            headers={'Accept-Encoding': 'gzip'}))
+        resp = falcon.Response()
+        resource.on_get(req, resp)
+
+        CompressionMiddleware().process_response(req, resp)
+        self.assertEqual(resp.get_header('Content-Encoding'), 'gzip')
+
+        # NOTE(kgriffs): The WSGI server calls close() on the iterable it
+        # is given even if it never iterates over it, e.g., for HEAD.
+        self.assertFalse(resource.stream.closed)
+        resp.stream.close()
+        self.assertTrue(resource.stream.closed)
+
+    def test_stream_iterable(self):
+        self.api.add_route('/stream', StreamResource())
+
+        body = self.simulate_request('/stream', method='POST',
+                                     headers={'Accept-Encoding': 'deflate'})
+
+        self.assertEqual(self.srmock.headers_dict['content-encoding'],
+                         'deflate')
+        self.assertEqual(self._decompress(body, zlib.MAX_WBITS), SAMPLE_BODY)
@@ -0,0 +1,197 @@
+from datetime import datetime
+import io
+
+import ddt
+
+import falcon
+from falcon.middleware import CompressionMiddleware, ConditionalGetMiddleware
+from falcon.middleware.conditional import compute_etag
+import falcon.testing as testing
+
+
+SAMPLE_BODY = u'{"things": [' + u', '.join([u'"thing"'] * 1000) + u']}'
+SAMPLE_ETAG = compute_etag(SAMPLE_BODY.encode('utf-8'))
+LAST_MODIFIED = datetime(2013, 1, 1, 10, 30, 30, 5000)
+LAST_MODIFIED_HTTP = 'Tue, 01 Jan 2013 10:30:30 GMT'
+
+
+class ThingResource(object):
+
+    def on_get(self, req, resp):
+        resp.body = SAMPLE_BODY
+
+    def on_head(self, req, resp):
+        resp.etag = '"2a4f"'
+
+    def on_post(self, req, resp):
+        resp.body = SAMPLE_BODY
+
+
+class StreamResource(object):
+
+    def __init__(self):
+        self.stream = None
+
+    def on_get(self, req, resp):
+        self.stream = io.BytesIO(b'0123456789')
+        resp.set_stream(self.stream, 10)
+        resp.last_modified = LAST_MODIFIED
+
+
+class EarlyValidatorResource(object):
+
+    def __init__(self):
+        self.rendered = False
+
+    def on_get(self, req, resp):
+        resp.etag = 'W/"2a4f"'
+        resp.last_modified = LAST_MODIFIED
+
+        if req.matches_validators(resp.etag, LAST_MODIFIED):
+            resp.status = falcon.HTTP_304
+            return
+
+        self.rendered = True
+        resp.body = SAMPLE_BODY
+
+
+@ddt.ddt
+class TestMatchesValidators(testing.TestBase):
+
+    def _req(self, method='GET', **headers):
+        env = testing.create_environ(method=method, headers=headers)
+        return falcon.Request(env)
+
+    @ddt.data(
+        ('"2a4f"', '"2a4f"', True),
+        ('"2a4f"', 'W/"2a4f"', True),
+        ('W/"2a4f"', '"2a4f"', True),
+        ('"xyz", "2a4f"', '"2a4f"', True),
+        ('*', '"2a4f"', True),
+        ('"xyz"', '"2a4f"', False),
+        ('"2a4f"', None, False),
+    )
+    @ddt.unpack
+    def test_if_none_match(self, if_none_match, etag, expected):
+        req = self._req(**{'If-None-Match': if_none_match})
+        self.assertEqual(req.matches_validators(etag), expected)
+
+    def test_if_none_match_takes_precedence(self):
+        req = self._req(**{'If-None-Match': '"xyz"',
+                           'If-Modified-Since': LAST_MODIFIED_HTTP})
+
+        self.assertFalse(req.matches_validators('"2a4f"', LAST_MODIFIED))
+
+    @ddt.data(
+        (LAST_MODIFIED_HTTP, True),
+        ('Wed, 02 Jan 2013 10:30:30 GMT', True),
+        ('Tue, 01 Jan 2013 10:30:29 GMT', False),
+        ('yesterday', False),
+    )
+    @ddt.unpack
+    def test_if_modified_since(self, if_modified_since, expected):
+        req = self._req(**{'If-Modified-Since': if_modified_since})
+
+        self.assertEqual(req.matches_validators(last_modified=LAST_MODIFIED),
+                         expected)
+        self.assertFalse(req.matches_validators())
+
+    def test_unconditional(self):
+        req = self._req()
+        self.assertFalse(req.matches_validators('"2a4f"', LAST_MODIFIED))
+
+    def test_unsafe_method(self):
+        req = self._req(method='POST', **{'If-None-Match': '*'})
+        self.assertFalse(req.matches_validators('"2a4f"'))
+
+
+class TestConditionalGetMiddleware(testing.TestBase):
+
+    def before(self):
+        self.resource = ThingResource()
+        self.api = falcon.API(middleware=[ConditionalGetMiddleware()])
+        self.api.add_route(self.test_route, self.resource)
+
+    def test_auto_etag(self):
+        body = self.simulate_request(self.test_route, decode='utf-8')
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertEqual(self.srmock.headers_dict['etag'], SAMPLE_ETAG)
+        self.assertEqual(body, SAMPLE_BODY)
+
+        body = self.simulate_request(self.test_route,
+                                     headers={'If-None-Match': SAMPLE_ETAG})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+        self.assertEqual(self.srmock.headers_dict['etag'], SAMPLE_ETAG)
+        self.assertNotIn('content-length', self.srmock.headers_dict)
+        self.assertEqual(body, [])
+
+    def test_auto_etag_disabled(self):
+        self.api = falcon.API(
+            middleware=[ConditionalGetMiddleware(auto_etag=False)])
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route,
+                              headers={'If-None-Match': SAMPLE_ETAG})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertNotIn('etag', self.srmock.headers_dict)
+
+    def test_head(self):
+        self.simulate_request(self.test_route, method='HEAD',
+                              headers={'If-None-Match': '"2a4f"'})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+
+    def test_post(self):
+        self.simulate_request(self.test_route, method='POST',
+                              headers={'If-None-Match': SAMPLE_ETAG})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+
+    def test_stream_last_modified(self):
+        resource = StreamResource()
+        self.api.add_route('/stream', resource)
+
+        headers = {'If-Modified-Since': LAST_MODIFIED_HTTP}
+        body = self.simulate_request('/stream', headers=headers)
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+        self.assertEqual(self.srmock.headers_dict['last-modified'],
+                         LAST_MODIFIED_HTTP)
+        self.assertEqual(body, [])
+        self.assertTrue(resource.stream.closed)
+
+    def test_with_compression(self):
+        self.api = falcon.API(middleware=[CompressionMiddleware(),
+                                          ConditionalGetMiddleware()])
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route,
+                              headers={'Accept-Encoding': 'gzip'})
+
+        etag = self.srmock.headers_dict['etag']
+        self.assertEqual(etag, 'W/' + SAMPLE_ETAG)
+
+        self.simulate_request(self.test_route,
+                              headers={'Accept-Encoding': 'gzip',
+                                       'If-None-Match': etag})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+        self.assertNotIn('content-encoding', self.srmock.headers_dict)
+
+    def test_early_validators(self):
+        resource = EarlyValidatorResource()
+        self.api.add_route('/early', resource)
+
+        self.simulate_request('/early',
+                              headers={'If-None-Match': '"2a4f"'})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+        self.assertFalse(resource.rendered)
+
+        self.simulate_request('/early')
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertTrue(resource.rendered)
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import falcon
+import falcon.testing as testing
+
+
+class CookieResource:
+
+    def on_get(self, req, resp):
+        self.cookies = req.cookies
+
+        resp.set_cookie('session', 'stale', path='/')
+        resp.set_cookie('session', 'a4f3', path='/', max_age=300)
+        resp.set_cookie('theme', 'dark', secure=False, http_only=False)
+        resp.set_cookie('theme', 'light', secure=False, http_only=False,
+                        domain='example.com',
+                        expires=datetime(2015, 1, 1, 12, 30, 5))
+
+    def on_delete(self, req, resp):
+        resp.set_cookie('session', 'a4f3', path='/')
+        resp.unset_cookie('session', path='/')
+        resp.unset_cookie('session', path='/admin')
+
+
+class TestCookies(testing.TestBase):
+
+    def before(self):
+        self.resource = CookieResource()
+        self.api.add_route(self.test_route, self.resource)
+
+    def test_request_cookies(self):
+        headers = {
+            'Cookie': ('session=a4f3; theme="dark"; ;bogus; =nameless; '
+                       'session=shadowed;empty=; list=a,b')
+        }
+
+        self.simulate_request(self.test_route, headers=headers)
+
+        expected = {
+            'session': 'a4f3',
+            'theme': 'dark',
+            'empty': '',
+            'list': 'a,b',
+        }
+        self.assertEqual(self.resource.cookies, expected)
+
+    def test_request_cookies_cached(self):
+        env = testing.create_environ(headers={'Cookie': 'a=1'})
+        req = falcon.Request(env)
+
+        self.assertIs(req.cookies, req.cookies)
+        self.assertEqual(req.cookies, {'a': '1'})
+
+    def test_request_no_cookies(self):
+        self.simulate_request(self.test_route)
+        self.assertEqual(self.resource.cookies, {})
+
+    def test_response_cookies(self):
+        self.simulate_request(self.test_route)
+
+        cookies = sorted(value for name, value in self.srmock.headers
+                         if name == 'set-cookie')
+
+        expected = [
+            'session=a4f3; Max-Age=300; Path=/; Secure; HttpOnly',
+            'theme=dark',
+            ('theme=light; Expires=Thu, 01 Jan 2015 12:30:05 GMT; '
+             'Domain=example.com'),
+        ]
+        self.assertEqual(cookies, expected)
+
+    def test_unset_cookie(self):
+        self.simulate_request(self.test_route, method='DELETE')
+
+        cookies = sorted(value for name, value in self.srmock.headers
+                         if name == 'set-cookie')
+
+        expected = [
+            ('session=; Expires=Thu, 01 Jan 1970 00:00:00 GMT; '
+             'Max-Age=0; Path=/'),
+            ('session=; Expires=Thu, 01 Jan 1970 00:00:00 GMT; '
+             'Max-Age=0; Path=/admin'),
+        ]
+        self.assertEqual(cookies, expected)
+
+    def test_invalid_cookies(self):
+        resp = falcon.Response()
+
+        self.assertRaises(ValueError, resp.set_cookie, 'bad name', 'x')
+        self.assertRaises(ValueError, resp.set_cookie, 'name;', 'x')
+        self.assertRaises(ValueError, resp.set_cookie, '', 'x')
+        self.assertRaises(ValueError, resp.set_cookie, 'name\n', 'x')
+        self.assertRaises(ValueError, resp.set_cookie, 'name', 'a b')
+        self.assertRaises(ValueError, resp.set_cookie, 'name', 'a;b')
+        self.assertRaises(ValueError, resp.set_cookie, 'name', '"a"')
+        self.assertRaises(ValueError, resp.set_cookie, 'name', 'a\n')
+
+        self.assertRaises(ValueError, resp.unset_cookie, 'bad name')
+        self.assertRaises(ValueError, resp.unset_cookie, 'name;')
+        self.assertRaises(ValueError, resp.unset_cookie, '')
+        self.assertRaises(ValueError, resp.unset_cookie, 'name\r\nX: y')
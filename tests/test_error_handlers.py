@@ -101,3 +101,33 @@ class TestErrorHandler(testing.TestBase):
 
         body = self.simulate_request(self.test_route)
         self.assertEqual([b'first error handler'], body)
+
+    def test_error_order_base_class_added_last(self):
+        self.api.add_error_handler(CustomException, handle_error_first)
+        self.api.add_error_handler(Exception, capture_error)
+
+        self.api.add_route(self.test_route, ErroredClassResource())
+
+        body = self.simulate_request(self.test_route, method='DELETE')
+        self.assertEqual([b'error: CustomException'], body)
+
+        # NOTE(kgriffs): Adding a handler must invalidate any handlers
+        # that were already resolved for a given error type.
+        self.api.add_error_handler(CustomBaseException, handle_error_first)
+
+        body = self.simulate_request(self.test_route, method='DELETE')
+        self.assertEqual([b'first error handler'], body)
+
+        body = self.simulate_request(self.test_route)
+        self.assertEqual([b'error: Plain Exception'], body)
+
+    def test_tuple_of_errors(self):
+        self.api.add_error_handler((ValueError, CustomBaseException),
+                                   capture_error)
+
+        self.api.add_route(self.test_route, ErroredClassResource())
+
+        body = self.simulate_request(self.test_route, method='DELETE')
+        self.assertEqual([b'error: CustomException'], body)
+
+        self.assertRaises(Exception, self.simulate_request, self.test_route)
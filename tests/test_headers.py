@@ -158,6 +158,36 @@ class AppendHeaderResource:
         resp.append_header('X-Things', 'thing-1')
 
 
+class HeaderSetResource:
+
+    HEADERS = falcon.HeaderSet([
+        ('Content-Type', 'x-falcon/peregrine'),
+        ('X-Auth-Token', 'setecastronomy'),
+        ('Cache-Control', 'no-store'),
+    ])
+
+    def on_get(self, req, resp):
+        resp.set_headers(self.HEADERS)
+        self.resp = resp
+
+    def on_head(self, req, resp):
+        resp.set_headers(self.HEADERS)
+        resp.set_header('X-AUTH-TOKEN', 'toomanysecrets')
+        resp.append_header('Cache-Control', 'no-cache')
+        self.resp = resp
+
+    def on_post(self, req, resp):
+        resp.set_header('X-Things', 'thing-1')
+        resp.set_headers(self.HEADERS)
+        resp.etag = 'fa0d1a60ef6616bb28038515c8ea4cb2'
+        self.resp = resp
+
+    def on_put(self, req, resp):
+        resp.set_headers(self.HEADERS)
+        del resp.content_type
+        self.resp = resp
+
+
 class TestHeaders(testing.TestBase):
 
     def before(self):
@@ -390,6 +420,78 @@ class TestHeaders(testing.TestBase):
         value = self.srmock.headers_dict['x-things']
         self.assertEqual('thing-1', value)
 
+    def test_header_set(self):
+        self.resource = HeaderSetResource()
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route)
+        resp = self.resource.resp
+
+        # NOTE(kgriffs): Nothing else was set, so the set is shared
+        self.assertIs(resp._header_set, HeaderSetResource.HEADERS)
+        self.assertEqual(resp.content_type, 'x-falcon/peregrine')
+        self.assertEqual(resp.cache_control, 'no-store')
+
+        headers = self.srmock.headers
+        self.assertIn(('content-type', 'x-falcon/peregrine'), headers)
+        self.assertIn(('x-auth-token', 'setecastronomy'), headers)
+        self.assertIn(('cache-control', 'no-store'), headers)
+        self.assertIn(('content-length', '0'), headers)
+
+        # Check for duplicate headers
+        names = [name for name, value in headers]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_header_set_override(self):
+        self.resource = HeaderSetResource()
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route, method='HEAD')
+        self.assertIs(self.resource.resp._header_set, None)
+
+        headers = self.srmock.headers
+        self.assertIn(('x-auth-token', 'toomanysecrets'), headers)
+        self.assertIn(('cache-control', 'no-store,no-cache'), headers)
+        self.assertIn(('content-type', 'x-falcon/peregrine'), headers)
+
+        # NOTE(kgriffs): Make sure the shared set was not modified
+        headers_set = HeaderSetResource.HEADERS
+        self.assertEqual(headers_set.get('x-auth-token'), 'setecastronomy')
+        self.assertEqual(headers_set.get('Cache-Control'), 'no-store')
+        self.assertEqual(len(headers_set), 3)
+
+        self.simulate_request(self.test_route, method='PUT')
+        self.assertIs(self.resource.resp.content_type, None)
+        self.assertNotIn('content-type', self.srmock.headers_dict)
+        self.assertIn('Content-Type', headers_set)
+
+    def test_header_set_merge(self):
+        self.resource = HeaderSetResource()
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route, method='POST')
+        self.assertIs(self.resource.resp._header_set, None)
+
+        headers = self.srmock.headers
+        self.assertIn(('x-things', 'thing-1'), headers)
+        self.assertIn(('x-auth-token', 'setecastronomy'), headers)
+        self.assertIn(('etag', 'fa0d1a60ef6616bb28038515c8ea4cb2'), headers)
+
+    def test_date_header(self):
+        self.simulate_request(self.test_route)
+        self.assertNotIn('date', self.srmock.headers_dict)
+
+        self.api.resp_options.add_date_header = True
+        self.simulate_request(self.test_route)
+
+        date = self.srmock.headers_dict['date']
+        self.assertEqual(falcon.dt_to_http(falcon.http_date_to_dt(date)),
+                         date)
+
+        self.api.add_route('/xml', XmlResource('text/xml'))
+        self.simulate_request('/xml', method='HEAD')
+        self.assertIn('date', self.srmock.headers_dict)
+
     def test_vary_star(self):
         self.resource = VaryHeaderResource(['*'])
         self.api.add_route(self.test_route, self.resource)
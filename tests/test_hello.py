@@ -2,6 +2,7 @@ from testtools.matchers import Contains
 
 import falcon
 import io
+from falcon.response_helpers import join_data
 import falcon.testing as testing
 
 import six
@@ -22,6 +23,22 @@ class FileWrapper(object):
         raise IndexError
 
 
+class BlockSizeResource(object):
+
+    sample_data = b'x' * (100 * 1024)
+
+    def __init__(self, stream_block_size=None, stream_len=None):
+        self.stream_block_size = stream_block_size
+        self.stream_len = stream_len
+
+    def on_get(self, req, resp):
+        stream_len = self.stream_len or len(self.sample_data)
+        resp.set_stream(io.BytesIO(self.sample_data[:stream_len]),
+                        stream_len)
+
+        resp.stream_block_size = self.stream_block_size
+
+
 class HelloResource(object):
     sample_status = '200 OK'
     sample_unicode = (u'Hello World! \x80' +
@@ -63,7 +80,12 @@ class HelloResource(object):
                 resp.body = self.sample_unicode
 
         if 'data' in self.mode:
-            resp.data = self.sample_utf8
+            if 'buffers' in self.mode:
+                half = len(self.sample_utf8) // 2
+                resp.data = [self.sample_utf8[:half],
+                             memoryview(self.sample_utf8)[half:]]
+            else:
+                resp.data = self.sample_utf8
 
     def on_head(self, req, resp):
         self.on_get(req, resp)
@@ -86,6 +108,9 @@ class TestHelloWorld(testing.TestBase):
         self.data_resource = HelloResource('data')
         self.api.add_route('/data', self.data_resource)
 
+        self.buffers_resource = HelloResource('data, buffers')
+        self.api.add_route('/buffers', self.buffers_resource)
+
         self.chunked_resource = HelloResource('stream')
         self.api.add_route('/chunked-stream', self.chunked_resource)
 
@@ -160,6 +185,17 @@ class TestHelloWorld(testing.TestBase):
         self.assertEqual(resp.data, self.resource.sample_utf8)
         self.assertEqual(body, [self.resource.sample_utf8])
 
+    def test_data_buffers(self):
+        body = self.simulate_request('/buffers')
+        resp = self.buffers_resource.resp
+
+        content_length = int(self.srmock.headers_dict['content-length'])
+        self.assertEqual(content_length, len(self.resource.sample_utf8))
+
+        # NOTE(kgriffs): The list itself is returned as the WSGI iterable
+        self.assertIs(body, resp.data)
+        self.assertEqual(join_data(body), self.resource.sample_utf8)
+
     def test_no_body_on_head(self):
         body = self.simulate_request(self.test_route, method='HEAD')
         self.assertEqual(body, [])
@@ -222,6 +258,31 @@ class TestHelloWorld(testing.TestBase):
             self.assertThat(self.srmock.headers, Contains(content_length))
             self.assertEqual(dest.tell(), expected_len)
 
+    def test_stream_block_size(self):
+        self.api.add_route('/default', BlockSizeResource())
+        self.api.add_route('/override', BlockSizeResource(40 * 1024))
+        self.api.add_route('/small', BlockSizeResource(stream_len=1000))
+
+        src = self.simulate_request('/default')
+        self.assertEqual([len(chunk) for chunk in src][:2], [8192, 8192])
+
+        self.api.resp_options.stream_block_size = 64 * 1024
+        src = self.simulate_request('/default')
+        self.assertEqual([len(chunk) for chunk in src],
+                         [64 * 1024, 36 * 1024])
+
+        src = self.simulate_request('/override')
+        self.assertEqual([len(chunk) for chunk in src],
+                         [40 * 1024, 40 * 1024, 20 * 1024])
+
+        src = self.simulate_request('/override', file_wrapper=FileWrapper)
+        self.assertEqual(src.block_size, 40 * 1024)
+
+        # NOTE(kgriffs): The block size is capped to the stream length
+        src = self.simulate_request('/small', file_wrapper=FileWrapper)
+        self.assertEqual(src.block_size, 1000)
+        self.assertEqual(b''.join(src), BlockSizeResource.sample_data[:1000])
+
     def test_status_not_set(self):
         body = self.simulate_request('/nostatus')
 
@@ -5,6 +5,7 @@ import xml.etree.ElementTree as et
 
 import ddt
 from testtools.matchers import raises, Not
+import six
 import yaml
 
 import falcon.testing as testing
@@ -141,6 +142,31 @@ class MissingParamResource:
         raise falcon.HTTPMissingParam('id', code='P1003')
 
 
+class FrozenErrorResource:
+
+    auth_required = falcon.HTTPUnauthorized(
+        'Authentication Required',
+        'Missing or invalid token header.',
+        scheme='Token; UUID',
+        href='http://example.com/api/auth').freeze()
+
+    not_found = falcon.HTTPNotFound().freeze()
+
+    items = {}
+
+    def on_get(self, req, resp):
+        raise self.auth_required
+
+    def on_delete(self, req, resp):
+        raise self.not_found
+
+    def on_patch(self, req, resp):
+        try:
+            self.items[req.path]
+        except KeyError as ex:
+            six.raise_from(self.not_found, ex)
+
+
 @ddt.ddt
 class TestHTTPError(testing.TestBase):
 
@@ -251,6 +277,54 @@ class TestHTTPError(testing.TestBase):
         self.assertEqual(self.srmock.status, headers['X-Error-Status'])
         self.assertEqual(body, [expected_yaml])
 
+    def test_to_json_compact(self):
+        error = falcon.HTTPForbidden('Request denied', 'No way',
+                                     href='http://example.com/api/rbac')
+
+        compact = error.to_json(compact=True)
+        self.assertNotIn('\n', compact)
+        self.assertTrue(compact.startswith('{"title":"Request denied",'))
+        self.assertEqual(json.loads(compact), json.loads(error.to_json()))
+
+    def test_caching_error_serializer(self):
+        serializer = falcon.CachingErrorSerializer()
+        self.api.set_error_serializer(serializer)
+
+        bodies = []
+        for i in range(2):
+            body = self.simulate_request('/fail', method='POST')
+            self.assertEqual(self.srmock.status, falcon.HTTP_403)
+            bodies.append(body[0])
+
+        # NOTE(kgriffs): The second response reuses the cached bytes
+        self.assertIs(bodies[0], bodies[1])
+        self.assertEqual(json.loads(bodies[0].decode('utf-8')),
+                         json.loads(falcon.HTTPForbidden(
+                             'Request denied',
+                             'You do not have write permissions for this '
+                             'queue.',
+                             href='http://example.com/api/rbac').to_json()))
+
+        body = self.simulate_request('/fail', method='POST',
+                                     headers={'Accept': 'application/xml'})
+        self.assertEqual(self.srmock.headers_dict['content-type'],
+                         'application/xml')
+        self.assertThat(lambda: et.fromstring(body[0]),
+                        Not(raises(ValueError)))
+
+        # NOTE(kgriffs): Errors that differ are cached separately
+        headers = {
+            'X-Error-Title': u'Storage service down',
+            'X-Error-Status': falcon.HTTP_503,
+        }
+        body = self.simulate_request('/fail', headers=headers)
+        self.assertEqual(json.loads(body[0].decode('utf-8')),
+                         {'title': 'Storage service down', 'code': 10042})
+
+        body = self.simulate_request('/fail', method='POST',
+                                     headers={'Accept': 'text/plain'})
+        self.assertEqual(body, [])
+
     def test_client_does_not_accept_anything(self):
         headers = {
             'Accept': '45087gigo;;;;',
@@ -416,6 +490,99 @@ class TestHTTPError(testing.TestBase):
         self.assertEqual(response, [])
         self.assertIn(('allow', 'PUT'), self.srmock.headers)
 
+    def test_frozen(self):
+        resource = FrozenErrorResource()
+        self.api.add_route('/frozen', resource)
+
+        expected_body = {
+            u'title': u'Authentication Required',
+            u'description': u'Missing or invalid token header.',
+            u'link': {
+                u'text': u'API documention for this error',
+                u'href': u'http://example.com/api/auth',
+                u'rel': u'help',
+            },
+        }
+
+        for i in range(3):
+            body = self.simulate_request('/frozen', decode='utf-8')
+
+            self.assertEqual(self.srmock.status, falcon.HTTP_401)
+            self.assertIn(('www-authenticate', 'Token; UUID'),
+                          self.srmock.headers)
+            self.assertEqual(json.loads(body), expected_body)
+
+            body = self.simulate_request('/frozen', method='DELETE')
+            self.assertEqual(self.srmock.status, falcon.HTTP_404)
+            self.assertEqual(body, [])
+
+        error = resource.auth_required
+        self.assertTrue(error.frozen)
+        self.assertIsInstance(error, falcon.HTTPUnauthorized)
+        self.assertIs(error.freeze(), error)
+
+        def modify():
+            error.title = 'Modified'
+
+        self.assertThat(modify, raises(AttributeError))
+        self.assertEqual(error.title, 'Authentication Required')
+
+    def test_frozen_error_handler(self):
+        def handler(ex, req, resp, params):
+            raise falcon.HTTPError(falcon.HTTP_792)
+
+        self.api.add_error_handler(falcon.HTTPNotFound, handler)
+        self.api.add_route('/frozen', FrozenErrorResource())
+
+        self.simulate_request('/frozen', method='DELETE')
+        self.assertEqual(self.srmock.status, falcon.HTTP_792)
+
+    @ddt.data((True, 'DELETE'), (False, 'DELETE'),
+              (True, 'PATCH'), (False, 'PATCH'))
+    @ddt.unpack
+    def test_frozen_error_traceback_released(self, with_handler, method):
+        if with_handler:
+            def handler(ex, req, resp, params):
+                resp.status = ex.status
+
+            self.api.add_error_handler(falcon.HTTPNotFound, handler)
+
+        resource = FrozenErrorResource()
+        self.api.add_route('/frozen', resource)
+
+        for i in range(10):
+            self.simulate_request('/frozen', method=method)
+            self.assertEqual(self.srmock.status, falcon.HTTP_404)
+
+            # NOTE(kgriffs): Otherwise, the traceback would grow each
+            # time the error is raised, keeping every request alive.
+            self.assertIsNone(getattr(resource.not_found,
+                                      '__traceback__', None))
+            self.assertIsNone(getattr(resource.not_found,
+                                      '__context__', None))
+            self.assertIsNone(getattr(resource.not_found,
+                                      '__cause__', None))
+
+    def test_lazy_link(self):
+        error = falcon.HTTPError(falcon.HTTP_400, href=u'/api/\xe7limate')
+        self.assertIsNone(error._link)
+
+        link = error.link
+        self.assertEqual(link['href'], '/api/%C3%A7limate')
+        self.assertIs(error.link, link)
+
+        error.link = None
+        self.assertIsNone(error.link)
+        self.assertIsNone(falcon.HTTPError(falcon.HTTP_400).link)
+
+    def test_lazy_description(self):
+        error = falcon.HTTPMissingParam('id')
+        self.assertEqual(error.description,
+                         'The "id" query parameter is required.')
+
+        error.description = 'Please provide an ID.'
+        self.assertEqual(error.description, 'Please provide an ID.')
+
     def test_411(self):
         self.api.add_route('/411', LengthRequiredResource())
         body = self.simulate_request('/411')
@@ -1,4 +1,5 @@
 import falcon
+from falcon import api_helpers as helpers
 import falcon.testing as testing
 from datetime import datetime
 
@@ -71,6 +72,30 @@ class TestRequestTimeMiddleware(TestMiddleware):
         mw_list = [{'process_request': 90}]
         self.assertRaises(TypeError, falcon.API, middleware=mw_list)
 
+    def test_middleware_phases(self):
+        first = ExecutedFirstMiddleware()
+        request_time = RequestTimeMiddleware()
+        transaction_id = TransactionIdMiddleware()
+
+        middleware = helpers.prepare_middleware([first, transaction_id,
+                                                 request_time])
+        request_mw, response_mw = helpers.prepare_middleware_phases(
+            middleware)
+
+        self.assertEqual(request_mw, (
+            (0, first.process_request),
+            (1, transaction_id.process_request),
+            (2, request_time.process_request),
+        ))
+
+        # NOTE(kgriffs): TransactionIdMiddleware has no process_response
+        self.assertEqual(response_mw, (
+            (),
+            (first.process_response,),
+            (first.process_response,),
+            (request_time.process_response, first.process_response),
+        ))
+
     def test_response_middleware_raises_exception(self):
         """Test that error in response middleware is propagated up"""
         class RaiseErrorMiddleware(object):
@@ -264,6 +289,34 @@ class TestSeveralMiddlewares(TestMiddleware):
         ]
         self.assertEqual(expectedExecutedMethods, context['executed_methods'])
 
+    def test_order_mw_executed_when_http_error_in_resp(self):
+        """Test that an HTTPError in process_response resumes unwinding"""
+        global context
+
+        class RaiseHTTPErrorMiddleware(object):
+
+            def process_response(self, req, resp):
+                raise falcon.HTTPForbidden('Nope', 'Not for you')
+
+        self.api = falcon.API(middleware=[ExecutedFirstMiddleware(),
+                                          RaiseHTTPErrorMiddleware(),
+                                          ExecutedLastMiddleware()])
+
+        self.api.add_route(self.test_route, MiddlewareClassResource())
+
+        self.simulate_request(self.test_route)
+        self.assertEqual(self.srmock.status, falcon.HTTP_403)
+
+        # NOTE(kgriffs): The component that raised the error is not
+        # called again when the rest of the stack is unwound.
+        expectedExecutedMethods = [
+            "ExecutedFirstMiddleware.process_request",
+            "ExecutedLastMiddleware.process_request",
+            "ExecutedLastMiddleware.process_response",
+            "ExecutedFirstMiddleware.process_response"
+        ]
+        self.assertEqual(expectedExecutedMethods, context['executed_methods'])
+
     def test_order_mw_executed_when_exception_in_req(self):
         """Test that error in inner middleware leaves"""
         global context
@@ -292,3 +345,96 @@ class TestSeveralMiddlewares(TestMiddleware):
             "ExecutedFirstMiddleware.process_response"
         ]
         self.assertEqual(expectedExecutedMethods, context['executed_methods'])
+
+    def test_order_mw_executed_when_response_complete(self):
+        """Test that completing the response in process_request unwinds"""
+        global context
+
+        class CompleteMiddleware(ExecutedFirstMiddleware):
+
+            def process_request(self, req, resp, params):
+                ExecutedFirstMiddleware.process_request(self, req, resp,
+                                                        params)
+                resp.body = 'cached'
+                resp.complete = True
+
+        resource = MiddlewareClassResource()
+        self.api = falcon.API(middleware=[ExecutedFirstMiddleware(),
+                                          CompleteMiddleware(),
+                                          ExecutedLastMiddleware()])
+
+        self.api.add_route(self.test_route, resource)
+
+        body = self.simulate_request(self.test_route, decode='utf-8')
+        self.assertEqual(body, 'cached')
+
+        # The last component and the responder are skipped
+        expectedExecutedMethods = [
+            "ExecutedFirstMiddleware.process_request",
+            "CompleteMiddleware.process_request",
+            "CompleteMiddleware.process_response",
+            "ExecutedFirstMiddleware.process_response"
+        ]
+        self.assertEqual(expectedExecutedMethods, context['executed_methods'])
+
+
+class TestRouteMiddleware(TestMiddleware):
+
+    def test_route_middleware(self):
+        global context
+        self.api = falcon.API(middleware=ExecutedFirstMiddleware())
+
+        class AuditedResource(MiddlewareClassResource):
+            middleware = (RequestTimeMiddleware(),)
+
+        self.api.add_route('/plain', MiddlewareClassResource())
+        self.api.add_route(self.test_route, AuditedResource(),
+                           middleware=[TransactionIdMiddleware(),
+                                       ExecutedLastMiddleware()])
+
+        self.simulate_request('/plain')
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertNotIn('start_time', context)
+        self.assertNotIn('transaction_id', context)
+        self.assertEqual(context['executed_methods'], [
+            'ExecutedFirstMiddleware.process_request',
+            'ExecutedFirstMiddleware.process_response',
+        ])
+
+        context['executed_methods'] = []
+
+        body = self.simulate_request(self.test_route)
+        self.assertEqual([{'status': 'ok'}], body)
+        self.assertIn('start_time', context)
+        self.assertIn('end_time', context)
+        self.assertIn('transaction_id', context)
+
+        # NOTE(kgriffs): Route middleware is nested inside the global
+        # middleware.
+        self.assertEqual(context['executed_methods'], [
+            'ExecutedFirstMiddleware.process_request',
+            'ExecutedLastMiddleware.process_request',
+            'ExecutedLastMiddleware.process_response',
+            'ExecutedFirstMiddleware.process_response',
+        ])
+
+    def test_route_middleware_without_global(self):
+        global context
+
+        self.api.add_route('/plain', MiddlewareClassResource())
+        self.api.add_route(self.test_route, MiddlewareClassResource(),
+                           middleware=RequestTimeMiddleware())
+
+        self.simulate_request('/plain')
+        self.assertNotIn('start_time', context)
+
+        # NOTE(kgriffs): Methods not implemented by the resource get
+        # the route middleware too.
+        self.simulate_request(self.test_route, method='POST')
+        self.assertEqual(self.srmock.status, falcon.HTTP_405)
+        self.assertIn('start_time', context)
+        self.assertIn('end_time', context)
+
+    def test_invalid_route_middleware(self):
+        self.assertRaises(TypeError, self.api.add_route, self.test_route,
+                          MiddlewareClassResource(), middleware=['nope'])
@@ -1,4 +1,5 @@
 from falcon.request import RequestOptions
+from falcon.response import ResponseOptions
 import falcon.testing as testing
 
 
@@ -19,3 +20,20 @@ class TestRequestOptions(testing.TestBase):
             options.invalid_option_and_attribute = True
 
         self.assertRaises(AttributeError, _assign_invalid)
+
+
+class TestResponseOptions(testing.TestBase):
+
+    def test_correct_options(self):
+        options = ResponseOptions()
+        self.assertFalse(options.add_date_header)
+        self.assertEqual(options.stream_block_size, 8 * 1024)
+        self.assertEqual(self.api.resp_options.stream_block_size, 8 * 1024)
+
+    def test_incorrect_options(self):
+        options = ResponseOptions()
+
+        def _assign_invalid():
+            options.invalid_option_and_attribute = True
+
+        self.assertRaises(AttributeError, _assign_invalid)
@@ -1,6 +1,9 @@
+import array
+
 import ddt
 
 import falcon
+from falcon import request
 import falcon.testing as testing
 
 
@@ -23,6 +26,7 @@ class _TestQueryParams(testing.TestBase):
         self.assertIs(req.get_param_as_int('limit'), None)
         self.assertIs(req.get_param_as_bool('limit'), None)
         self.assertIs(req.get_param_as_list('limit'), None)
+        self.assertIs(req.get_param_as_array('limit'), None)
 
     def test_blank(self):
         query_string = 'marker='
@@ -80,7 +84,7 @@ class _TestQueryParams(testing.TestBase):
         self.assertEqual(req.get_param('_charset_'), 'utf-8')
 
     @ddt.data('get_param', 'get_param_as_int', 'get_param_as_bool',
-              'get_param_as_list')
+              'get_param_as_list', 'get_param_as_array')
     def test_required(self, method_name):
         query_string = ''
         self.simulate_request('/', query_string=query_string)
@@ -368,6 +372,49 @@ class _TestQueryParams(testing.TestBase):
                              'The value is not formatted correctly.')
             self.assertEqual(ex.description, expected_desc)
 
+    def test_array_type(self):
+        query_string = ('ids=4,,8,15,16,23,42&limit=25&coord=1.5,-2.25'
+                        '&neg=-1,2&big=99999999999&bogus=1,x,3'
+                        '&thing=4&thing=&thing=2')
+        self.simulate_request('/', query_string=query_string)
+
+        req = self.resource.req
+
+        ids = req.get_param_as_array('ids')
+        self.assertIsInstance(ids, array.array)
+        self.assertEqual(ids.typecode, request.DEFAULT_ARRAY_TYPECODE)
+        self.assertEqual(ids.tolist(), [4, 8, 15, 16, 23, 42])
+
+        self.assertEqual(req.get_param_as_array('limit').tolist(), [25])
+        self.assertEqual(req.get_param_as_array('thing', 'i').tolist(),
+                         [4, 2])
+        self.assertEqual(req.get_param_as_array('neg', 'h').tolist(),
+                         [-1, 2])
+        self.assertEqual(req.get_param_as_array('coord', 'd').tolist(),
+                         [1.5, -2.25])
+
+        store = {}
+        ids = req.get_param_as_array('ids', 'H', store=store)
+        self.assertIs(store['ids'], ids)
+        self.assertEqual(ids.typecode, 'H')
+
+        for name, typecode in (('bogus', 'l'), ('coord', 'l'),
+                               ('neg', 'B'), ('big', 'i')):
+            try:
+                req.get_param_as_array(name, typecode)
+                self.fail('falcon.HTTPInvalidParam not raised')
+            except falcon.HTTPInvalidParam as ex:
+                self.assertEqual(ex.title, 'Invalid query parameter')
+                expected_desc = ('The "{0}" query parameter is invalid. '
+                                 'The value is not formatted correctly.')
+                self.assertEqual(ex.description, expected_desc.format(name))
+
+        # NOTE(kgriffs): A bad type code is the app's mistake, not the
+        # client's, whether or not the param is present.
+        for name, typecode in (('ids', 'x'), ('ids', 'u'), ('missing', 'x')):
+            self.assertRaises(ValueError, req.get_param_as_array, name,
+                              typecode)
+
     def test_param_property(self):
         query_string = 'ant=4&bee=3&cat=2&dog=1'
         self.simulate_request('/', query_string=query_string)
@@ -1,3 +1,4 @@
+import hashlib
 import io
 import multiprocessing
 from wsgiref import simple_server
@@ -161,3 +162,165 @@ class TestRequestBody(testing.TestBase):
         body = request_helpers.Body(stream, expected_len)
         for i, line in enumerate(body):
             self.assertEqual(line, expected_lines[i])
+
+    def test_stream_tee(self):
+        data = testing.rand_string(SIZE_1_KB * 3, SIZE_1_KB * 5)
+        data = data.encode('utf-8')
+
+        class NoReadInto(object):
+            def __init__(self, data):
+                self.read = io.BytesIO(data).read
+
+        streams = [
+            io.BytesIO(data),
+            request_helpers.Body(io.BytesIO(data), len(data)),
+            NoReadInto(data),
+        ]
+
+        for stream in streams:
+            destination = io.BytesIO()
+            tee = request_helpers.StreamTee(
+                stream, destination,
+                hashers=[hashlib.md5(), hashlib.sha256()],
+                block_size=SIZE_1_KB)
+
+            self.assertEqual(tee.run(), len(data))
+            self.assertEqual(tee.bytes_read, len(data))
+            self.assertEqual(destination.getvalue(), data)
+
+            expected = {
+                'md5': hashlib.md5(data).hexdigest(),
+                'sha256': hashlib.sha256(data).hexdigest(),
+            }
+            self.assertEqual(tee.hexdigests, expected)
+
+    def test_stream_tee_stream_len(self):
+        data = b'0123456789'
+
+        for stream in (io.BytesIO(data), request_helpers.Body(
+                io.BytesIO(data), 4)):
+            tee = request_helpers.StreamTee(stream, stream_len=4,
+                                            hashers=[hashlib.md5()],
+                                            block_size=3)
+
+            self.assertEqual(tee.run(), 4)
+            self.assertEqual(tee.hexdigests['md5'],
+                             hashlib.md5(b'0123').hexdigest())
+
+        tee = request_helpers.StreamTee(io.BytesIO(data), io.BytesIO())
+        self.assertEqual(tee.run(), len(data))
+        self.assertEqual(tee.hexdigests, {})
+
+
+class WatchedStream(io.BytesIO):
+
+    def __init__(self, data):
+        io.BytesIO.__init__(self, data)
+        self.was_read = False
+
+    def read(self, size=-1):
+        self.was_read = True
+        return io.BytesIO.read(self, size)
+
+
+class RejectUnauthorized(object):
+
+    def process_request(self, req, resp, params):
+        if req.auth is None:
+            raise falcon.HTTPUnauthorized('Authentication required',
+                                          'Please provide a token.')
+
+
+class FormResource(object):
+
+    def on_post(self, req, resp):
+        self.called = True
+        self.params = req.params.copy()
+
+
+class TestEarlyRejection(testing.TestBase):
+
+    def before(self):
+        self.api = falcon.API(middleware=RejectUnauthorized())
+        self.resource = FormResource()
+        self.resource.called = False
+        self.api.add_route(self.test_route, self.resource)
+
+    def _simulate_post(self, body, headers):
+        env = testing.create_environ(self.test_route, method='POST',
+                                     headers=headers)
+
+        stream = WatchedStream(body)
+        env['wsgi.input'] = stream
+        env['CONTENT_LENGTH'] = str(len(body))
+
+        self.api(env, self.srmock)
+        return stream
+
+    def test_rejected_before_reading_form(self):
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Expect': '100-continue',
+        }
+
+        stream = self._simulate_post(b'color=red', headers)
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_401)
+        self.assertFalse(stream.was_read)
+        self.assertFalse(self.resource.called)
+
+    def test_form_read_when_accepted(self):
+        headers = {
+            'Authorization': 'Token abc',
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Expect': '100-Continue',
+        }
+
+        stream = self._simulate_post(b'color=red', headers)
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertTrue(stream.was_read)
+        self.assertEqual(self.resource.params, {'color': 'red'})
+
+    def test_form_read_without_expect(self):
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+        stream = self._simulate_post(b'color=red', headers)
+
+        # NOTE(kgriffs): Without the expectation, the form is parsed
+        # eagerly, as usual.
+        self.assertEqual(self.srmock.status, falcon.HTTP_401)
+        self.assertTrue(stream.was_read)
+
+    def test_max_content_length(self):
+        self.api.req_options.max_content_length = 8
+        headers = {
+            'Authorization': 'Token abc',
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }
+
+        stream = self._simulate_post(b'color=red', headers)
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_413)
+        self.assertFalse(stream.was_read)
+        self.assertFalse(self.resource.called)
+
+        stream = self._simulate_post(b'color=ab', headers)
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertTrue(stream.was_read)
+        self.assertEqual(self.resource.params, {'color': 'ab'})
+
+    def test_max_content_length_default_responders(self):
+        self.api.req_options.max_content_length = 8
+
+        # NOTE(kgriffs): The body is irrelevant to these responses.
+        for path, method, expected in (('/nowhere', 'POST', falcon.HTTP_404),
+                                       (self.test_route, 'PATCH',
+                                        falcon.HTTP_405)):
+            env = testing.create_environ(
+                path, method=method, body='color=red' * 10,
+                headers={'Authorization': 'Token abc'})
+
+            self.api(env, self.srmock)
+            self.assertEqual(self.srmock.status, expected)
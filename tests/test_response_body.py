@@ -1,5 +1,11 @@
 
+import array
+
+import six
+import testtools
+
 import falcon
+from falcon.response_helpers import data_length, join_data
 import falcon.testing as testing
 
 
@@ -15,3 +21,81 @@ class TestResponseBody(testing.TestBase):
             resp.body += " "
 
         self.assertEqual(resp.body, text)
+
+    def test_join_data(self):
+        self.assertEqual(join_data(b'abc'), b'abc')
+        self.assertEqual(join_data(memoryview(b'abc')), b'abc')
+        self.assertEqual(join_data([b'ab', memoryview(b'cd'), b'e']),
+                         b'abcde')
+        self.assertEqual(join_data(()), b'')
+
+    def test_data_length(self):
+        self.assertEqual(data_length(b'abc'), 3)
+        self.assertEqual(data_length(bytearray(b'abc')), 3)
+        self.assertEqual(data_length([b'ab', memoryview(b'cd'), b'e']), 5)
+        self.assertEqual(data_length(()), 0)
+
+    @testtools.skipIf(six.PY2, 'array.array does not support memoryview')
+    def test_data_length_multibyte_items(self):
+        ints = array.array('i', [1, 2, 3])
+        view = memoryview(ints)
+
+        self.assertEqual(data_length(view), 3 * ints.itemsize)
+        self.assertEqual(data_length([b'ab', view]), 2 + 3 * ints.itemsize)
+
+        class DataResource(object):
+            def on_get(self, req, resp):
+                resp.data = [b'ab', view]
+
+        self.api.add_route(self.test_route, DataResource())
+        body = self.simulate_request(self.test_route)
+
+        self.assertEqual(self.srmock.headers_dict['content-length'],
+                         str(len(b''.join(body))))
+        self.assertEqual(b''.join(body), b'ab' + ints.tobytes())
+
+    def test_coalesce_stream_size(self):
+        chunks = [b'12345'] * 10
+        blocks = list(falcon.coalesce_stream(iter(chunks), max_size=12))
+
+        self.assertEqual(blocks, [b'123451234512345'] * 3 + [b'12345'])
+
+    def test_coalesce_stream_count(self):
+        chunks = [b'a', b'', b'b', b'c', b'd', b'e']
+        blocks = list(falcon.coalesce_stream(chunks, max_count=2))
+
+        self.assertEqual(blocks, [b'ab', b'cd', b'e'])
+
+    def test_coalesce_stream_latency(self):
+        chunks = [b'a', b'b', b'c']
+        blocks = list(falcon.coalesce_stream(chunks, max_latency=0))
+
+        self.assertEqual(blocks, chunks)
+
+    def test_coalesce_stream_close(self):
+        closed = []
+
+        def rows():
+            try:
+                for i in range(100):
+                    yield b'row\n'
+            finally:
+                closed.append(True)
+
+        blocks = falcon.coalesce_stream(rows(), max_count=10)
+        self.assertEqual(next(blocks), b'row\n' * 10)
+
+        blocks.close()
+        self.assertEqual(closed, [True])
+
+    def test_coalesce_stream_response(self):
+        class RowsResource(object):
+            def on_get(self, req, resp):
+                rows = (b'row\n' for i in range(1000))
+                resp.stream = falcon.coalesce_stream(rows, max_size=1024)
+
+        self.api.add_route(self.test_route, RowsResource())
+        body = list(self.simulate_request(self.test_route))
+
+        self.assertEqual(len(body), 4)
+        self.assertEqual(b''.join(body), b'row\n' * 1000)
@@ -0,0 +1,242 @@
+import falcon
+from falcon.middleware import CompressionMiddleware, ResponseCacheMiddleware
+import falcon.testing as testing
+
+
+class CountingResource(object):
+
+    def __init__(self, cache_control=('max-age=60',), status=falcon.HTTP_200):
+        self.cache_control = cache_control
+        self.status = status
+        self.calls = 0
+
+    def on_get(self, req, resp, **kwargs):
+        self.calls += 1
+
+        resp.status = self.status
+        resp.body = u'{"calls": ' + str(self.calls) + u'}' + u' ' * 2048
+        resp.set_header('X-Things', 'thing-1')
+
+        if self.cache_control is not None:
+            resp.cache_control = self.cache_control
+
+    def on_post(self, req, resp):
+        self.calls += 1
+        resp.cache_control = self.cache_control
+
+
+class CookieResource(CountingResource):
+
+    def on_get(self, req, resp):
+        CountingResource.on_get(self, req, resp)
+        resp.set_cookie('session', 'abc')
+
+
+class VaryResource(CountingResource):
+
+    def on_get(self, req, resp):
+        CountingResource.on_get(self, req, resp)
+        resp.vary = ['X-Version']
+        resp.body = req.get_header('X-Version') or 'none'
+
+
+class FaultyResource(CountingResource):
+
+    def __init__(self, error):
+        CountingResource.__init__(self)
+        self.error = error
+
+    def on_get(self, req, resp):
+        CountingResource.on_get(self, req, resp)
+        raise self.error
+
+
+class AuthResource(CountingResource):
+
+    def on_get(self, req, resp):
+        CountingResource.on_get(self, req, resp)
+        resp.body = 'secret-for-' + (req.auth or 'nobody')
+
+
+class TestResponseCacheMiddleware(testing.TestBase):
+
+    def before(self):
+        self.cache = ResponseCacheMiddleware()
+        self.api = falcon.API(middleware=[self.cache])
+
+    def _add(self, resource, route=None):
+        self.api.add_route(route or self.test_route, resource)
+        return resource
+
+    def test_hit(self):
+        resource = self._add(CountingResource())
+
+        first = self.simulate_request(self.test_route, decode='utf-8')
+        self.assertNotIn('age', self.srmock.headers_dict)
+
+        second = self.simulate_request(self.test_route, decode='utf-8')
+
+        self.assertEqual(resource.calls, 1)
+        self.assertEqual(first, second)
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['age'], '0')
+        self.assertEqual(headers['x-things'], 'thing-1')
+        self.assertEqual(headers['cache-control'], 'max-age=60')
+        self.assertEqual(headers['content-length'], str(len(first)))
+        self.assertEqual(headers['content-type'], falcon.DEFAULT_MEDIA_TYPE)
+
+    def test_query_string_and_method(self):
+        resource = self._add(CountingResource())
+
+        self.simulate_request(self.test_route, query_string='a=1')
+        self.simulate_request(self.test_route, query_string='a=2')
+        self.simulate_request(self.test_route, query_string='a=1')
+        self.assertEqual(resource.calls, 2)
+
+        self.simulate_request(self.test_route, method='POST')
+        self.simulate_request(self.test_route, method='POST')
+        self.assertEqual(resource.calls, 4)
+
+    def test_not_cacheable(self):
+        for cache_control in (None, ['no-store'], ['private, max-age=60'],
+                              ['max-age=0'], ['max-age=bogus']):
+
+            resource = self._add(CountingResource(cache_control))
+            self.simulate_request(self.test_route)
+            self.simulate_request(self.test_route)
+            self.assertEqual(resource.calls, 2)
+
+    def test_status_not_cacheable(self):
+        resource = self._add(CountingResource(status=falcon.HTTP_500))
+        self.simulate_request(self.test_route)
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 2)
+
+    def test_error_not_cached(self):
+        resource = self._add(FaultyResource(
+            falcon.HTTPBadRequest('Invalid thing', 'Try again.')))
+
+        for i in range(2):
+            self.simulate_request(self.test_route)
+            self.assertEqual(self.srmock.status, falcon.HTTP_400)
+
+        self.assertEqual(resource.calls, 2)
+
+    def test_unhandled_error_not_cached(self):
+        resource = self._add(FaultyResource(ValueError()))
+
+        for i in range(2):
+            self.assertRaises(ValueError, self.simulate_request,
+                              self.test_route)
+
+        self.assertEqual(resource.calls, 2)
+
+    def test_authorized_not_cached(self):
+        for cache_control in (None, ['max-age=60']):
+            self.api = falcon.API(
+                middleware=[ResponseCacheMiddleware(default_ttl=60)])
+
+            resource = self._add(AuthResource(cache_control))
+
+            self.simulate_request(self.test_route,
+                                  headers={'Authorization': 'alice'})
+
+            body = self.simulate_request(self.test_route, decode='utf-8')
+            self.assertEqual(body, 'secret-for-nobody')
+            self.assertEqual(resource.calls, 2)
+
+    def test_authorized_explicitly_cacheable(self):
+        for cache_control in (['public, max-age=60'], ['s-maxage=60']):
+            resource = self._add(AuthResource(cache_control))
+
+            for i in range(2):
+                body = self.simulate_request(
+                    self.test_route, decode='utf-8',
+                    headers={'Authorization': 'alice'})
+
+                self.assertEqual(body, 'secret-for-alice')
+
+            self.assertEqual(resource.calls, 1)
+            self.cache.clear()
+
+    def test_cookies_not_cached(self):
+        resource = self._add(CookieResource())
+        self.simulate_request(self.test_route)
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 2)
+
+    def test_default_ttl(self):
+        self.api = falcon.API(
+            middleware=[ResponseCacheMiddleware(default_ttl=60)])
+
+        resource = self._add(CountingResource(cache_control=None))
+        self.simulate_request(self.test_route)
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 1)
+
+    def test_s_maxage(self):
+        resource = self._add(CountingResource(['max-age=0, s-maxage=60']))
+        self.simulate_request(self.test_route)
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 1)
+
+    def test_expired(self):
+        resource = self._add(CountingResource(['max-age=1']))
+        self.simulate_request(self.test_route)
+
+        for entry in self.cache._cache._items.values():
+            entry = entry[0]
+            if hasattr(entry, 'expires'):
+                entry.expires -= 1
+
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 2)
+
+    def test_vary(self):
+        resource = self._add(VaryResource())
+
+        for version in ('1', '2', '1', '2', None):
+            headers = {'X-Version': version} if version else {}
+            body = self.simulate_request(self.test_route, headers=headers,
+                                         decode='utf-8')
+            self.assertEqual(body, version or 'none')
+
+        self.assertEqual(resource.calls, 3)
+
+    def test_memory_budget(self):
+        self.api = falcon.API(
+            middleware=[ResponseCacheMiddleware(max_bytes=6 * 1024)])
+        resource = self._add(CountingResource(),
+                             self.test_route + '/{name}')
+
+        for path in ('/a', '/b', '/a', '/c', '/b'):
+            self.simulate_request(self.test_route + path)
+
+        # NOTE(kgriffs): Only two responses fit; '/b' was evicted
+        # when '/c' was added, since '/a' had been used more recently.
+        self.assertEqual(resource.calls, 4)
+
+    def test_clear(self):
+        resource = self._add(CountingResource())
+        self.simulate_request(self.test_route)
+        self.cache.clear()
+        self.simulate_request(self.test_route)
+        self.assertEqual(resource.calls, 2)
+
+    def test_with_compression(self):
+        self.api = falcon.API(middleware=[ResponseCacheMiddleware(),
+                                          CompressionMiddleware()])
+        resource = self._add(CountingResource())
+
+        for accept_encoding in ('gzip', None, 'gzip', None):
+            headers = {}
+            if accept_encoding:
+                headers['Accept-Encoding'] = accept_encoding
+
+            self.simulate_request(self.test_route, headers=headers)
+            self.assertEqual(
+                self.srmock.headers_dict.get('content-encoding'),
+                accept_encoding)
+
+        self.assertEqual(resource.calls, 2)
@@ -0,0 +1,262 @@
+import ddt
+
+import falcon
+import falcon.testing as testing
+
+
+class CustomError(falcon.HTTPError):
+    pass
+
+
+def make_error(href=None):
+    return falcon.HTTPUnauthorized('Authentication Required',
+                                   'Missing or invalid token header.',
+                                   scheme='Token; UUID', href=href)
+
+
+def respond_with_error(resp, how):
+    """Raise the error, or set it on the response, as requested."""
+
+    error = make_error(href='http://example.com/api/auth')
+
+    if how == 'raise':
+        raise error
+
+    resp.set_error(error)
+
+
+class RecordingMiddleware(object):
+
+    def __init__(self, name, calls, fail_in=None):
+        self.name = name
+        self.calls = calls
+        self.fail_in = fail_in
+
+    def process_request(self, req, resp, params):
+        self.calls.append(self.name + '.process_request')
+
+        if self.fail_in == 'process_request':
+            respond_with_error(resp, req.get_header('X-How'))
+
+    def process_response(self, req, resp):
+        self.calls.append(self.name + '.process_response')
+
+        if self.fail_in == 'process_response':
+            respond_with_error(resp, req.get_header('X-How'))
+
+
+class RecordingResource(object):
+
+    def __init__(self, calls, fail_in=None):
+        self.calls = calls
+        self.fail_in = fail_in
+
+    def on_get(self, req, resp):
+        self.calls.append('on_get')
+
+        if self.fail_in == 'responder':
+            respond_with_error(resp, req.get_header('X-How'))
+            self.calls.append('after set_error')
+
+        resp.body = 'OK'
+
+
+@ddt.ddt
+class TestSetError(testing.TestBase):
+
+    def before(self):
+        self.calls = []
+
+    def _simulate(self, how):
+        del self.calls[:]
+
+        body = self.simulate_request(self.test_route, decode='utf-8',
+                                     headers={'X-How': how})
+
+        return self.srmock.status, sorted(self.srmock.headers), body
+
+    def _assert_same_as_raising(self, expected_calls):
+        raised = self._simulate('raise')
+        raised_calls = list(self.calls)
+
+        set_error = self._simulate('set_error')
+
+        self.assertEqual(set_error, raised)
+        self.assertEqual(self.calls, raised_calls)
+        self.assertEqual(self.calls, expected_calls)
+
+        status, headers, body = set_error
+        self.assertEqual(status, falcon.HTTP_401)
+        self.assertIn(('www-authenticate', 'Token; UUID'), headers)
+        self.assertIn('Missing or invalid token header.', body)
+
+    @ddt.data('process_request', 'process_response')
+    def test_middleware(self, fail_in):
+        self.api = falcon.API(middleware=[
+            RecordingMiddleware('first', self.calls),
+            RecordingMiddleware('second', self.calls, fail_in),
+            RecordingMiddleware('third', self.calls),
+        ])
+
+        self.api.add_route(self.test_route, RecordingResource(self.calls))
+
+        if fail_in == 'process_request':
+            expected_calls = [
+                'first.process_request',
+                'second.process_request',
+                'first.process_response',
+            ]
+        else:
+            expected_calls = [
+                'first.process_request',
+                'second.process_request',
+                'third.process_request',
+                'on_get',
+                'third.process_response',
+                'second.process_response',
+                'first.process_response',
+            ]
+
+        self._assert_same_as_raising(expected_calls)
+
+    @ddt.data(True, False)
+    def test_responder(self, with_middleware):
+        middleware = []
+        if with_middleware:
+            middleware.append(RecordingMiddleware('first', self.calls))
+
+        self.api = falcon.API(middleware=middleware)
+
+        resource = RecordingResource(self.calls, 'responder')
+        self.api.add_route(self.test_route, resource)
+
+        if with_middleware:
+            expected_calls = [
+                'first.process_request',
+                'on_get',
+                'after set_error',
+                'first.process_response',
+            ]
+        else:
+            expected_calls = ['on_get', 'after set_error']
+
+        # NOTE(kgriffs): The responder keeps going after setting the
+        # error, so the calls will differ from when the error is raised.
+        raised = self._simulate('raise')
+        set_error = self._simulate('set_error')
+
+        self.assertEqual(set_error, raised)
+        self.assertEqual(self.calls, expected_calls)
+
+    def test_global_hooks(self):
+        def before_one(req, resp, resource, params):
+            self.calls.append('before_one')
+            respond_with_error(resp, req.get_header('X-How'))
+
+        def before_two(req, resp, resource, params):
+            self.calls.append('before_two')
+
+        def after(req, resp, resource):
+            self.calls.append('after')
+
+        self.api = falcon.API(before=[before_one, before_two], after=after)
+        self.api.add_route(self.test_route, RecordingResource(self.calls))
+
+        # NOTE(kgriffs): The global "after" hooks still run when an
+        # error is handled.
+        self._assert_same_as_raising(['before_one', 'after'])
+
+    def test_global_after_hook(self):
+        def after_one(req, resp, resource):
+            self.calls.append('after_one')
+
+            if len(self.calls) == 2:
+                respond_with_error(resp, req.get_header('X-How'))
+
+        def after_two(req, resp, resource):
+            self.calls.append('after_two')
+
+        self.api = falcon.API(after=[after_one, after_two])
+        self.api.add_route(self.test_route, RecordingResource(self.calls))
+
+        self._assert_same_as_raising([
+            'on_get',
+            'after_one',
+            'after_one',
+            'after_two',
+        ])
+
+    def test_decorator_hooks(self):
+        calls = self.calls
+
+        def check_auth(req, resp, resource, params):
+            calls.append('check_auth')
+            respond_with_error(resp, req.get_header('X-How'))
+
+        def serialize(req, resp, resource):
+            calls.append('serialize')
+
+        class HookedResource(object):
+
+            @falcon.after(serialize)
+            @falcon.before(check_auth)
+            def on_get(self, req, resp):
+                calls.append('on_get')
+
+        self.api.add_route(self.test_route, HookedResource())
+        self._assert_same_as_raising(['check_auth'])
+
+    def test_error_handler(self):
+        def handler(ex, req, resp, params):
+            self.calls.append('handler')
+            resp.status = falcon.HTTP_792
+
+        self.api = falcon.API(middleware=[
+            RecordingMiddleware('first', self.calls, 'process_request'),
+        ])
+
+        self.api.add_error_handler(falcon.HTTPUnauthorized, handler)
+        self.api.add_route(self.test_route, RecordingResource(self.calls))
+
+        raised = self._simulate('raise')
+        set_error = self._simulate('set_error')
+
+        self.assertEqual(set_error, raised)
+        self.assertEqual(self.srmock.status, falcon.HTTP_792)
+        self.assertEqual(self.calls, ['first.process_request', 'handler'])
+
+    def test_frozen_error(self):
+        error = CustomError('429 Too Many Requests', 'Rate limited').freeze()
+
+        class RateLimitMiddleware(object):
+            def process_request(self, req, resp, params):
+                resp.set_error(error)
+
+        self.api = falcon.API(middleware=RateLimitMiddleware())
+        self.api.add_route(self.test_route, RecordingResource(self.calls))
+
+        for i in range(2):
+            self.simulate_request(self.test_route)
+            self.assertEqual(self.srmock.status, '429 Too Many Requests')
+            self.assertEqual(self.calls, [])
+
+    def test_unhandled_error_propagates(self):
+        class FaultyResource(object):
+            def on_get(self, req, resp):
+                resp.body = 'partial'
+                resp.set_error(ValueError('Not an HTTPError'))
+
+        self.api = falcon.API()
+        self.api.add_route(self.test_route, FaultyResource())
+
+        self.assertRaises(ValueError, self.simulate_request, self.test_route)
+
+        # NOTE(kgriffs): Just as if it had been raised, the error can
+        # still be handled by a registered error handler.
+        def handler(ex, req, resp, params):
+            resp.status = falcon.HTTP_400
+
+        self.api.add_error_handler(ValueError, handler)
+
+        self.simulate_request(self.test_route)
+        self.assertEqual(self.srmock.status, falcon.HTTP_400)
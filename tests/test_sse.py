@@ -0,0 +1,132 @@
+from six.moves import queue
+
+import falcon
+from falcon import sse
+import falcon.testing as testing
+
+
+class EventsResource(object):
+
+    def __init__(self):
+        self.last_event_id = None
+
+    def on_get(self, req, resp):
+        def replay(last_event_id):
+            self.last_event_id = last_event_id
+            start = int(last_event_id) + 1 if last_event_id else 0
+
+            for i in range(start, 3):
+                yield sse.Event(data='step ' + str(i), event_id=str(i))
+
+        sse.set_event_stream(req, resp, replay, retry=5000)
+
+
+class TestServerSentEvents(testing.TestBase):
+
+    def before(self):
+        self.resource = EventsResource()
+        self.api.add_route(self.test_route, self.resource)
+
+    def test_event_serialize(self):
+        event = sse.Event(data=u'line 1\nline 2\r\n\u00e7', event='update',
+                          event_id='42', retry=1000, comment='hi')
+
+        expected = (u': hi\n'
+                    u'event: update\n'
+                    u'id: 42\n'
+                    u'retry: 1000\n'
+                    u'data: line 1\n'
+                    u'data: line 2\n'
+                    u'data: \u00e7\n\n').encode('utf-8')
+
+        self.assertEqual(event.serialize(), expected)
+
+        # NOTE(kgriffs): The result is cached
+        self.assertIs(event.serialize(), event.serialize())
+
+        self.assertEqual(sse.Event(data='').serialize(), b'data: \n\n')
+        self.assertEqual(sse.Event(data=b'x').serialize(), b'data: x\n\n')
+
+    def test_invalid_event(self):
+        self.assertRaises(ValueError, sse.Event, event='a\nb')
+        self.assertRaises(ValueError, sse.Event, event_id='1\r')
+
+    def test_response(self):
+        body = list(self.simulate_request(self.test_route))
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['content-type'], 'text/event-stream')
+        self.assertEqual(headers['cache-control'], 'no-cache, no-transform')
+        self.assertEqual(headers['x-accel-buffering'], 'no')
+        self.assertNotIn('content-length', headers)
+        self.assertIs(self.resource.last_event_id, None)
+
+        # NOTE(kgriffs): Each event is sent as its own block
+        self.assertEqual(body, [
+            b'retry: 5000\n\n',
+            b'id: 0\ndata: step 0\n\n',
+            b'id: 1\ndata: step 1\n\n',
+            b'id: 2\ndata: step 2\n\n',
+        ])
+
+    def test_last_event_id(self):
+        body = list(self.simulate_request(self.test_route,
+                                          headers={'Last-Event-ID': '1'}))
+
+        self.assertEqual(self.resource.last_event_id, '1')
+        self.assertEqual(body[1:], [b'id: 2\ndata: step 2\n\n'])
+
+    def test_queue(self):
+        events = queue.Queue()
+        events.put(sse.Event(data='a'))
+        events.put('b')
+        events.put(None)
+
+        body = list(sse.EventStream(events, heartbeat=0.01))
+        self.assertEqual(body, [b'data: a\n\n', b'data: b\n\n'])
+
+    def test_queue_heartbeat(self):
+        events = queue.Queue()
+        stream = iter(sse.EventStream(events, heartbeat=0.001))
+
+        self.assertEqual(next(stream), b':\n\n')
+
+        events.put('done')
+        events.put(None)
+        self.assertEqual([chunk for chunk in stream if chunk != b':\n\n'],
+                         [b'data: done\n\n'])
+
+    def test_iterable_heartbeat(self):
+        closed = []
+
+        def source():
+            try:
+                yield None
+                yield 'a'
+                yield None
+            finally:
+                closed.append(True)
+
+        stream = sse.EventStream(source(), heartbeat=0)
+        self.assertEqual(list(stream), [b':\n\n', b'data: a\n\n', b':\n\n'])
+
+        stream = sse.EventStream(source(), heartbeat=None)
+        self.assertEqual(list(stream), [b'data: a\n\n'])
+
+        source_iter = source()
+        stream = sse.EventStream(source_iter, heartbeat=3600)
+        chunks = iter(stream)
+        self.assertEqual(next(chunks), b'data: a\n\n')
+
+        stream.close()
+        self.assertEqual(len(closed), 3)
+
+    def test_not_compressed(self):
+        from falcon.middleware import CompressionMiddleware
+
+        self.api = falcon.API(middleware=[CompressionMiddleware(min_size=0)])
+        self.api.add_route(self.test_route, self.resource)
+
+        self.simulate_request(self.test_route,
+                              headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('content-encoding', self.srmock.headers_dict)
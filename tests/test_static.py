@@ -0,0 +1,261 @@
+import gzip
+import io
+import os
+import shutil
+import tempfile
+
+import ddt
+
+import falcon
+import falcon.testing as testing
+from falcon.util import LRUCache
+
+
+SAMPLE_CSS = b'body { color: #333; }\n' * 100
+
+
+class TestLRUCache(testing.TestBase):
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # NOTE(kgriffs): Touch 'a' so that 'b' is evicted instead
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('b', 'missing'), 'missing')
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_sizeof(self):
+        cache = LRUCache(10, sizeof=len)
+        cache.set('a', b'12345')
+        cache.set('b', b'1234')
+        self.assertEqual(cache.size, 9)
+
+        cache.set('c', b'12')
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.size, 6)
+
+        # NOTE(kgriffs): Too big to cache at all
+        cache.set('d', b'x' * 11)
+        self.assertNotIn('d', cache)
+        self.assertEqual(cache.size, 6)
+
+        self.assertEqual(cache.pop('b'), b'1234')
+        self.assertEqual(cache.size, 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+@ddt.ddt
+class TestStaticResource(testing.TestBase):
+
+    def before(self):
+        self.directory = tempfile.mkdtemp()
+
+        os.mkdir(os.path.join(self.directory, 'css'))
+        self.css_path = os.path.join(self.directory, 'css', 'site.css')
+        with open(self.css_path, 'wb') as f:
+            f.write(SAMPLE_CSS)
+
+        self.api.add_static_route('/static/', self.directory,
+                                  cache_control=['max-age=3600'])
+
+    def after(self):
+        shutil.rmtree(self.directory)
+
+    def _get(self, path='/static/css/site.css', **kwargs):
+        body = self.simulate_request(path, **kwargs)
+        return b''.join(body)
+
+    def test_get(self):
+        body = self._get()
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertEqual(body, SAMPLE_CSS)
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['content-type'], 'text/css')
+        self.assertEqual(headers['content-length'], str(len(SAMPLE_CSS)))
+        self.assertEqual(headers['accept-ranges'], 'bytes')
+        self.assertEqual(headers['cache-control'], 'max-age=3600')
+        self.assertIn('etag', headers)
+        self.assertIn('last-modified', headers)
+        self.assertNotIn('vary', headers)
+
+    def test_file_wrapper(self):
+        wrapped = []
+
+        def file_wrapper(stream, block_size):
+            wrapped.append(stream)
+            return iter(lambda: stream.read(block_size), b'')
+
+        env = testing.create_environ('/static/css/site.css')
+        env['wsgi.file_wrapper'] = file_wrapper
+        body = b''.join(self.api(env, self.srmock))
+
+        self.assertEqual(body, SAMPLE_CSS)
+        self.assertEqual(wrapped[0].name, self.css_path)
+
+    def test_head(self):
+        body = self._get(method='HEAD')
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertEqual(body, b'')
+        self.assertEqual(self.srmock.headers_dict['content-length'],
+                         str(len(SAMPLE_CSS)))
+
+    def test_method_not_allowed(self):
+        self._get(method='POST')
+        self.assertEqual(self.srmock.status, falcon.HTTP_405)
+        self.assertEqual(self.srmock.headers_dict['allow'], 'GET, HEAD')
+
+    @ddt.data(
+        '/static/css/missing.css',
+        '/static/css',
+        '/static/',
+        '/static/../setup.py',
+        '/static/css/../../setup.py',
+        '/static/css\\site.css',
+    )
+    def test_not_found(self, path):
+        self._get(path)
+        self.assertEqual(self.srmock.status, falcon.HTTP_404)
+
+    def test_prefix_boundary(self):
+        self._get('/staticcss/site.css')
+        self.assertEqual(self.srmock.status, falcon.HTTP_404)
+
+    def test_conditional(self):
+        self._get()
+        headers = self.srmock.headers_dict
+
+        body = self._get(headers={'If-None-Match': headers['etag']})
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+        self.assertEqual(body, b'')
+
+        self._get(headers={'If-Modified-Since': headers['last-modified']})
+        self.assertEqual(self.srmock.status, falcon.HTTP_304)
+
+    @ddt.data(
+        ('bytes=0-9', 0, 9),
+        ('bytes=10-', 10, len(SAMPLE_CSS) - 1),
+        ('bytes=-5', len(SAMPLE_CSS) - 5, len(SAMPLE_CSS) - 1),
+        ('bytes=2000-99999', 2000, len(SAMPLE_CSS) - 1),
+    )
+    @ddt.unpack
+    def test_range(self, range_header, first, last):
+        body = self._get(headers={'Range': range_header})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_206)
+        self.assertEqual(body, SAMPLE_CSS[first:last + 1])
+
+        headers = self.srmock.headers_dict
+        self.assertEqual(headers['content-length'], str(last - first + 1))
+        self.assertEqual(headers['content-range'], 'bytes {0}-{1}/{2}'.format(
+            first, last, len(SAMPLE_CSS)))
+
+    def test_range_not_satisfiable(self):
+        self._get(headers={'Range': 'bytes=99999-'})
+
+        self.assertEqual(self.srmock.status, falcon.HTTP_416)
+        self.assertEqual(self.srmock.headers_dict['content-range'],
+                         'bytes */' + str(len(SAMPLE_CSS)))
+
+    def test_if_range(self):
+        self._get()
+        etag = self.srmock.headers_dict['etag']
+
+        body = self._get(headers={'Range': 'bytes=0-9', 'If-Range': etag})
+        self.assertEqual(self.srmock.status, falcon.HTTP_206)
+        self.assertEqual(len(body), 10)
+
+        body = self._get(headers={'Range': 'bytes=0-9', 'If-Range': '"x"'})
+        self.assertEqual(self.srmock.status, falcon.HTTP_200)
+        self.assertEqual(body, SAMPLE_CSS)
+
+    def test_precompressed(self):
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as f:
+            f.write(SAMPLE_CSS)
+
+        with open(self.css_path + '.gz', 'wb') as f:
+            f.write(buf.getvalue())
+
+        # NOTE(kgriffs): Use a fresh resource, since the metadata for
+        # the file is cached.
+        self.api = falcon.API()
+        self.api.add_static_route('/static', self.directory)
+
+        body = self._get(headers={'Accept-Encoding': 'gzip, deflate'})
+        headers = self.srmock.headers_dict
+
+        self.assertEqual(body, buf.getvalue())
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertEqual(headers['content-type'], 'text/css')
+        self.assertEqual(headers['vary'], 'Accept-Encoding')
+        gz_etag = headers['etag']
+
+        body = self._get()
+        headers = self.srmock.headers_dict
+
+        self.assertEqual(body, SAMPLE_CSS)
+        self.assertNotIn('content-encoding', headers)
+        self.assertEqual(headers['vary'], 'Accept-Encoding')
+        self.assertNotEqual(headers['etag'], gz_etag)
+
+        # NOTE(kgriffs): Ranges always apply to the identity encoding
+        body = self._get(headers={'Accept-Encoding': 'gzip',
+                                  'Range': 'bytes=0-9'})
+        self.assertEqual(body, SAMPLE_CSS[:10])
+        self.assertNotIn('content-encoding', self.srmock.headers_dict)
+
+    def test_metadata_cached(self):
+        resource = falcon.StaticResource('/files', self.directory,
+                                         cache_ttl=3600)
+        self.api.add_sink(resource, '/files/')
+
+        self._get('/files/css/site.css')
+        etag = self.srmock.headers_dict['etag']
+
+        with open(self.css_path, 'ab') as f:
+            f.write(b'p { margin: 0; }\n')
+
+        self._get('/files/css/site.css', method='HEAD')
+        self.assertEqual(self.srmock.headers_dict['etag'], etag)
+
+    def test_rewritten_within_ttl(self):
+        resource = falcon.StaticResource('/files', self.directory,
+                                         cache_ttl=3600)
+        self.api.add_sink(resource, '/files/')
+
+        self._get('/files/css/site.css')
+        etag = self.srmock.headers_dict['etag']
+
+        content = SAMPLE_CSS + b'p { margin: 0; }\n'
+        with open(self.css_path, 'wb') as f:
+            f.write(content)
+
+        # NOTE(kgriffs): The headers must match the file that is served,
+        # even though its metadata is still cached.
+        body = self._get('/files/css/site.css')
+        headers = self.srmock.headers_dict
+
+        self.assertEqual(body, content)
+        self.assertEqual(headers['content-length'], str(len(content)))
+        self.assertNotEqual(headers['etag'], etag)
+
+        new_etag = headers['etag']
+
+        self._get('/files/css/site.css', method='HEAD')
+        self.assertEqual(self.srmock.headers_dict['etag'], new_etag)
+
+    def test_invalid_directory(self):
+        self.assertRaises(ValueError, falcon.StaticResource, '/static',
+                          os.path.join(self.directory, 'missing'))
@@ -61,6 +61,26 @@ class TestFalconUtils(testtools.TestCase):
             falcon.dt_to_http(datetime(2013, 4, 4, 10, 28, 54)),
             'Thu, 04 Apr 2013 10:28:54 GMT')
 
+        self.assertEqual(
+            falcon.dt_to_http(datetime(1994, 11, 6, 8, 49, 37, 999999)),
+            'Sun, 06 Nov 1994 08:49:37 GMT')
+
+        for month in range(1, 13):
+            dt = datetime(2014, month, 28, 23, 59, 1)
+            self.assertEqual(falcon.dt_to_http(dt),
+                             dt.strftime('%a, %d %b %Y %H:%M:%S GMT'))
+
+    def test_http_now(self):
+        now = falcon.http_now()
+        self.assertIs(falcon.http_now(), now)
+        self.assertEqual(falcon.http_date_to_dt(now).year,
+                         datetime.utcnow().year)
+
+        # NOTE(kgriffs): Simulate the next second
+        timestamp, formatted = util.misc._http_now_cache
+        util.misc._http_now_cache = (timestamp - 1, 'stale')
+        self.assertNotEqual(falcon.http_now(), 'stale')
+
     def test_http_date_to_dt(self):
         self.assertEqual(
             falcon.http_date_to_dt('Thu, 04 Apr 2013 00:00:00 GMT'),